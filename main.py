@@ -7,31 +7,28 @@ import sys
 from datetime import date, datetime, timedelta
 import logging
 import argparse
+import signal
+import subprocess
+import threading
 import time
 
+from dotenv import load_dotenv
+
 # 프로젝트 경로를 sys.path에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.database.connection import DatabaseConnection
-from src.analyzer.sensor_data_fetcher import SensorDataFetcher
-from src.analyzer.weather_analyzer import WeatherAnalyzer
-from src.generator.llm_generator import MessageGenerator
-from src.generator.llm_generator_local_api import MessageGeneratorLocalAPI
-from src.output.display_handler import DisplayHandler
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('./data/logs/system.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# 파이프라인/생성기 모듈은 실행 모드에 필요한 것만 각 함수에서 import (cron 실행 시작 시간 단축)
+from src.tracing import trace, span
+from src.logging_config import setup_logging
+
+load_dotenv()
+
+# 로깅 설정 (큐 기반: 파일/표준 출력 쓰기는 백그라운드 스레드에서 처리)
+setup_logging(log_file=os.getenv('LOG_FILE', './data/logs/system.log'))
 logger = logging.getLogger(__name__)
 
 
-def main(target_date=None, device_ids=None, generate_multiple=False, compare_with_yesterday=True):
+def main(target_date=None, device_ids=None, generate_multiple=False, compare_with_yesterday=True, force=False):
     """
     메인 실행 함수
 
@@ -40,13 +37,14 @@ def main(target_date=None, device_ids=None, generate_multiple=False, compare_wit
         device_ids: 디바이스 ID 리스트 (기본값: 전체)
         generate_multiple: 여러 개의 문구 생성 여부
         compare_with_yesterday: 어제와 비교할지 여부 (기본값: True)
+        force: 입력이 이전 실행과 같아도 문구를 다시 생성 (기본값: False)
     """
     # 전체 실행 시간 측정 시작
     start_time = time.time()
 
-    logger.info("=" * 70)
+    from src.pipeline import PipelineContext, run_pipeline
+
     logger.info("IoT 센서 데이터 기반 전광판 문구 생성 시스템 시작")
-    logger.info("=" * 70)
 
     # 날짜 설정
     if target_date is None:
@@ -61,144 +59,262 @@ def main(target_date=None, device_ids=None, generate_multiple=False, compare_wit
 
     try:
         # 1. 데이터베이스 연결
-        logger.info("\n[1단계] 데이터베이스 연결 중...")
-        with DatabaseConnection() as db:
-            # 연결 테스트
-            if db.test_connection():
+        logger.info("[1단계] 데이터베이스 연결 중...")
+        with PipelineContext() as ctx, trace('pipeline'):
+            # 연결 테스트 (생성기 준비는 run_pipeline에서 입력 변화 여부에 따라 결정)
+            with span('db.connect'):
+                connected = ctx.db.test_connection()
+            if connected:
                 logger.info("✓ 데이터베이스 연결 성공")
             else:
                 logger.error("✗ 데이터베이스 연결 실패")
                 return
 
-            # 2. 센서 데이터 조회
-            logger.info("\n[2단계] 센서 데이터 조회 중...")
-            step_start = time.time()
-            fetcher = SensorDataFetcher(db)
-
-            # 사용 가능한 디바이스 확인
-            if device_ids is None:
-                available_devices = fetcher.get_available_devices(target_date)
-                logger.info(f"사용 가능한 디바이스:")
-                logger.info(f"  - 온도 센서: {', '.join(available_devices['temperature'])}")
-                logger.info(f"  - 습도 센서: {', '.join(available_devices['humidity'])}")
-
-            # 오늘 데이터 조회
-            today_sensor_data = fetcher.get_daily_statistics(
+            # 2~5. 조회 → 분석 → 생성 → 출력
+            result = run_pipeline(
+                ctx,
                 target_date=target_date,
-                device_ids=device_ids
+                device_ids=device_ids,
+                generate_multiple=generate_multiple,
+                compare_with_yesterday=compare_with_yesterday,
+                force=force
             )
-
-            # 데이터 확인
-            if not today_sensor_data['temperature']['hourly_data']:
-                logger.warning("⚠️  오늘 온도 데이터가 없습니다.")
+            if result is None:
                 return
 
-            # 어제 데이터 조회 (비교 모드인 경우)
-            yesterday_sensor_data = None
-            if compare_with_yesterday:
-                yesterday_sensor_data = fetcher.get_daily_statistics(
-                    target_date=yesterday_date,
-                    device_ids=device_ids
-                )
-                if not yesterday_sensor_data['temperature']['hourly_data']:
-                    logger.warning("⚠️  어제 온도 데이터가 없습니다. 비교 모드를 해제합니다.")
-                    compare_with_yesterday = False
-
-            step_elapsed = time.time() - step_start
-            logger.info(f"✓ 데이터 조회 완료 (소요 시간: {step_elapsed:.2f}초)")
-
-            # 3. 데이터 분석
-            logger.info("\n[3단계] 데이터 분석 중...")
-            step_start = time.time()
-
-            today_analyzer = WeatherAnalyzer(today_sensor_data)
-            today_analysis = today_analyzer.analyze()
-
-            logger.info(f"오늘 분석 결과:")
-            logger.info(f"  - 최저 온도: {today_analysis['min_temp']}°C")
-            logger.info(f"  - 최고 온도: {today_analysis['max_temp']}°C")
-            logger.info(f"  - 평균 온도: {today_analysis['avg_temp']}°C")
-            logger.info(f"  - 일교차: {today_analysis['temp_diff']}°C ({today_analysis['temp_diff_category']})")
-            logger.info(f"  - 평균 습도: {today_analysis['avg_humidity']}% ({today_analysis['humidity_category']})")
-
-            # 어제와 비교 (비교 모드인 경우)
-            comparison_result = None
-            if compare_with_yesterday and yesterday_sensor_data:
-                yesterday_analyzer = WeatherAnalyzer(yesterday_sensor_data)
-                yesterday_analysis = yesterday_analyzer.analyze()
-
-                logger.info(f"\n어제 분석 결과:")
-                logger.info(f"  - 평균 온도: {yesterday_analysis['avg_temp']}°C")
-
-                comparison_result = WeatherAnalyzer.compare_two_days(yesterday_analysis, today_analysis)
-
-            step_elapsed = time.time() - step_start
-            logger.info(f"✓ 데이터 분석 완료 (소요 시간: {step_elapsed:.2f}초)")
-
-            # 4. LLM 문구 생성
-            logger.info("\n[4단계] LLM 문구 생성 중...")
-            step_start = time.time()
-
-            # API 모드 확인 (환경변수로 제어)
-            use_api_mode = os.getenv('USE_MODEL_SERVER', 'true').lower() == 'true'
-
-            if use_api_mode:
-                logger.info("모드: 로컬 모델 서버 API 사용")
-                generator = MessageGeneratorLocalAPI()
-            else:
-                logger.info("모드: 직접 모델 로드")
-                generator = MessageGenerator()
-
-            if comparison_result:
-                # 어제와 오늘 비교 문구 생성
-                message = generator.generate_comparison_message(comparison_result)
-            elif generate_multiple:
-                # 여러 개의 문구 생성
-                messages = generator.generate_multiple_messages(today_analysis, num_messages=3)
-                logger.info(f"\n생성된 문구들:")
-                for i, msg in enumerate(messages, 1):
-                    logger.info(f"  {i}. {msg}")
-
-                # 첫 번째 문구 사용
-                message = messages[0]
-            else:
-                # 단일 문구 생성
-                message = generator.generate_message(today_analysis)
-
-            step_elapsed = time.time() - step_start
-            logger.info(f"✓ 문구 생성 완료 (소요 시간: {step_elapsed:.2f}초)")
-
-            # 5. 출력 및 로깅
-            logger.info("\n[5단계] 출력 및 로깅...")
-            step_start = time.time()
-            display = DisplayHandler()
-            display.send_to_display(message)
-
-            # 비교 결과가 있으면 비교 정보도 함께 로깅
-            if comparison_result:
-                display.log_message(target_date, message, today_analysis)
-                display.export_to_text(message, today_analysis)
-            else:
-                display.log_message(target_date, message, today_analysis)
-                display.export_to_text(message, today_analysis)
-
-            step_elapsed = time.time() - step_start
-            logger.info(f"✓ 출력 및 로깅 완료 (소요 시간: {step_elapsed:.2f}초)")
-
             # 전체 실행 시간 계산
             total_elapsed = time.time() - start_time
-            logger.info("\n" + "=" * 70)
-            logger.info(f"✓ 모든 작업 완료")
-            logger.info(f"총 실행 시간: {total_elapsed:.2f}초")
-            logger.info("=" * 70)
+            logger.info(f"✓ 모든 작업 완료 (총 실행 시간: {total_elapsed:.2f}초)")
 
     except KeyboardInterrupt:
-        logger.info("\n\n사용자에 의해 중단되었습니다.")
+        logger.info("사용자에 의해 중단되었습니다.")
     except Exception as e:
-        logger.error(f"\n오류 발생: {e}", exc_info=True)
+        logger.error(f"오류 발생: {e}", exc_info=True)
         raise
 
 
+def sites_main(sites_file, target_date=None, force=False):
+    """
+    사이트 설정 파일의 모든 사이트를 한 번 실행 (통합 조회 + 동시 생성)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+        target_date: 조회할 날짜 (기본값: 오늘)
+        force: 입력이 이전 실행과 같은 사이트도 문구를 다시 생성
+    """
+    start_time = time.time()
+
+    from src.pipeline import PipelineContext, load_sites, run_sites
+
+    logger.info("전광판 문구 생성 - 전체 사이트 실행")
+
+    target_date = target_date or date.today()
+    sites = load_sites(sites_file)
+    logger.info(f"대상 날짜: {target_date}, 사이트: {len(sites)}개")
+
+    with PipelineContext() as ctx, trace('sites'):
+        results = run_sites(ctx, sites, target_date, force=force)
+
+    total_elapsed = time.time() - start_time
+    logger.info(f"✓ 전체 사이트 실행 완료 (성공 {sum(1 for r in results.values() if r)}/{len(sites)}, 총 실행 시간: {total_elapsed:.2f}초)")
+
+
+def backfill_main(start_date, end_date, device_ids=None, compare_with_yesterday=True, checkpoint_path=None):
+    """
+    기간 백필 실행 함수 (중단 시 체크포인트부터 이어서 실행)
+
+    Args:
+        start_date: 시작 날짜 (포함)
+        end_date: 종료 날짜 (포함)
+        device_ids: 디바이스 ID 리스트 (기본값: 전체)
+        compare_with_yesterday: 전날과 비교할지 여부
+        checkpoint_path: 체크포인트 파일 경로
+    """
+    start_time = time.time()
+
+    from src.pipeline import PipelineContext, run_backfill
+
+    logger.info(f"전광판 문구 백필 시작: {start_date} ~ {end_date}")
+
+    try:
+        with PipelineContext() as ctx, trace('backfill'):
+            results = run_backfill(
+                ctx,
+                start_date,
+                end_date,
+                device_ids=device_ids,
+                compare_with_yesterday=compare_with_yesterday,
+                checkpoint_path=checkpoint_path
+            )
+    except KeyboardInterrupt:
+        logger.info("사용자에 의해 중단되었습니다. 다시 실행하면 체크포인트부터 이어서 진행합니다.")
+        return
+
+    total_elapsed = time.time() - start_time
+    logger.info(f"✓ 백필 완료 ({len(results)}일 생성, 총 실행 시간: {total_elapsed:.2f}초)")
+
+
+def daemon_main(sites_file):
+    """
+    데몬 모드 실행 함수 (사이트별 cron 주기로 반복 실행)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+    """
+    from src.pipeline import PipelineContext, load_sites, run_daemon
+
+    logger.info("전광판 문구 생성 데몬 모드 시작")
+
+    sites = load_sites(sites_file)
+
+    stop_event = threading.Event()
+    # SIGTERM (systemd/docker stop) 수신 시 진행 중인 사이트를 마치고 종료
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    with PipelineContext() as ctx:
+        try:
+            run_daemon(ctx, sites, stop_event)
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 중단되었습니다.")
+
+
+def profile_startup(argv, top=15):
+    """
+    같은 인자로 자신을 -X importtime 모드로 다시 실행하여 모듈별 import 시간 보고
+
+    Args:
+        argv: 실행할 명령줄 인자 (--profile-startup 제외)
+        top: 출력할 최상위 모듈 수
+
+    Returns:
+        int: 실행 종료 코드
+    """
+    start_time = time.time()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', os.path.abspath(__file__)] + argv,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    total_elapsed = time.time() - start_time
+
+    # "import time: self [us] | cumulative | imported package" 형식 (하위 모듈은 2칸씩 들여쓰기)
+    top_level = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            print(line, file=sys.stderr)
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        if len(name) - len(name.lstrip()) == 1:
+            top_level.append((int(parts[1]), name.strip()))
+
+    import_total = sum(cumulative for cumulative, _ in top_level) / 1_000_000
+    print("\n" + "=" * 70)
+    print(f"시작 프로파일: 전체 {total_elapsed:.2f}초 중 import {import_total:.2f}초")
+    print("=" * 70)
+    for cumulative, name in sorted(top_level, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:>9.1f}ms  {name}")
+
+    return completed.returncode
+
+
+def pregenerate_main(sites_file, target_date=None):
+    """
+    다음 날 후보 문구 사전 생성 실행 함수 (한가한 시간에 cron으로 실행)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+        target_date: 문구를 미리 만들 날짜 (기본값: 오늘, 기준일인 전날이 끝난 뒤에만 생성)
+    """
+    start_time = time.time()
+
+    from src.pipeline import PipelineContext, load_sites, run_pregeneration
+
+    logger.info("전광판 문구 사전 생성")
+
+    sites = load_sites(sites_file)
+
+    with PipelineContext() as ctx, trace('pregenerate'):
+        counts = run_pregeneration(ctx, sites, target_date)
+
+    total_elapsed = time.time() - start_time
+    logger.info(f"✓ 사전 생성 완료 ({len(counts)}개 사이트, 후보 {sum(counts.values())}개, 총 실행 시간: {total_elapsed:.2f}초)")
+
+
+def watch_main(sites_file):
+    """
+    감시 모드 실행 함수 (새 센서 통계가 들어온 사이트만 갱신)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+    """
+    from src.pipeline import PipelineContext, load_sites, run_watcher
+
+    logger.info("전광판 문구 생성 감시 모드 시작")
+
+    sites = load_sites(sites_file)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    with PipelineContext() as ctx:
+        try:
+            run_watcher(ctx, sites, stop_event)
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 중단되었습니다.")
+
+
+def produce_main(sites_file, target_date=None, force=False):
+    """
+    생산자 실행 함수 (전체 사이트 조회 + 분석 후 생성 작업을 큐에 추가)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+        target_date: 조회할 날짜 (기본값: 오늘)
+        force: 입력이 이전 실행과 같은 사이트도 작업 추가
+    """
+    start_time = time.time()
+
+    from src.pipeline import PipelineContext, load_sites, run_producer
+
+    logger.info("전광판 문구 생성 - 생성 작업 추가")
+
+    target_date = target_date or date.today()
+    sites = load_sites(sites_file)
+
+    with PipelineContext() as ctx, trace('produce'):
+        count = run_producer(ctx, sites, target_date, force=force)
+
+    total_elapsed = time.time() - start_time
+    logger.info(f"✓ 생성 작업 추가 완료 ({count}/{len(sites)}개 사이트, 총 실행 시간: {total_elapsed:.2f}초)")
+
+
+def consume_main(sites_file):
+    """
+    소비자 실행 함수 (큐의 생성 작업을 문구 생성 + 출력, 여러 프로세스로 동시 실행 가능)
+
+    Args:
+        sites_file: 사이트 설정 YAML 경로
+    """
+    from src.pipeline import PipelineContext, load_sites, run_consumer
+
+    logger.info("전광판 문구 생성 소비자 모드 시작")
+
+    sites = load_sites(sites_file)
+
+    stop_event = threading.Event()
+    # 진행 중인 배치를 마치고 종료 (마치지 못한 작업은 임대 시간이 지나면 다른 소비자가 처리)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    with PipelineContext() as ctx:
+        try:
+            run_consumer(ctx, sites, stop_event=stop_event)
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 중단되었습니다.")
+
+
 if __name__ == "__main__":
     # 명령줄 인자 파싱
     parser = argparse.ArgumentParser(description='IoT 센서 데이터 기반 전광판 문구 생성')
@@ -224,8 +340,91 @@ if __name__ == "__main__":
         help='어제와 비교하지 않음 (기본값: 비교함)'
     )
 
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='데몬 모드: 사이트별 cron 주기로 반복 실행 (DB/HTTP 연결 유지)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='감시 모드: 새 센서 통계가 들어온 사이트만 다시 집계하고 입력이 바뀌면 재생성'
+    )
+    parser.add_argument(
+        '--pregenerate',
+        action='store_true',
+        help='아침 갱신용 후보 문구를 자정 이후에 미리 생성하여 캐시에 저장 (--date 로 대상 날짜 지정, 전날이 끝난 날짜만)'
+    )
+    parser.add_argument(
+        '--produce',
+        action='store_true',
+        help='생산자: 전체 사이트를 조회 + 분석하여 생성 작업을 큐에 추가 (WORK_QUEUE_PATH)'
+    )
+    parser.add_argument(
+        '--consume',
+        action='store_true',
+        help='소비자: 큐의 생성 작업을 문구 생성 + 출력 (여러 프로세스로 동시 실행 가능)'
+    )
+    parser.add_argument(
+        '--backfill',
+        action='store_true',
+        help='기간 백필: --start ~ --end 날짜의 문구를 재생성 (체크포인트로 이어서 실행)'
+    )
+    parser.add_argument('--start', type=str, help='백필 시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, help='백필 종료 날짜 (YYYY-MM-DD)')
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        help='백필 체크포인트 파일 (기본값: 환경변수 BACKFILL_CHECKPOINT 또는 ./data/backfill_checkpoint.json)'
+    )
+    parser.add_argument(
+        '--all-sites',
+        action='store_true',
+        help='사이트 설정 파일의 모든 사이트를 한 번 실행 (통합 조회 + 동시 생성)'
+    )
+    parser.add_argument(
+        '--sites',
+        type=str,
+        default=os.getenv('SITES_FILE', './config/sites.yaml'),
+        help='사이트 설정 YAML 경로 (기본값: 환경변수 SITES_FILE 또는 ./config/sites.yaml)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='입력(반올림한 분석값)이 이전 실행과 같아도 문구를 다시 생성하고 출력'
+    )
+    parser.add_argument(
+        '--trace',
+        action='store_true',
+        help='단계별 실행 시간 추적 (TRACE_DIR에 Chrome trace JSON/JSONL 저장)'
+    )
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='같은 인자로 실행하며 모듈별 import 시간 보고 (python -X importtime)'
+    )
+
     args = parser.parse_args()
 
+    if args.profile_startup:
+        sys.exit(profile_startup([arg for arg in sys.argv[1:] if arg != '--profile-startup']))
+
+    if args.trace:
+        os.environ['TRACE_ENABLED'] = 'true'
+
+    if args.daemon:
+        daemon_main(args.sites)
+        sys.exit(0)
+
+    if args.watch:
+        watch_main(args.sites)
+        sys.exit(0)
+
+    if args.consume:
+        consume_main(args.sites)
+        sys.exit(0)
+
     # 날짜 파싱
     target_date = None
     if args.date:
@@ -235,10 +434,46 @@ if __name__ == "__main__":
             print(f"오류: 잘못된 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
             sys.exit(1)
 
+    if args.backfill:
+        if not args.start or not args.end:
+            print("오류: --backfill 에는 --start 와 --end 가 필요합니다.")
+            sys.exit(1)
+        try:
+            start_date = datetime.strptime(args.start, '%Y-%m-%d').date()
+            end_date = datetime.strptime(args.end, '%Y-%m-%d').date()
+        except ValueError:
+            print(f"오류: 잘못된 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
+            sys.exit(1)
+        if start_date > end_date:
+            print("오류: --start 가 --end 보다 늦습니다.")
+            sys.exit(1)
+
+        backfill_main(
+            start_date,
+            end_date,
+            device_ids=args.devices,
+            compare_with_yesterday=not args.no_compare,
+            checkpoint_path=args.checkpoint
+        )
+        sys.exit(0)
+
+    if args.pregenerate:
+        pregenerate_main(args.sites, target_date)
+        sys.exit(0)
+
+    if args.produce:
+        produce_main(args.sites, target_date, force=args.force)
+        sys.exit(0)
+
+    if args.all_sites:
+        sites_main(args.sites, target_date, force=args.force)
+        sys.exit(0)
+
     # 실행
     main(
         target_date=target_date,
         device_ids=args.devices,
         generate_multiple=args.multiple,
-        compare_with_yesterday=not args.no_compare
+        compare_with_yesterday=not args.no_compare,
+        force=args.force
     )
@@ -8,40 +8,104 @@ KORMo 모델 서버 - FastAPI 기반
 
     # 또는 uvicorn으로 직접 실행
     uvicorn model_server:app --host 0.0.0.0 --port 8000
+
+    # 멀티 프로세스 서빙 (uvicorn --workers 대신 사용, 가중치는 한 벌만 로드)
+    SERVE_WORKERS=4 python model_server.py
 """
 
 import os
 import gc
 import time
 import re
+import json
+import queue
+import platform
+import subprocess
+import tempfile
+import asyncio
+import threading
+import copy
+import itertools
+import multiprocessing
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
 from typing import Dict, Optional, List
 import logging
 
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig, StoppingCriteria, StoppingCriteriaList
 from peft import PeftModel
-from fastapi import FastAPI, HTTPException
+try:
+    from transformers import DynamicCache
+except ImportError:  # 이전 transformers: 공통 접두어 KV 캐시 재사용 생략
+    DynamicCache = None
+from fastapi import FastAPI, HTTPException, Header, Response
+from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import sys
 sys.path.append('.')
 from src.generator.prompt_templates import PromptTemplates
+from src.logging_config import setup_logging
+
+# 선택: msgpack 바이너리 응답 (Accept: application/msgpack)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
 load_dotenv()
 
+# 로깅 설정 (큐 기반: 요청 처리 중 로그 I/O는 백그라운드 스레드에서 처리)
+# 파이프라인 직접 로드 모드에서 import되면 main.py의 설정을 그대로 사용
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# 요청마다 남기는 로그는 DEBUG 레벨에서만 메시지를 만들고 기록 (기본값: 생략)
+_log_requests = logger.isEnabledFor(logging.DEBUG)
+
 # FastAPI 앱 생성
 app = FastAPI(title="KORMo Model Server", version="1.0")
 
+# 클라이언트가 Accept-Encoding: gzip을 보내면 일정 크기 이상의 응답(배치 등)을 압축
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv('GZIP_MIN_SIZE', 1024)))
+
 # 전역 변수로 모델과 토크나이저 저장
 model = None
 tokenizer = None
 model_loaded = False
+model_ready = False  # 워밍업까지 끝나 실제 요청을 받을 준비가 된 상태
+warmup_stats: Dict = {}
+
+# 정적 KV 캐시 + torch.compile 모드 상태
+static_cache_enabled = False
+static_buckets: List[int] = []
+static_max_new_tokens = 64
+compiled_forward = None  # 정적 캐시 버킷 경로에서만 사용하는 컴파일된 forward
+
+# 모델 호출 직렬화 (버킷 경로의 forward 교체, 직접 로드 모드에서 여러 스레드가 호출하는 경우)
+generation_lock = threading.RLock()
+
+# 공통 접두어(시스템 프롬프트 등) KV 캐시: (접두어 토큰 ID, 캐시) 리스트 (워밍업에서 채움)
+prefix_caches: List[tuple] = []
+warmup_thread: Optional[threading.Thread] = None
+
+# CPU 스레드/배치 크기 설정 (오토튜너 결과가 있으면 시작 시 적용)
+max_batch_size = int(os.getenv('MAX_BATCH_SIZE', 4))
+tuned_config: Dict = {}
+
+# 유휴 언로드(scale-to-zero) 상태
+last_request_time = time.time()
+model_idle = False  # 유휴 정책으로 모델이 해제된 상태
+restore_thread: Optional[threading.Thread] = None
+restore_lock = threading.Lock()
+last_restore_time: Optional[float] = None
+
+# 멀티 프로세스 서빙 (SERVE_WORKERS > 1 인 경우 워커 풀 사용)
+worker_pool = None
+# forkserver 프로세스에서만 설정되는 환경변수 (모델을 미리 로드하여 워커가 fork로 물려받음)
+_FORKSERVER_PRELOAD_ENV = 'SERVE_FORKSERVER_PRELOAD'
 
 
 class GenerateRequest(BaseModel):
@@ -63,9 +127,26 @@ class TemperatureComparisonRequest(BaseModel):
 
 
 class GenerateResponse(BaseModel):
-    """텍스트 생성 응답 스키마"""
+    """텍스트 생성 응답 스키마 (slim 모드에서는 prompt 생략)"""
     generated_text: str
-    prompt: str
+    prompt: Optional[str] = None
+    generation_time: float
+
+
+class GenerateBatchRequest(BaseModel):
+    """여러 프롬프트 일괄 생성 요청 스키마"""
+    prompts: List[str]
+    max_new_tokens: int = 50
+    temperature: float = 0.5
+    top_p: float = 0.85
+    repetition_penalty: float = 1.2
+    do_sample: bool = True
+
+
+class GenerateBatchResponse(BaseModel):
+    """여러 프롬프트 일괄 생성 응답 스키마"""
+    generated_texts: List[str]
+    batch_size: int
     generation_time: float
 
 
@@ -90,6 +171,16 @@ class StopOnSequences(StoppingCriteria):
         return False
 
 
+class StopAfterLength(StoppingCriteria):
+    """정적 캐시 길이는 고정한 채 요청한 길이까지만 생성하고 중지하는 클래스"""
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> bool:
+        return input_ids.shape[1] >= self.max_length
+
+
 def clean_generated_text(text: str) -> str:
     """
     생성된 텍스트에서 불필요한 형식을 제거하고 정제합니다.
@@ -169,13 +260,18 @@ def load_model():
             torch.cuda.empty_cache()
             logger.info("✓ GPU 메모리 정리 완료")
 
-        # 토크나이저 로드
-        logger.info("토크나이저 로드 중...")
-        tokenizer = AutoTokenizer.from_pretrained(
-            model_path,
-            trust_remote_code=True
-        )
-        logger.info("✓ 토크나이저 로드 완료")
+        # 토크나이저 로드 (유휴 복원 시에는 유지된 토크나이저 재사용)
+        if tokenizer is None:
+            logger.info("토크나이저 로드 중...")
+            tokenizer = AutoTokenizer.from_pretrained(
+                model_path,
+                trust_remote_code=True
+            )
+            # 배치/버킷 패딩용 설정 (디코더 전용 모델은 왼쪽 패딩)
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            tokenizer.padding_side = 'left'
+            logger.info("✓ 토크나이저 로드 완료")
 
         # 양자화 설정
         quantization_config = None
@@ -248,6 +344,9 @@ def load_model():
         else:
             logger.info("원본 모델 사용 (파인튜닝 미적용)")
 
+        # 정적 KV 캐시 + torch.compile 모드 (옵션)
+        setup_static_cache()
+
         logger.info("=" * 70)
 
         model_loaded = True
@@ -257,12 +356,1197 @@ def load_model():
         raise
 
 
+def _get_compile_cache_dir() -> str:
+    """torch.compile 캐시를 저장할 디렉토리 (재시작 시 재사용)"""
+    return os.path.abspath(os.getenv('COMPILE_CACHE_DIR', './data/compile_cache'))
+
+
+def setup_static_cache():
+    """
+    정적 KV 캐시와 컴파일된 forward를 사용하는 생성 모드를 설정합니다.
+    프롬프트 길이를 고정 버킷으로 패딩하여 버킷마다 한 번만 컴파일되도록 합니다.
+
+    환경변수:
+        USE_STATIC_CACHE: 정적 캐시 모드 사용 여부 (기본값: false)
+        STATIC_CACHE_BUCKETS: 프롬프트 길이 버킷 (기본값: 128,256,512,1024)
+        STATIC_CACHE_MAX_NEW_TOKENS: 정적 모드의 최대 생성 토큰 수 (기본값: 64)
+        COMPILE_MODE: torch.compile 모드 (기본값: reduce-overhead)
+        COMPILE_CACHE_DIR: 컴파일 캐시 디렉토리 (기본값: ./data/compile_cache)
+    """
+    global static_cache_enabled, static_buckets, static_max_new_tokens, compiled_forward
+
+    static_cache_enabled = False
+    compiled_forward = None
+    if os.getenv('USE_STATIC_CACHE', 'false').lower() != 'true':
+        return
+
+    if not hasattr(torch, 'compile'):
+        logger.warning("torch.compile을 지원하지 않는 PyTorch 버전입니다. 정적 캐시 모드를 사용하지 않습니다.")
+        return
+
+    static_buckets = sorted(
+        int(b) for b in os.getenv('STATIC_CACHE_BUCKETS', '128,256,512,1024').split(',') if b.strip()
+    )
+    static_max_new_tokens = int(os.getenv('STATIC_CACHE_MAX_NEW_TOKENS', 64))
+    compile_mode = os.getenv('COMPILE_MODE', 'reduce-overhead')
+
+    # 컴파일 결과를 디스크에 저장하여 재시작 시 재컴파일 비용을 줄임
+    cache_dir = _get_compile_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    os.environ.setdefault('TORCHINDUCTOR_CACHE_DIR', os.path.join(cache_dir, 'inductor'))
+    os.environ.setdefault('TORCHINDUCTOR_FX_GRAPH_CACHE', '1')
+    try:
+        import torch._inductor.config as inductor_config
+        inductor_config.fx_graph_cache = True
+    except Exception as e:
+        logger.warning(f"inductor 캐시 설정 실패: {e}")
+    _load_compile_cache_artifacts()
+
+    logger.info(f"정적 KV 캐시 모드 설정 중... (버킷: {static_buckets}, 컴파일 모드: {compile_mode})")
+    # model.forward는 그대로 두고 버킷 경로에서만 교체
+    # (배치, 버킷보다 긴 프롬프트, 오토튜닝은 shape이 매번 달라 dynamic=False로는 계속 재컴파일되므로 원래 forward 사용)
+    compiled_forward = torch.compile(model.forward, mode=compile_mode, dynamic=False)
+    static_cache_enabled = True
+    logger.info("✓ 정적 KV 캐시 모드 설정 완료 (버킷별 첫 요청에서 컴파일)")
+
+
+def _load_compile_cache_artifacts():
+    """디스크에 저장된 컴파일 캐시 아티팩트를 불러옵니다 (PyTorch 2.7+)"""
+    artifact_path = os.path.join(_get_compile_cache_dir(), 'cache_artifacts.bin')
+    if not os.path.exists(artifact_path) or not hasattr(torch.compiler, 'load_cache_artifacts'):
+        return
+
+    try:
+        with open(artifact_path, 'rb') as f:
+            torch.compiler.load_cache_artifacts(f.read())
+        logger.info(f"✓ 컴파일 캐시 로드 완료: {artifact_path}")
+    except Exception as e:
+        logger.warning(f"컴파일 캐시 로드 실패: {e}")
+
+
+def save_compile_cache_artifacts():
+    """현재까지 컴파일된 결과를 디스크에 저장합니다 (PyTorch 2.7+)"""
+    if not static_cache_enabled or not hasattr(torch.compiler, 'save_cache_artifacts'):
+        return
+
+    artifact_path = os.path.join(_get_compile_cache_dir(), 'cache_artifacts.bin')
+    try:
+        artifacts = torch.compiler.save_cache_artifacts()
+        if artifacts is not None:
+            artifact_bytes, _ = artifacts
+            with open(artifact_path, 'wb') as f:
+                f.write(artifact_bytes)
+            logger.info(f"✓ 컴파일 캐시 저장 완료: {artifact_path}")
+    except Exception as e:
+        logger.warning(f"컴파일 캐시 저장 실패: {e}")
+
+
+@contextmanager
+def _use_compiled_forward():
+    """버킷 경로의 generate 동안만 컴파일된 forward 사용 (generation_lock 안에서 호출)"""
+    had_instance_forward = 'forward' in vars(model)
+    eager_forward = model.forward
+    model.forward = compiled_forward
+    try:
+        yield
+    finally:
+        if had_instance_forward:
+            model.forward = eager_forward
+        else:
+            del model.forward
+
+
+def _get_shared_prefixes() -> List[str]:
+    """
+    워밍업 프롬프트의 형식별 공통 접두어 (시스템 프롬프트, 지시문 등 입력 숫자 앞부분)
+
+    Returns:
+        list: 접두어 문자열 리스트
+    """
+    by_format: Dict[str, List[str]] = {}
+    for name, prompt in _get_warmup_prompts():
+        by_format.setdefault(name.split('(')[0], []).append(prompt)
+
+    return [
+        os.path.commonprefix(prompts)
+        for prompts in by_format.values()
+        if len(prompts) > 1 and os.path.commonprefix(prompts)
+    ]
+
+
+def _warm_prefix_caches() -> List[Dict]:
+    """
+    공통 접두어를 한 번 prefill하여 KV 캐시를 만들어 둡니다 (워밍업 중 호출).
+    접두어 경계에서 토큰이 합쳐질 수 있으므로 실제 프롬프트 토큰과 일치하는 부분까지만 사용합니다.
+
+    Returns:
+        list: 접두어별 {'tokens', 'time'} 통계
+    """
+    prefix_caches.clear()
+    if DynamicCache is None or os.getenv('PREFIX_CACHE_ENABLED', 'true').lower() != 'true':
+        return []
+
+    sample_prompts = [prompt for _, prompt in _get_warmup_prompts()]
+    stats = []
+    for prefix in _get_shared_prefixes():
+        prefix_ids = tokenizer(prefix, return_tensors="pt")['input_ids'][0]
+        full_ids = tokenizer(
+            next(prompt for prompt in sample_prompts if prompt.startswith(prefix)), return_tensors="pt"
+        )['input_ids'][0]
+
+        # 실제 프롬프트와 토큰이 같은 구간 (마지막 토큰은 뒤 문자와 합쳐질 수 있으므로 제외)
+        length = 0
+        while length < min(len(prefix_ids), len(full_ids)) - 1 and prefix_ids[length] == full_ids[length]:
+            length += 1
+        if length < 8:
+            continue
+
+        start_time = time.time()
+        with generation_lock, torch.no_grad():
+            cache = DynamicCache()
+            model(input_ids=prefix_ids[:length].unsqueeze(0).to(model.device), past_key_values=cache, use_cache=True)
+        prefix_caches.append((prefix_ids[:length], cache))
+        stats.append({"tokens": length, "time": round(time.time() - start_time, 3)})
+
+    if stats:
+        logger.info(f"✓ 공통 접두어 KV 캐시 {len(stats)}개 준비 ({', '.join(str(st['tokens']) for st in stats)} 토큰)")
+    return stats
+
+
+def _match_prefix_cache(input_ids: torch.Tensor):
+    """입력 토큰이 시작하는 가장 긴 공통 접두어 KV 캐시 (없으면 None)"""
+    best = None
+    for prefix_ids, cache in prefix_caches:
+        length = len(prefix_ids)
+        if length < len(input_ids) and torch.equal(input_ids[:length].cpu(), prefix_ids):
+            if best is None or length > len(best[0]):
+                best = (prefix_ids, cache)
+    return best[1] if best else None
+
+
+def _select_bucket(prompt_length: int) -> Optional[int]:
+    """프롬프트 길이를 담을 수 있는 가장 작은 버킷 (없으면 None)"""
+    for bucket in static_buckets:
+        if prompt_length <= bucket:
+            return bucket
+    return None
+
+
+def _run_generation(
+    prompt: str,
+    max_new_tokens: int = 50,
+    temperature: float = 0.5,
+    top_p: float = 0.85,
+    repetition_penalty: float = 1.2,
+    do_sample: bool = True
+) -> str:
+    """
+    로드된 모델로 프롬프트 하나를 생성하고 후처리된 텍스트를 반환합니다.
+    /generate 엔드포인트와 워밍업이 같은 경로를 사용합니다.
+
+    Args:
+        prompt: 입력 프롬프트
+        max_new_tokens: 최대 생성 토큰 수
+        temperature: 생성 다양성
+        top_p: Nucleus sampling
+        repetition_penalty: 반복 방지 패널티
+        do_sample: 샘플링 여부
+
+    Returns:
+        str: 생성된 텍스트
+    """
+    # 토큰화
+    inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+    prompt_length = inputs['input_ids'].shape[1]
+
+    # 정적 캐시 모드: 버킷 길이로 왼쪽 패딩하여 고정 shape으로 디코딩
+    bucket = _select_bucket(prompt_length) if static_cache_enabled else None
+    extra_kwargs = {}
+    if bucket:
+        inputs = tokenizer(
+            prompt,
+            return_tensors="pt",
+            padding='max_length',
+            max_length=bucket
+        ).to(model.device)
+        prompt_length = bucket
+        # 캐시 길이(버킷 + 생성 토큰 수)를 고정해야 재컴파일이 일어나지 않으므로
+        # generate에는 정적 최대값을 넘기고, 요청한 토큰 수(최대 정적 최대값)에서 중지
+        extra_kwargs['stopping_criteria'] = StoppingCriteriaList([
+            StopAfterLength(bucket + min(max_new_tokens, static_max_new_tokens))
+        ])
+        max_new_tokens = static_max_new_tokens
+        extra_kwargs['cache_implementation'] = 'static'
+    else:
+        # 동적 캐시 경로: 공통 접두어의 KV를 재사용하여 접두어 prefill 생략
+        prefix_cache = _match_prefix_cache(inputs['input_ids'][0])
+        if prefix_cache is not None:
+            extra_kwargs['past_key_values'] = copy.deepcopy(prefix_cache)
+
+    # Stop sequences 설정 (불필요한 출력 조기 종료)
+    stop_sequences = [
+        "\n\n",  # 두 번의 줄바꿈
+        "입력:",  # 새로운 입력 패턴 시작
+        "예시",  # 예시 시작
+        "---",  # 마크다운 구분선
+        "**",  # 마크다운 강조
+        "(또는)",  # 대안 제시
+        "왜냐하면",  # 설명 시작
+        "어색합니다",  # 평가/비판 시작
+        "문맥상",  # 설명 시작
+    ]
+
+    # StoppingCriteria 설정
+    stopping_criteria = StoppingCriteriaList([
+        StopOnSequences(stop_sequences, tokenizer, prompt_length)
+    ])
+
+    # 생성
+    generate_kwargs = dict(
+        max_new_tokens=max_new_tokens,
+        temperature=temperature,
+        top_p=top_p,
+        do_sample=do_sample,
+        repetition_penalty=repetition_penalty,
+        pad_token_id=tokenizer.eos_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+        # stopping_criteria=stopping_criteria,
+        early_stopping=True
+    )
+    with generation_lock, torch.no_grad():
+        with _use_compiled_forward() if bucket else nullcontext():
+            try:
+                outputs = model.generate(**inputs, **generate_kwargs, **extra_kwargs)
+            except Exception as e:
+                if 'past_key_values' not in extra_kwargs:
+                    raise
+                # 이 모델/transformers 버전이 접두어 캐시 이어 생성을 지원하지 않으면 끄고 다시 생성
+                logger.warning(f"공통 접두어 캐시로 생성 실패, 캐시 사용 중지: {e}")
+                prefix_caches.clear()
+                del extra_kwargs['past_key_values']
+                outputs = model.generate(**inputs, **generate_kwargs, **extra_kwargs)
+
+    if bucket:
+        # 패딩된 입력 이후의 새 토큰만 디코딩
+        generated_text = tokenizer.decode(outputs[0][prompt_length:], skip_special_tokens=True).strip()
+    else:
+        # 디코딩
+        full_output = tokenizer.decode(outputs[0], skip_special_tokens=True)
+
+        # 프롬프트 제거
+        generated_text = full_output[len(prompt):].strip()
+
+    # 후처리: <|im_end|> 이후 부분 제거 (Chat 형식 정리)
+    if '<|im_end|>' in generated_text:
+        generated_text = generated_text.split('<|im_end|>')[0].strip()
+
+    cleaned_text = generated_text
+
+    if _log_requests:
+        logger.debug(f"원본 길이: {len(generated_text)}, 정제 후 길이: {len(cleaned_text)}")
+
+    return cleaned_text
+
+
+def _run_batch_generation(
+    prompts: List[str],
+    max_new_tokens: int = 50,
+    temperature: float = 0.5,
+    top_p: float = 0.85,
+    repetition_penalty: float = 1.2,
+    do_sample: bool = True
+) -> List[str]:
+    """
+    여러 프롬프트를 왼쪽 패딩하여 한 번의 generate 호출로 생성합니다.
+
+    Args:
+        prompts: 입력 프롬프트 리스트
+        max_new_tokens: 최대 생성 토큰 수
+        temperature: 생성 다양성
+        top_p: Nucleus sampling
+        repetition_penalty: 반복 방지 패널티
+        do_sample: 샘플링 여부
+
+    Returns:
+        list: 프롬프트 순서와 같은 생성 텍스트 리스트
+    """
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True).to(model.device)
+    input_length = inputs['input_ids'].shape[1]
+
+    with generation_lock, torch.no_grad():
+        outputs = model.generate(
+            **inputs,
+            max_new_tokens=max_new_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            do_sample=do_sample,
+            repetition_penalty=repetition_penalty,
+            pad_token_id=tokenizer.pad_token_id,
+            eos_token_id=tokenizer.eos_token_id
+        )
+
+    results = []
+    for output in outputs:
+        # 패딩된 입력 이후의 새 토큰만 디코딩
+        generated_text = tokenizer.decode(output[input_length:], skip_special_tokens=True).strip()
+        if '<|im_end|>' in generated_text:
+            generated_text = generated_text.split('<|im_end|>')[0].strip()
+        results.append(generated_text)
+
+    return results
+
+
+def _get_host_key() -> str:
+    """튜닝 결과를 구분하는 호스트 식별자 (호스트명, CPU 수, PyTorch 버전)"""
+    return f"{platform.node()}-{os.cpu_count()}cpu-torch{torch.__version__}"
+
+
+def _get_tuning_file() -> str:
+    """호스트별 튜닝 결과 파일 경로"""
+    return os.getenv('TUNING_FILE', f"./data/tuning/{platform.node()}.json")
+
+
+def _apply_thread_config(intra_op_threads: Optional[int], inter_op_threads: Optional[int]):
+    """PyTorch intra-op / inter-op 스레드 수를 설정합니다."""
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if inter_op_threads:
+        try:
+            # inter-op 스레드는 병렬 작업이 시작되기 전에 한 번만 설정 가능
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError as e:
+            logger.warning(f"inter-op 스레드 설정 실패 (이미 병렬 작업이 시작됨): {e}")
+
+
+def apply_tuned_config():
+    """
+    저장된 오토튜닝 결과가 현재 호스트와 일치하면 스레드 수와 배치 크기를 적용합니다.
+    모델 로드 전에 호출해야 inter-op 스레드 설정이 반영됩니다.
+    """
+    global tuned_config, max_batch_size
+
+    tuning_file = _get_tuning_file()
+    if not os.path.exists(tuning_file):
+        return
+
+    try:
+        with open(tuning_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except Exception as e:
+        logger.warning(f"튜닝 결과 파일 읽기 실패: {e}")
+        return
+
+    if config.get('host') != _get_host_key():
+        logger.warning(f"튜닝 결과가 다른 호스트 환경의 것입니다: {config.get('host')} (무시)")
+        return
+
+    _apply_thread_config(config.get('intra_op_threads'), config.get('inter_op_threads'))
+    max_batch_size = config.get('batch_size', max_batch_size)
+    tuned_config = config
+
+    logger.info(f"✓ 튜닝 결과 적용: intra-op {config.get('intra_op_threads')}, "
+                f"inter-op {config.get('inter_op_threads')}, 배치 {max_batch_size}")
+
+
+def _get_autotune_grid(env_key: str, default: List[int]) -> List[int]:
+    """환경변수에서 튜닝 후보 목록을 읽습니다."""
+    value = os.getenv(env_key)
+    if value:
+        return sorted({int(v) for v in value.split(',') if v.strip()})
+    return sorted({v for v in default if v > 0})
+
+
+def run_autotune(inter_op_threads: Optional[int] = None) -> Dict:
+    """
+    현재 프로세스에서 intra-op 스레드 수와 배치 크기 조합을 벤치마크합니다.
+    inter-op 스레드 수는 프로세스당 한 번만 설정할 수 있으므로 값마다 별도 프로세스에서 실행합니다.
+
+    환경변수:
+        AUTOTUNE_THREADS: intra-op 스레드 후보 (기본값: CPU 수의 1/4, 1/2, 전체)
+        AUTOTUNE_BATCH_SIZES: 배치 크기 후보 (기본값: 1,2,4,8)
+        AUTOTUNE_MAX_NEW_TOKENS: 벤치마크 생성 토큰 수 (기본값: 32)
+
+    Args:
+        inter_op_threads: 이 프로세스에 설정된 inter-op 스레드 수 (기록용)
+
+    Returns:
+        dict: 가장 처리량이 높은 설정과 전체 측정 결과
+    """
+    cpu_count = os.cpu_count() or 1
+    thread_grid = _get_autotune_grid('AUTOTUNE_THREADS', [cpu_count // 4, cpu_count // 2, cpu_count])
+    batch_grid = _get_autotune_grid('AUTOTUNE_BATCH_SIZES', [1, 2, 4, 8])
+    max_new_tokens = int(os.getenv('AUTOTUNE_MAX_NEW_TOKENS', 32))
+    prompts = [prompt for _, prompt in _get_warmup_prompts()]
+
+    logger.info(f"오토튜닝 시작: 스레드 {thread_grid} x 배치 {batch_grid} (inter-op: {inter_op_threads or torch.get_num_interop_threads()})")
+
+    results = []
+    for threads in thread_grid:
+        torch.set_num_threads(threads)
+        for batch_size in batch_grid:
+            batch_prompts = [prompts[i % len(prompts)] for i in range(batch_size)]
+            try:
+                # 첫 실행은 해당 shape의 일회성 비용이 섞이므로 버림
+                _run_batch_generation(batch_prompts, max_new_tokens=max_new_tokens, do_sample=False)
+                start = time.time()
+                outputs = _run_batch_generation(batch_prompts, max_new_tokens=max_new_tokens, do_sample=False)
+                elapsed = time.time() - start
+            except Exception as e:
+                logger.warning(f"  - 스레드 {threads}, 배치 {batch_size}: 실패 ({e})")
+                continue
+
+            generated_tokens = sum(len(tokenizer(text)['input_ids']) for text in outputs)
+            tokens_per_sec = generated_tokens / elapsed if elapsed > 0 else 0.0
+            results.append({
+                "intra_op_threads": threads,
+                "inter_op_threads": inter_op_threads or torch.get_num_interop_threads(),
+                "batch_size": batch_size,
+                "latency": round(elapsed, 3),
+                "tokens_per_sec": round(tokens_per_sec, 2)
+            })
+            logger.info(f"  - 스레드 {threads}, 배치 {batch_size}: {elapsed:.2f}초, {tokens_per_sec:.1f} tok/s")
+
+    if not results:
+        raise RuntimeError("오토튜닝 측정 결과가 없습니다.")
+
+    best = max(results, key=lambda r: r['tokens_per_sec'])
+    return {
+        "host": _get_host_key(),
+        "intra_op_threads": best['intra_op_threads'],
+        "inter_op_threads": best['inter_op_threads'],
+        "batch_size": best['batch_size'],
+        "tokens_per_sec": best['tokens_per_sec'],
+        "tuned_at": datetime.now().isoformat(),
+        "results": results
+    }
+
+
+def save_tuned_config(config: Dict):
+    """튜닝 결과를 호스트별 파일에 저장합니다."""
+    tuning_file = _get_tuning_file()
+    os.makedirs(os.path.dirname(tuning_file) or '.', exist_ok=True)
+    with open(tuning_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+    logger.info(f"✓ 튜닝 결과 저장: {tuning_file} "
+                f"(intra-op {config['intra_op_threads']}, inter-op {config['inter_op_threads']}, "
+                f"배치 {config['batch_size']}, {config['tokens_per_sec']} tok/s)")
+
+
+def autotune_cli():
+    """
+    CLI 오토튜너: inter-op 스레드 후보마다 하위 프로세스를 띄워 측정하고
+    전체에서 가장 좋은 설정을 호스트별 파일에 저장합니다.
+
+    환경변수:
+        AUTOTUNE_INTEROP_THREADS: inter-op 스레드 후보 (기본값: 1,2,4)
+    """
+    interop_grid = _get_autotune_grid('AUTOTUNE_INTEROP_THREADS', [1, 2, 4])
+    all_results = []
+
+    for inter_op_threads in interop_grid:
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
+            output_path = tmp.name
+
+        logger.info(f"[inter-op {inter_op_threads}] 측정 프로세스 시작...")
+        completed = subprocess.run([
+            sys.executable, os.path.abspath(__file__),
+            '--autotune-worker',
+            '--interop-threads', str(inter_op_threads),
+            '--autotune-output', output_path
+        ])
+
+        if completed.returncode == 0:
+            with open(output_path, 'r', encoding='utf-8') as f:
+                all_results.extend(json.load(f)['results'])
+        else:
+            logger.warning(f"[inter-op {inter_op_threads}] 측정 실패 (종료 코드 {completed.returncode})")
+        os.remove(output_path)
+
+    if not all_results:
+        logger.error("오토튜닝 실패: 측정 결과가 없습니다.")
+        sys.exit(1)
+
+    best = max(all_results, key=lambda r: r['tokens_per_sec'])
+    save_tuned_config({
+        "host": _get_host_key(),
+        "intra_op_threads": best['intra_op_threads'],
+        "inter_op_threads": best['inter_op_threads'],
+        "batch_size": best['batch_size'],
+        "tokens_per_sec": best['tokens_per_sec'],
+        "tuned_at": datetime.now().isoformat(),
+        "results": all_results
+    })
+
+
+def _get_warmup_prompts() -> List[tuple]:
+    """
+    워밍업에 사용할 대표 프롬프트 목록을 만듭니다.
+    실제 요청과 같은 템플릿을 사용하므로 길이도 실제 요청과 비슷합니다.
+
+    Returns:
+        list: (이름, 프롬프트) 튜플 리스트
+    """
+    formats = [
+        f.strip() for f in os.getenv('WARMUP_FORMATS', 'chat,instruction').split(',') if f.strip()
+    ]
+    # 상승/하강 두 가지 경우를 모두 포함 (숫자 토큰 길이가 다른 경우 포함)
+    samples = [(18.0, 24.0), (5.0, -3.0)]
+
+    prompts = []
+    for yesterday_temp, today_temp in samples:
+        if 'chat' in formats:
+            prompts.append((
+                f"chat({yesterday_temp:.0f}→{today_temp:.0f})",
+                PromptTemplates.get_temperature_chat_prompt(yesterday_temp, today_temp)
+            ))
+        if 'instruction' in formats:
+            comparison_data = {
+                'yesterday_avg_temp': yesterday_temp,
+                'today_avg_temp': today_temp,
+                'temp_change': today_temp - yesterday_temp,
+                'temp_change_direction': '상승' if today_temp > yesterday_temp else '하강'
+            }
+            prompts.append((
+                f"instruction({yesterday_temp:.0f}→{today_temp:.0f})",
+                PromptTemplates.get_temperature_comparison_prompt(comparison_data)
+            ))
+
+    return prompts
+
+
+def run_warmup():
+    """
+    모델 로드 직후 대표 프롬프트로 생성을 미리 실행합니다.
+    커널 선택, 메모리 할당, 토크나이저 캐시 등 첫 요청의 일회성 비용을 미리 치릅니다.
+
+    환경변수:
+        WARMUP_ENABLED: 워밍업 사용 여부 (기본값: true)
+        WARMUP_ROUNDS: 프롬프트 세트 반복 횟수 (기본값: 1)
+        WARMUP_MAX_NEW_TOKENS: 워밍업 생성 토큰 수 (기본값: 16)
+        WARMUP_FORMATS: 사용할 프롬프트 형식 (기본값: chat,instruction)
+        PREFIX_CACHE_ENABLED: 형식별 공통 접두어 KV 캐시 사용 여부 (기본값: true)
+    """
+    global model_ready, warmup_stats
+
+    if os.getenv('WARMUP_ENABLED', 'true').lower() != 'true':
+        logger.info("워밍업 비활성화 (WARMUP_ENABLED=false)")
+        warmup_stats = {"enabled": False}
+        model_ready = True
+        return
+
+    rounds = max(1, int(os.getenv('WARMUP_ROUNDS', 1)))
+    max_new_tokens = int(os.getenv('WARMUP_MAX_NEW_TOKENS', 16))
+    prompts = _get_warmup_prompts()
+
+    logger.info(f"워밍업 시작: 프롬프트 {len(prompts)}개 x {rounds}회")
+    total_start = time.time()
+    runs = []
+
+    # 공통 접두어 KV 캐시를 먼저 채워 워밍업 생성부터 같은 경로를 사용
+    try:
+        prefix_stats = _warm_prefix_caches()
+    except Exception as e:
+        logger.warning(f"공통 접두어 캐시 준비 실패 (사용 안 함): {e}")
+        prefix_caches.clear()
+        prefix_stats = []
+
+    for round_idx in range(rounds):
+        for name, prompt in prompts:
+            run_start = time.time()
+            try:
+                _run_generation(prompt, max_new_tokens=max_new_tokens)
+                error = None
+            except Exception as e:
+                # 워밍업 실패가 서버 기동을 막지는 않음
+                logger.warning(f"워밍업 생성 실패 ({name}): {e}")
+                error = str(e)
+
+            latency = time.time() - run_start
+            runs.append({
+                "round": round_idx + 1,
+                "prompt": name,
+                "prompt_tokens": len(tokenizer(prompt)['input_ids']),
+                "latency": round(latency, 3),
+                "error": error
+            })
+            logger.info(f"  - {name}: {latency:.2f}초")
+
+    total_time = time.time() - total_start
+    warmup_stats = {
+        "enabled": True,
+        "total_time": round(total_time, 3),
+        "first_latency": runs[0]["latency"] if runs else None,
+        "last_latency": runs[-1]["latency"] if runs else None,
+        "prefix_caches": prefix_stats,
+        "runs": runs
+    }
+    model_ready = True
+
+    logger.info(f"✓ 워밍업 완료 (소요 시간: {total_time:.1f}초)")
+
+    # 워밍업에서 컴파일된 버킷을 디스크에 저장
+    save_compile_cache_artifacts()
+
+
+def _start_warmup() -> threading.Thread:
+    """워밍업을 백그라운드 스레드에서 시작합니다 (서버 시작/재로드 시)"""
+    global warmup_thread
+
+    warmup_thread = threading.Thread(target=run_warmup, name="model-warmup", daemon=True)
+    warmup_thread.start()
+    return warmup_thread
+
+
+def unload_model(keep_tokenizer: bool = False):
+    """
+    모델을 메모리에서 해제합니다.
+
+    Args:
+        keep_tokenizer: 토크나이저 유지 여부 (유휴 언로드 시 복원 시간 단축)
+    """
+    global model, tokenizer, model_loaded, model_ready, compiled_forward
+
+    # 진행 중인 생성이 끝난 뒤 해제 (생성 중에 model이 None이 되지 않도록)
+    with generation_lock:
+        if model is None:
+            return
+
+        model_loaded = False
+        model_ready = False
+        model = None
+        compiled_forward = None
+        prefix_caches.clear()
+        if not keep_tokenizer:
+            tokenizer = None
+
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+    logger.info("기존 모델 언로드 완료")
+
+
+def _restore_model():
+    """유휴 언로드된 모델을 다시 로드합니다 (백그라운드 스레드에서 실행)"""
+    global model_idle, last_restore_time
+
+    logger.info("유휴 상태에서 모델 복원 시작...")
+    start_time = time.time()
+    try:
+        # 전체 로드와 같은 경로 (CPU에서는 float32 변환으로 가중치를 새로 할당하므로 로드 비용을 그대로 냄,
+        # 가중치 파일이 페이지 캐시에 남아 있으면 디스크 읽기만 줄어듦)
+        # 교체가 끝날 때까지 유휴 해제/생성이 끼어들지 않도록 생성 잠금 안에서 로드
+        with generation_lock:
+            load_model()
+            model_idle = False
+        run_warmup()
+        last_restore_time = time.time() - start_time
+        logger.info(f"✓ 모델 복원 완료 (소요 시간: {last_restore_time:.1f}초)")
+    except Exception as e:
+        logger.error(f"모델 복원 실패: {e}", exc_info=True)
+
+
+def _start_restore() -> threading.Thread:
+    """복원 스레드를 시작합니다 (이미 진행 중이면 기존 스레드 반환)"""
+    global restore_thread
+
+    with restore_lock:
+        if restore_thread is None or not restore_thread.is_alive():
+            restore_thread = threading.Thread(target=_restore_model, name="model-restore", daemon=True)
+            restore_thread.start()
+        return restore_thread
+
+
+def _is_restoring() -> bool:
+    """모델 복원이 진행 중인지 확인"""
+    return restore_thread is not None and restore_thread.is_alive()
+
+
+async def _ensure_model_ready(wait_for_model: Optional[str] = None):
+    """
+    생성 요청 전에 모델 상태를 확인합니다.
+    유휴 언로드된 상태면 복원을 시작하고, 호출자가 X-Wait-For-Model: true를 보낸 경우에만 복원을 기다립니다.
+    기다리지 않는 호출자는 503 + X-Model-Status: warming 응답을 받고 폴백을 사용할 수 있습니다.
+
+    Args:
+        wait_for_model: X-Wait-For-Model 헤더 값
+    """
+    global last_request_time
+
+    last_request_time = time.time()
+
+    if model_loaded and not _is_restoring():
+        return
+
+    if not model_idle and not _is_restoring():
+        raise HTTPException(status_code=503, detail="모델이 아직 로드 중입니다.")
+
+    thread = _start_restore()
+
+    if wait_for_model and wait_for_model.lower() == 'true':
+        await asyncio.to_thread(thread.join)
+        if model_loaded:
+            return
+        raise HTTPException(status_code=503, detail="모델 복원에 실패했습니다.")
+
+    retry_after = int(last_restore_time) + 1 if last_restore_time else 30
+    raise HTTPException(
+        status_code=503,
+        detail="모델을 복원하는 중입니다. (warming)",
+        headers={"X-Model-Status": "warming", "Retry-After": str(retry_after)}
+    )
+
+
+def _unload_if_idle(idle_seconds: float):
+    """
+    생성 잠금을 잡은 뒤 유휴 조건을 다시 확인하고 모델을 해제합니다.
+    (잠금을 기다리는 동안 들어온 요청이 있으면 해제하지 않음)
+    """
+    global model_idle
+
+    with generation_lock:
+        if not model_ready or model_idle or _is_restoring():
+            return
+
+        idle_time = time.time() - last_request_time
+        if idle_time < idle_seconds:
+            return
+
+        logger.info(f"{idle_time / 60:.1f}분 동안 요청이 없어 모델을 해제합니다.")
+        unload_model(keep_tokenizer=True)
+        model_idle = True
+
+
+async def _idle_monitor(idle_seconds: float, check_interval: float):
+    """마지막 요청 이후 idle_seconds 동안 요청이 없으면 모델을 해제합니다."""
+    while True:
+        await asyncio.sleep(check_interval)
+
+        if not model_ready or model_idle or _is_restoring():
+            continue
+
+        if time.time() - last_request_time >= idle_seconds:
+            # 생성이 잠금을 잡고 있을 수 있으므로 이벤트 루프 밖에서 대기
+            await asyncio.to_thread(_unload_if_idle, idle_seconds)
+
+
+def _worker_main(worker_id: int, request_queue, result_queue, num_threads: Optional[int]):
+    """
+    워커 프로세스 메인 루프
+    forkserver가 미리 로드한 model/tokenizer 전역 변수를 fork로 물려받으므로 가중치 메모리는
+    copy-on-write로 공유되며, 가중치를 쓰지 않는 한 복사되지 않습니다.
+    """
+    # fork 시 부모의 로그 기록 스레드는 복사되지 않으므로 워커에서 다시 시작
+    setup_logging(force=True)
+
+    if num_threads:
+        torch.set_num_threads(num_threads)
+
+    # 커널 선택/메모리 할당은 프로세스마다 별도이므로 워커에서 워밍업
+    run_warmup()
+    result_queue.put((None, worker_id, True, warmup_stats))
+
+    while True:
+        job = request_queue.get()
+        if job is None:
+            break
+
+        job_id, kind, kwargs = job
+        try:
+            if kind == 'batch':
+                result = _run_batch_generation(**kwargs)
+            else:
+                result = _run_generation(**kwargs)
+            result_queue.put((job_id, worker_id, True, result))
+        except Exception as e:
+            result_queue.put((job_id, worker_id, False, str(e)))
+
+
+def _preload_worker_model():
+    """
+    forkserver 프로세스에서 워커가 물려받을 모델을 로드합니다.
+    이 프로세스는 생성을 하지 않으므로 intra-op 스레드를 1개로 두어
+    OpenMP 스레드 풀이 만들어진 상태에서 워커를 fork하지 않도록 합니다.
+    """
+    apply_tuned_config()
+    torch.set_num_threads(1)
+    load_model()
+
+
+def _worker_mode_enabled() -> bool:
+    """SERVE_WORKERS > 1 이고 CPU 환경이면 워커 풀 모드로 실행합니다."""
+    return int(os.getenv('SERVE_WORKERS', 1)) > 1 and not torch.cuda.is_available()
+
+
+def _start_forkserver():
+    """
+    워커를 fork해 줄 forkserver 프로세스를 시작합니다 (이미 실행 중이면 그대로 사용).
+    forkserver는 새 인터프리터로 실행되어 서버의 스레드(이벤트 루프, 결과 수신, 로그 기록)를
+    물려받지 않으며, 시작 시 이 모듈을 불러오면서 모델을 한 번 로드합니다.
+    서버 스레드가 생기기 전에 시작하도록 __main__에서 먼저 호출합니다.
+    """
+    from multiprocessing import forkserver
+
+    main_module = sys.modules['__main__']
+    # python model_server.py 로 실행하면 __main__을, uvicorn model_server:app 이면 이 모듈을 미리 불러옴
+    preload = ['__main__'] if getattr(main_module, '__file__', None) == __file__ else [__name__]
+    multiprocessing.set_forkserver_preload(preload)
+
+    os.environ[_FORKSERVER_PRELOAD_ENV] = '1'
+    try:
+        forkserver.ensure_running()
+    finally:
+        # 서버 프로세스와 이후의 다른 하위 프로세스는 미리 로드하지 않음
+        del os.environ[_FORKSERVER_PRELOAD_ENV]
+
+
+class WorkerPool:
+    """
+    가중치를 공유하는 생성 워커 프로세스 풀
+    부모 프로세스(FastAPI)는 요청을 진행 중 작업이 가장 적은 워커로 분배합니다.
+    워커는 모델을 미리 로드한 단일 스레드 forkserver에서 fork되므로 부모의 스레드나 잠금을 물려받지 않습니다.
+    종료된 워커(OOM 등)는 결과 수신 스레드가 감지하여 진행 중 요청을 실패 처리하고 다시 띄웁니다.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        threads_per_worker: Optional[int] = None,
+        job_timeout: Optional[float] = None,
+        check_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            num_workers: 워커 프로세스 수
+            threads_per_worker: 워커당 intra-op 스레드 수 (기본값: CPU 수 / 워커 수)
+            job_timeout: 프롬프트 하나당 응답 대기 시간 (초, 기본값: 환경변수 SERVE_WORKER_TIMEOUT 또는 120)
+            check_interval: 워커 생존 확인 주기 (초, 기본값: 환경변수 SERVE_WORKER_CHECK_INTERVAL 또는 5)
+        """
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // num_workers)
+        self.job_timeout = job_timeout or float(os.getenv('SERVE_WORKER_TIMEOUT', 120))
+        self.check_interval = check_interval or float(os.getenv('SERVE_WORKER_CHECK_INTERVAL', 5))
+        self.processes = [None] * num_workers
+        self.request_queues = [None] * num_workers
+        self.result_queue = None
+        self.outstanding = [0] * num_workers
+        self.restarts = [0] * num_workers
+        self.ready_workers = set()
+        self.worker_warmup: Dict[int, Dict] = {}
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._job_workers: Dict[int, int] = {}  # 작업 ID → 처리 중인 워커 (결과가 올 때까지 유지)
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._mp_context = None
+        self._loop = None
+        self._reader = None
+        self._closing = False
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """
+        워커 프로세스와 결과 수신 스레드를 시작합니다.
+        첫 워커는 forkserver의 모델 로드가 끝날 때까지 기다린 뒤 시작됩니다.
+        """
+        self._loop = loop
+        _start_forkserver()
+        self._mp_context = multiprocessing.get_context('forkserver')
+        self.result_queue = self._mp_context.Queue()
+
+        for worker_id in range(self.num_workers):
+            self._spawn(worker_id)
+
+        self._reader = threading.Thread(target=self._read_results, name="worker-results", daemon=True)
+        self._reader.start()
+        logger.info(f"✓ 워커 {self.num_workers}개 시작 (워커당 스레드 {self.threads_per_worker})")
+
+    def _spawn(self, worker_id: int):
+        """
+        워커 프로세스 하나를 새 요청 큐와 함께 시작합니다.
+        프로세스 시작은 forkserver 응답을 기다리므로 self._lock 밖에서 호출하고, 교체만 잠금 안에서 합니다.
+        """
+        request_queue = self._mp_context.Queue()
+        process = self._mp_context.Process(
+            target=_worker_main,
+            args=(worker_id, request_queue, self.result_queue, self.threads_per_worker),
+            name=f"generation-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+
+        with self._lock:
+            if not self._closing:
+                self.request_queues[worker_id] = request_queue
+                self.processes[worker_id] = process
+                return
+
+        # 재시작 도중 종료가 시작된 경우
+        process.terminate()
+
+    def _read_results(self):
+        """결과 큐를 읽어 대기 중인 요청의 Future를 완료하고, 주기적으로 워커 생존을 확인합니다."""
+        global model_ready
+
+        last_check = time.time()
+        while True:
+            try:
+                message = self.result_queue.get(timeout=self.check_interval)
+            except queue.Empty:
+                message = False
+
+            # 결과가 계속 들어오는 동안에도 생존 확인이 밀리지 않도록 시간 기준으로 확인
+            if time.time() - last_check >= self.check_interval:
+                self._check_workers()
+                last_check = time.time()
+
+            if message is None:
+                break
+            if message is False:
+                continue
+
+            job_id, worker_id, ok, payload = message
+
+            # 워밍업 완료 알림
+            if job_id is None:
+                self.ready_workers.add(worker_id)
+                self.worker_warmup[worker_id] = payload
+                logger.info(f"✓ 워커 {worker_id} 준비 완료 ({len(self.ready_workers)}/{self.num_workers})")
+                if len(self.ready_workers) == self.num_workers:
+                    model_ready = True
+                continue
+
+            with self._lock:
+                # 종료 처리된 워커의 작업이면 이미 실패 처리됨
+                if self._job_workers.pop(job_id, None) is None:
+                    continue
+                self.outstanding[worker_id] -= 1
+                future = self._futures.pop(job_id, None)
+
+            if future is None:
+                continue
+            if ok:
+                self._loop.call_soon_threadsafe(_resolve_future, future, payload, None)
+            else:
+                self._loop.call_soon_threadsafe(_resolve_future, future, None, RuntimeError(payload))
+
+    def _check_workers(self):
+        """종료된 워커의 진행 중 요청을 실패 처리하고 워커를 다시 시작합니다."""
+        if self._closing:
+            return
+
+        for worker_id, process in enumerate(self.processes):
+            if process is None or process.is_alive():
+                continue
+
+            with self._lock:
+                if self._closing:
+                    return
+                dead_queue = self.request_queues[worker_id]
+                job_ids = [job_id for job_id, owner in self._job_workers.items() if owner == worker_id]
+                error = RuntimeError(f"생성 워커 {worker_id}가 종료되었습니다 (종료 코드 {process.exitcode})")
+                for job_id in job_ids:
+                    del self._job_workers[job_id]
+                    future = self._futures.pop(job_id, None)
+                    if future is not None:
+                        self._loop.call_soon_threadsafe(_resolve_future, future, None, error)
+                self.outstanding[worker_id] = 0
+                self.ready_workers.discard(worker_id)
+                self.restarts[worker_id] += 1
+
+                logger.error(
+                    f"✗ 워커 {worker_id} 종료 감지 (종료 코드 {process.exitcode}): "
+                    f"진행 중 요청 {len(job_ids)}개 실패 처리 후 재시작 ({self.restarts[worker_id]}회)"
+                )
+
+            # 죽은 워커의 요청 큐에 남은 작업은 버림 (위에서 실패 처리됨)
+            dead_queue.cancel_join_thread()
+            dead_queue.close()
+            self._spawn(worker_id)
+
+    async def submit(self, kind: str, **kwargs):
+        """
+        진행 중 작업이 가장 적은 워커에 생성 작업을 보냅니다.
+
+        Args:
+            kind: 'generate' (단일 프롬프트) 또는 'batch' (프롬프트 리스트)
+            **kwargs: _run_generation / _run_batch_generation 인자
+
+        Returns:
+            생성 결과 (str 또는 list)
+
+        Raises:
+            RuntimeError: 워커가 실패했거나 종료된 경우, 응답 대기 시간을 넘긴 경우
+        """
+        with self._lock:
+            alive = [i for i in range(self.num_workers) if self.processes[i].is_alive()]
+            if not alive:
+                raise RuntimeError("살아 있는 생성 워커가 없습니다 (재시작 중)")
+            candidates = [i for i in alive if i in self.ready_workers] or alive
+            worker_id = min(candidates, key=lambda i: self.outstanding[i])
+
+            job_id = next(self._job_ids)
+            future = self._loop.create_future()
+            self._futures[job_id] = future
+            self._job_workers[job_id] = worker_id
+            self.outstanding[worker_id] += 1
+            self.request_queues[worker_id].put((job_id, kind, kwargs))
+
+        timeout = self.job_timeout * len(kwargs['prompts']) if kind == 'batch' else self.job_timeout
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # 워커는 작업을 계속 처리 중이므로 진행 중 작업 수는 결과가 올 때 줄어듦
+            with self._lock:
+                self._futures.pop(job_id, None)
+            raise RuntimeError(f"생성 워커 {worker_id} 응답 시간 초과 ({timeout:.0f}초)")
+
+    def status(self) -> Dict:
+        """워커 상태 요약"""
+        return {
+            "count": self.num_workers,
+            "ready": len(self.ready_workers),
+            "alive": sum(1 for p in self.processes if p is not None and p.is_alive()),
+            "outstanding": list(self.outstanding),
+            "restarts": list(self.restarts),
+            "threads_per_worker": self.threads_per_worker,
+            "warmup": self.worker_warmup
+        }
+
+    def shutdown(self):
+        """워커 프로세스를 종료합니다."""
+        with self._lock:
+            self._closing = True
+        for request_queue in self.request_queues:
+            if request_queue is not None:
+                request_queue.put(None)
+        for process in self.processes:
+            if process is None:
+                continue
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        if self.result_queue is not None:
+            self.result_queue.put(None)
+        logger.info("워커 프로세스 종료 완료")
+
+
+def _resolve_future(future: asyncio.Future, result, error: Optional[Exception]):
+    """이벤트 루프 스레드에서 Future를 완료합니다."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _start_worker_pool() -> Optional[WorkerPool]:
+    """
+    SERVE_WORKERS > 1 이면 워커 풀을 시작합니다 (CPU 전용).
+
+    환경변수:
+        SERVE_WORKERS: 생성 워커 프로세스 수 (기본값: 1 = 단일 프로세스)
+        SERVE_WORKER_THREADS: 워커당 intra-op 스레드 수 (기본값: CPU 수 / 워커 수)
+    """
+    num_workers = int(os.getenv('SERVE_WORKERS', 1))
+    if num_workers <= 1:
+        return None
+
+    if torch.cuda.is_available():
+        logger.warning("CUDA 환경에서는 fork 기반 워커를 사용할 수 없습니다. 단일 프로세스로 실행합니다.")
+        return None
+
+    threads = os.getenv('SERVE_WORKER_THREADS')
+    pool = WorkerPool(num_workers, int(threads) if threads else None)
+    pool.start(asyncio.get_running_loop())
+    return pool
+
+
+def _encode_response(
+    payload: Dict,
+    response_mode: Optional[str] = None,
+    accept: Optional[str] = None,
+    trace_id: Optional[str] = None
+) -> Response:
+    """
+    요청 헤더에 따라 응답을 인코딩합니다 (헤더가 없는 구버전 클라이언트는 기존 JSON 그대로).
+
+    Args:
+        payload: 응답 데이터
+        response_mode: X-Response-Mode 헤더 ('slim'이면 prompt 에코 생략)
+        accept: Accept 헤더 ('application/msgpack' 포함 시 msgpack 인코딩)
+        trace_id: X-Trace-Id 헤더 (있으면 응답 헤더로 그대로 반환)
+
+    Returns:
+        Response: 인코딩된 응답 (Server-Timing 헤더에 생성 시간 포함)
+    """
+    if response_mode == 'slim':
+        payload = {k: v for k, v in payload.items() if k != 'prompt'}
+
+    headers = {}
+    if 'generation_time' in payload:
+        headers['Server-Timing'] = f"generate;dur={payload['generation_time'] * 1000:.1f}"
+    if trace_id:
+        headers['X-Trace-Id'] = trace_id
+
+    if msgpack is not None and accept and 'application/msgpack' in accept:
+        return Response(
+            content=msgpack.packb(payload, use_bin_type=True),
+            media_type='application/msgpack',
+            headers=headers
+        )
+
+    return JSONResponse(content=payload, headers=headers)
+
+
+def _trace_prefix(trace_id: Optional[str]) -> str:
+    """클라이언트 추적과 연결하기 위한 로그 접두어"""
+    return f"[trace {trace_id[:8]}] " if trace_id else ""
+
+
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 모델 로드"""
+    global max_batch_size, worker_pool, model_loaded
+
     logger.info("서버 시작 중...")
-    load_model()
-    logger.info("서버 준비 완료! API 요청을 받을 수 있습니다.")
+    apply_tuned_config()
+
+    # 멀티 프로세스 모드: 모델은 forkserver가 로드하고 워커가 각자 워밍업 후 준비 완료를 알림
+    # 단일 프로세스 모드: 요청을 받기 시작한 뒤 백그라운드에서 워밍업 (/health가 warming_up을 보고)
+    if _worker_mode_enabled():
+        if not tuned_config and os.getenv('AUTOTUNE_ON_STARTUP', 'false').lower() == 'true':
+            logger.warning("멀티 워커 모드에서는 시작 시 오토튜닝을 건너뜁니다. python model_server.py --autotune 으로 먼저 튜닝하세요.")
+        worker_pool = _start_worker_pool()
+        model_loaded = True
+    else:
+        load_model()
+
+        # 이 호스트의 튜닝 결과가 없으면 시작 시 오토튜닝 (옵션)
+        if not tuned_config and os.getenv('AUTOTUNE_ON_STARTUP', 'false').lower() == 'true':
+            config = run_autotune()
+            save_tuned_config(config)
+            torch.set_num_threads(config['intra_op_threads'])
+            max_batch_size = config['batch_size']
+
+        _start_warmup()
+
+    # 유휴 언로드 정책 (IDLE_UNLOAD_MINUTES > 0 인 경우)
+    idle_minutes = float(os.getenv('IDLE_UNLOAD_MINUTES', 0))
+    if idle_minutes > 0 and worker_pool is not None:
+        logger.warning("멀티 워커 모드에서는 유휴 언로드를 지원하지 않습니다.")
+    elif idle_minutes > 0:
+        check_interval = float(os.getenv('IDLE_CHECK_INTERVAL', 60))
+        asyncio.create_task(_idle_monitor(idle_minutes * 60, check_interval))
+        logger.info(f"유휴 언로드 활성화: {idle_minutes:.0f}분 동안 요청이 없으면 모델 해제")
+
+    logger.info("서버 시작 완료! 워밍업이 끝나면 /health가 ready를 보고합니다.")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 워커 프로세스 정리"""
+    if worker_pool is not None:
+        worker_pool.shutdown()
 
 
 @app.get("/")
@@ -277,97 +1561,113 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
+    """
+    헬스 체크 엔드포인트 (워밍업까지 끝나야 healthy)
+    status는 기존 프로브와 호환되도록 healthy/loading만 사용하고, 세부 상태는 state에 담습니다.
+    """
+    if model_ready and not _is_restoring():
+        state = "ready"
+    elif _is_restoring():
+        state = "warming"
+    elif model_idle:
+        state = "idle"
+    elif model_loaded:
+        state = "warming_up"
+    else:
+        state = "loading"
+
     return {
-        "status": "healthy" if model_loaded else "loading",
+        "status": "healthy" if state == "ready" else "loading",
+        "state": state,
         "model_loaded": model_loaded,
+        "ready": model_ready,
+        "warmup": warmup_stats,
+        "static_cache": {
+            "enabled": static_cache_enabled,
+            "buckets": static_buckets
+        },
+        "threads": {
+            "intra_op": torch.get_num_threads(),
+            "inter_op": torch.get_num_interop_threads(),
+            "tuned": bool(tuned_config)
+        },
+        "max_batch_size": max_batch_size,
+        "idle": {
+            "idle_seconds": round(time.time() - last_request_time, 1),
+            "unloaded": model_idle,
+            "last_restore_time": last_restore_time
+        },
+        "workers": worker_pool.status() if worker_pool is not None else None,
         "cuda_available": torch.cuda.is_available()
     }
 
 
 @app.post("/generate", response_model=GenerateResponse)
-async def generate_text(request: GenerateRequest):
+async def generate_text(
+    request: GenerateRequest,
+    x_wait_for_model: Optional[str] = Header(None),
+    x_response_mode: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    x_trace_id: Optional[str] = Header(None)
+):
     """텍스트 생성 엔드포인트"""
-    if not model_loaded:
-        raise HTTPException(status_code=503, detail="모델이 아직 로드 중입니다.")
+    await _ensure_model_ready(x_wait_for_model)
 
     try:
-        logger.info(f"생성 요청 받음: {len(request.prompt)} 글자")
+        if _log_requests:
+            logger.debug(f"{_trace_prefix(x_trace_id)}생성 요청 받음: {len(request.prompt)} 글자")
         start_time = time.time()
 
-        # 토큰화
-        inputs = tokenizer(request.prompt, return_tensors="pt").to(model.device)
-        prompt_length = inputs['input_ids'].shape[1]
-
-        # Stop sequences 설정 (불필요한 출력 조기 종료)
-        stop_sequences = [
-            "\n\n",  # 두 번의 줄바꿈
-            "입력:",  # 새로운 입력 패턴 시작
-            "예시",  # 예시 시작
-            "---",  # 마크다운 구분선
-            "**",  # 마크다운 강조
-            "(또는)",  # 대안 제시
-            "왜냐하면",  # 설명 시작
-            "어색합니다",  # 평가/비판 시작
-            "문맥상",  # 설명 시작
-        ]
-
-        # StoppingCriteria 설정
-        stopping_criteria = StoppingCriteriaList([
-            StopOnSequences(stop_sequences, tokenizer, prompt_length)
-        ])
-
-        # 생성
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_new_tokens=request.max_new_tokens,
-                temperature=request.temperature,
-                top_p=request.top_p,
-                do_sample=request.do_sample,
-                repetition_penalty=request.repetition_penalty,
-                pad_token_id=tokenizer.eos_token_id,
-                eos_token_id=tokenizer.eos_token_id,
-                # stopping_criteria=stopping_criteria,
-                early_stopping=True
-            )
-
-        # 디코딩
-        full_output = tokenizer.decode(outputs[0], skip_special_tokens=True)
-
-        # 프롬프트 제거
-        generated_text = full_output[len(request.prompt):].strip()
-
-        # 후처리: <|im_end|> 이후 부분 제거 (Chat 형식 정리)
-        if '<|im_end|>' in generated_text:
-            generated_text = generated_text.split('<|im_end|>')[0].strip()
-
-        cleaned_text = generated_text
+        generation_kwargs = dict(
+            prompt=request.prompt,
+            max_new_tokens=request.max_new_tokens,
+            temperature=request.temperature,
+            top_p=request.top_p,
+            repetition_penalty=request.repetition_penalty,
+            do_sample=request.do_sample
+        )
+        if worker_pool is not None:
+            cleaned_text = await worker_pool.submit('generate', **generation_kwargs)
+        else:
+            cleaned_text = _run_generation(**generation_kwargs)
 
         generation_time = time.time() - start_time
 
-        logger.info(f"✓ 생성 완료 (소요 시간: {generation_time:.2f}초)")
-        logger.info(f"원본 길이: {len(generated_text)}, 정제 후 길이: {len(cleaned_text)}")
-
-        return GenerateResponse(
-            generated_text=cleaned_text,
-            prompt=request.prompt,
-            generation_time=generation_time
+        if _log_requests:
+            logger.debug(f"{_trace_prefix(x_trace_id)}✓ 생성 완료 (소요 시간: {generation_time:.2f}초)")
+
+        return _encode_response(
+            GenerateResponse(
+                generated_text=cleaned_text,
+                prompt=request.prompt,
+                generation_time=generation_time
+            ).model_dump(),
+            response_mode=x_response_mode,
+            accept=accept,
+            trace_id=x_trace_id
         )
 
+    except HTTPException:
+        # 503(모델 준비 중) 등은 그대로 전달하여 클라이언트가 상태 코드로 판단하도록 함
+        raise
     except Exception as e:
         logger.error(f"생성 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"생성 실패: {str(e)}")
 
 
 @app.post("/generate/temperature", response_model=GenerateResponse)
-async def generate_temperature_message(request: TemperatureComparisonRequest):
+async def generate_temperature_message(
+    request: TemperatureComparisonRequest,
+    x_wait_for_model: Optional[str] = Header(None),
+    x_response_mode: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    x_trace_id: Optional[str] = Header(None)
+):
     """
     온도 비교 전광판 메시지 생성 엔드포인트
     자동으로 구조화된 프롬프트를 생성하여 모델에 전달합니다.
     """
-    if not model_loaded:
-        raise HTTPException(status_code=503, detail="모델이 아직 로드 중입니다.")
+    await _ensure_model_ready(x_wait_for_model)
 
     try:
         # Chat 형식 프롬프트 생성 (파인튜닝 데이터와 동일 형식)
@@ -379,7 +1679,8 @@ async def generate_temperature_message(request: TemperatureComparisonRequest):
                 request.yesterday_temp,
                 request.today_temp
             )
-            logger.info(f"[Chat 형식] 온도 비교 메시지 생성: 어제 {request.yesterday_temp}도 → 오늘 {request.today_temp}도")
+            if _log_requests:
+                logger.debug(f"[Chat 형식] 온도 비교 메시지 생성: 어제 {request.yesterday_temp}도 → 오늘 {request.today_temp}도")
         else:
             # 레거시 Instruction 형식 (호환성 유지)
             comparison_data = {
@@ -389,7 +1690,8 @@ async def generate_temperature_message(request: TemperatureComparisonRequest):
                 'temp_change_direction': '상승' if request.today_temp > request.yesterday_temp else '하강'
             }
             structured_prompt = PromptTemplates.get_temperature_comparison_prompt(comparison_data)
-            logger.info(f"[Instruction 형식] 온도 비교 메시지 생성: 어제 {request.yesterday_temp}도 → 오늘 {request.today_temp}도")
+            if _log_requests:
+                logger.debug(f"[Instruction 형식] 온도 비교 메시지 생성: 어제 {request.yesterday_temp}도 → 오늘 {request.today_temp}도")
 
         # 내부 generate 함수 호출
         gen_request = GenerateRequest(
@@ -398,43 +1700,166 @@ async def generate_temperature_message(request: TemperatureComparisonRequest):
             temperature=request.temperature
         )
 
-        return await generate_text(gen_request)
+        return await generate_text(
+            gen_request,
+            x_wait_for_model=x_wait_for_model,
+            x_response_mode=x_response_mode,
+            accept=accept,
+            x_trace_id=x_trace_id
+        )
 
+    except HTTPException:
+        # 503(모델 준비 중) 등은 그대로 전달하여 클라이언트가 상태 코드로 판단하도록 함
+        raise
     except Exception as e:
         logger.error(f"온도 비교 메시지 생성 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"생성 실패: {str(e)}")
 
 
+@app.post("/generate/batch", response_model=GenerateBatchResponse)
+async def generate_batch(
+    request: GenerateBatchRequest,
+    x_wait_for_model: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    x_trace_id: Optional[str] = Header(None)
+):
+    """
+    여러 프롬프트 일괄 생성 엔드포인트
+    튜닝된 배치 크기(max_batch_size) 단위로 나누어 생성합니다.
+    """
+    await _ensure_model_ready(x_wait_for_model)
+
+    try:
+        if _log_requests:
+            logger.debug(f"{_trace_prefix(x_trace_id)}일괄 생성 요청 받음: {len(request.prompts)}개 (배치 크기 {max_batch_size})")
+        start_time = time.time()
+
+        chunks = [
+            request.prompts[i:i + max_batch_size]
+            for i in range(0, len(request.prompts), max_batch_size)
+        ]
+        generation_kwargs = dict(
+            max_new_tokens=request.max_new_tokens,
+            temperature=request.temperature,
+            top_p=request.top_p,
+            repetition_penalty=request.repetition_penalty,
+            do_sample=request.do_sample
+        )
+
+        generated_texts = []
+        if worker_pool is not None:
+            # 청크를 여러 워커에 동시에 분배
+            results = await asyncio.gather(*[
+                worker_pool.submit('batch', prompts=chunk, **generation_kwargs)
+                for chunk in chunks
+            ])
+            for chunk_texts in results:
+                generated_texts.extend(chunk_texts)
+        else:
+            for chunk in chunks:
+                generated_texts.extend(_run_batch_generation(chunk, **generation_kwargs))
+
+        generation_time = time.time() - start_time
+        if _log_requests:
+            logger.debug(f"{_trace_prefix(x_trace_id)}✓ 일괄 생성 완료 (소요 시간: {generation_time:.2f}초)")
+
+        return _encode_response(
+            GenerateBatchResponse(
+                generated_texts=generated_texts,
+                batch_size=max_batch_size,
+                generation_time=generation_time
+            ).model_dump(),
+            accept=accept,
+            trace_id=x_trace_id
+        )
+
+    except HTTPException:
+        # 503(모델 준비 중) 등은 그대로 전달하여 클라이언트가 상태 코드로 판단하도록 함
+        raise
+    except Exception as e:
+        logger.error(f"일괄 생성 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"생성 실패: {str(e)}")
+
+
 @app.post("/reload")
 async def reload_model():
     """모델 재로드 (메모리 정리 후 다시 로드)"""
-    global model, tokenizer, model_loaded
+    global model_idle, worker_pool
 
     logger.info("모델 재로드 요청...")
 
-    # 기존 모델 언로드
-    if model is not None:
-        del model
-        del tokenizer
-        model = None
-        tokenizer = None
-        model_loaded = False
+    # 멀티 워커 모드: 가중치는 forkserver가 가지고 있으므로 워커만 재시작하여 메모리를 정리
+    if worker_pool is not None:
+        worker_pool.shutdown()
+        worker_pool = _start_worker_pool()
+        return {"status": "success", "message": "생성 워커가 재시작되었습니다. (가중치 재로드는 서버 재시작 필요)"}
 
-        gc.collect()
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-
-        logger.info("기존 모델 언로드 완료")
+    # 기존 모델 언로드
+    unload_model()
 
     # 모델 재로드
     load_model()
+    _start_warmup()
+    model_idle = False
 
     return {"status": "success", "message": "모델이 재로드되었습니다."}
 
 
+# 워커 모드의 forkserver 프로세스: 서버 스레드 없이 모델을 한 번 로드해 두고 워커가 fork로 물려받음
+if os.getenv(_FORKSERVER_PRELOAD_ENV) == '1':
+    _preload_worker_model()
+
+
 if __name__ == "__main__":
+    import argparse
     import uvicorn
 
+    parser = argparse.ArgumentParser(description='KORMo 모델 서버')
+    parser.add_argument(
+        '--autotune',
+        action='store_true',
+        help='CPU 스레드 수/배치 크기 오토튜닝 후 결과를 저장하고 종료'
+    )
+    parser.add_argument('--autotune-worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--interop-threads', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--autotune-output', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.autotune:
+        autotune_cli()
+        sys.exit(0)
+
+    if args.autotune_worker:
+        # inter-op 스레드는 모델 로드(병렬 작업 시작) 전에 설정해야 함
+        _apply_thread_config(None, args.interop_threads)
+        load_model()
+        result = run_autotune(inter_op_threads=args.interop_threads)
+        with open(args.autotune_output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        sys.exit(0)
+
+    # 워커 모드: 이벤트 루프/결과 수신 스레드가 생기기 전에 forkserver를 시작하여 모델 로드를 앞당김
+    if _worker_mode_enabled():
+        _start_forkserver()
+
+    # 같은 호스트의 파이프라인은 Unix 도메인 소켓으로 연결 (TCP 루프백 스택 생략)
+    uds_path = os.getenv('MODEL_SERVER_UDS')
+    if uds_path:
+        # 이전 실행이 남긴 소켓 파일이 있으면 bind 실패하므로 제거
+        if os.path.exists(uds_path):
+            os.remove(uds_path)
+        os.makedirs(os.path.dirname(os.path.abspath(uds_path)), exist_ok=True)
+
+        logger.info(f"모델 서버를 Unix 소켓 {uds_path}에서 시작합니다...")
+
+        uvicorn.run(
+            app,
+            uds=uds_path,
+            log_config=None,
+            access_log=_log_requests
+        )
+        sys.exit(0)
+
     # 포트 설정
     port = int(os.getenv('MODEL_SERVER_PORT', 8000))
 
@@ -445,5 +1870,6 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        log_config=None,
+        access_log=_log_requests
     )
@@ -0,0 +1,97 @@
+"""
+단계별 실행 시간 집계 스크립트
+main.py --trace 로 누적된 spans.jsonl에서 span 이름별 p50/p95를 출력합니다.
+
+사용법:
+    python scripts/trace_report.py [./data/traces/spans.jsonl] [--since YYYY-MM-DD]
+"""
+
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+from datetime import datetime
+
+
+def percentile(values, q):
+    """정렬된 값 리스트의 q 분위수 (선형 보간)"""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def load_durations(path, since=None):
+    """
+    spans.jsonl에서 span 이름별 소요 시간 로드
+
+    Args:
+        path: spans.jsonl 경로
+        since: 이 시각 이후의 span만 집계 (datetime)
+
+    Returns:
+        tuple: (span 이름 → 소요 시간 리스트, 추적 ID 집합)
+    """
+    durations = defaultdict(list)
+    trace_ids = set()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                span = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if since and span['start'] < since.timestamp():
+                continue
+            if span.get('duration') is None:
+                continue
+            durations[span['name']].append(span['duration'])
+            trace_ids.add(span['trace_id'])
+
+    return durations, trace_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description='단계별 실행 시간 p50/p95 집계')
+    parser.add_argument(
+        'path',
+        nargs='?',
+        default=os.path.join(os.getenv('TRACE_DIR', './data/traces'), 'spans.jsonl'),
+        help='spans.jsonl 경로 (기본값: $TRACE_DIR/spans.jsonl)'
+    )
+    parser.add_argument('--since', type=str, help='집계 시작 날짜 (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"❌ 파일이 없습니다: {args.path}")
+        sys.exit(1)
+
+    since = datetime.strptime(args.since, '%Y-%m-%d') if args.since else None
+    durations, trace_ids = load_durations(args.path, since)
+    if not durations:
+        print("집계할 span이 없습니다.")
+        return
+
+    print(f"📊 실행 {len(trace_ids)}회, span {sum(len(v) for v in durations.values())}개\n")
+    print(f"{'span':<24}{'count':>8}{'p50(ms)':>12}{'p95(ms)':>12}{'max(ms)':>12}")
+    print("-" * 68)
+
+    # 총 소요 시간이 큰 단계부터 출력
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        values.sort()
+        print(
+            f"{name:<24}{len(values):>8}"
+            f"{percentile(values, 0.5) * 1000:>12.1f}"
+            f"{percentile(values, 0.95) * 1000:>12.1f}"
+            f"{values[-1] * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,8 @@
 tb_sensor_statistics 테이블에서 센서 데이터를 조회하는 모듈
 """
 
-from datetime import date, datetime
-from typing import List, Optional, Dict
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -165,6 +165,317 @@ class SensorDataFetcher:
             'avg': float(daily_stats['daily_avg'])
         }
 
+    def get_sites_statistics(
+        self,
+        target_dates: List[date],
+        object_ids: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        여러 날짜/사이트의 시간별 통계를 한 번의 쿼리로 조회
+
+        Args:
+            target_dates: 조회할 날짜 리스트
+            object_ids: 객체 ID 리스트 (None이면 전체)
+
+        Returns:
+            list: object_id/device_id/날짜/field_key/hour별 집계 행 리스트
+                (build_daily_statistics()로 사이트별 데이터 구성)
+        """
+        params = {}
+        date_placeholders = []
+        for i, target_date in enumerate(target_dates):
+            params[f'date_{i}'] = target_date.strftime('%Y-%m-%d')
+            date_placeholders.append(f"%(date_{i})s")
+
+        rows = self._get_grouped_statistics(
+            f"statistics_date IN ({', '.join(date_placeholders)})",
+            params,
+            object_ids=object_ids
+        )
+        logger.info(f"사이트 통합 조회: {len(target_dates)}일, {len(rows)}행")
+        return rows
+
+    def get_range_statistics(
+        self,
+        start_date: date,
+        end_date: date,
+        device_ids: Optional[List[str]] = None,
+        object_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        기간 전체의 시간별 통계를 한 번의 쿼리로 조회 (백필용)
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+            device_ids: 디바이스 ID 리스트 (None이면 전체)
+            object_id: 객체 ID
+
+        Returns:
+            list: get_sites_statistics()와 같은 형식의 집계 행 리스트
+        """
+        params = {
+            'start_date': start_date.strftime('%Y-%m-%d'),
+            'end_date': end_date.strftime('%Y-%m-%d')
+        }
+        rows = self._get_grouped_statistics(
+            "statistics_date BETWEEN %(start_date)s AND %(end_date)s",
+            params,
+            object_ids=[object_id] if object_id else None,
+            device_ids=device_ids
+        )
+        logger.info(f"기간 조회: {start_date} ~ {end_date}, {len(rows)}행")
+        return rows
+
+    def get_changed_hours(
+        self,
+        after_date: Optional[date] = None,
+        after_hour: int = -1,
+        object_ids: Optional[List[str]] = None,
+        object_marks: Optional[Dict[str, Tuple[date, int]]] = None,
+        lookback_hours: int = 0
+    ) -> List[Dict]:
+        """
+        기준 시점(날짜, 시간) 이후의 시간별 통계 목록 조회 (감시 모드용)
+        object_id마다 기준 시점을 따로 두어 다른 객체보다 늦게 들어온 행도 놓치지 않으며,
+        lookback_hours만큼 이전 시간도 다시 반환하여 제자리에서 재계산된 행을 확인할 수 있게 합니다.
+
+        Args:
+            after_date: 기준 날짜 (object_marks에 없는 객체에 적용, None이고 object_marks도 없으면 가장 최근 시점만 조회)
+            after_hour: 기준 시간 (이 시간보다 뒤의 행만 조회)
+            object_ids: 객체 ID 리스트 (None이면 전체)
+            object_marks: object_id → 객체별 기준 시점 (날짜, 시간)
+            lookback_hours: 기준 시점에서 앞당겨 다시 조회할 시간 수
+
+        Returns:
+            list: {'object_id', 'statistics_date', 'hour'} 행 리스트
+        """
+        params: Dict = {}
+        where_conditions = [
+            "field_key IN ('Temperature', 'Humidity')",
+            "period_type = 'HOURLY'"
+        ]
+        object_marks = object_marks or {}
+
+        if after_date is None and not object_marks:
+            # 첫 실행: 기준 시점만 정하기 위해 가장 최근 날짜의 마지막 시간 조회
+            where_conditions.append(
+                "statistics_date = (SELECT MAX(statistics_date) FROM tb_sensor_statistics WHERE period_type = 'HOURLY')"
+            )
+        else:
+            # 객체별 기준 시점 조건 + 기준 시점이 없는 (새) 객체는 공통 기준 시점 조건
+            mark_conditions = []
+            for i, (object_id, (mark_date, mark_hour)) in enumerate(sorted(object_marks.items())):
+                params[f'mark_object_{i}'] = object_id
+                mark_conditions.append(
+                    f"(object_id = %(mark_object_{i})s AND "
+                    f"{self._after_condition(f'mark_{i}', mark_date, mark_hour, lookback_hours, params)})"
+                )
+
+            if after_date is not None:
+                default_condition = self._after_condition('after', after_date, after_hour, lookback_hours, params)
+                if object_marks:
+                    known_placeholders = [f"%(mark_object_{i})s" for i in range(len(object_marks))]
+                    default_condition = f"(object_id NOT IN ({', '.join(known_placeholders)}) AND {default_condition})"
+                mark_conditions.append(default_condition)
+
+            where_conditions.append(f"({' OR '.join(mark_conditions)})")
+
+        if object_ids:
+            object_placeholders = []
+            for i, object_id in enumerate(object_ids):
+                params[f'object_{i}'] = object_id
+                object_placeholders.append(f"%(object_{i})s")
+            where_conditions.append(f"object_id IN ({', '.join(object_placeholders)})")
+
+        query = f"""
+            SELECT DISTINCT object_id, statistics_date, hour
+            FROM tb_sensor_statistics
+            WHERE {" AND ".join(where_conditions)}
+            ORDER BY statistics_date, hour
+        """
+
+        return self.db.execute_query(query, params)
+
+    @staticmethod
+    def _after_condition(name: str, mark_date: date, mark_hour: int, lookback_hours: int, params: Dict) -> str:
+        """
+        (날짜, 시간)이 기준 시점 - lookback_hours 보다 뒤인 행 조건
+
+        Args:
+            name: 쿼리 파라미터 이름 접두사
+            mark_date: 기준 날짜
+            mark_hour: 기준 시간 (-1이면 기준 날짜 전체 포함)
+            lookback_hours: 앞당길 시간 수
+            params: 파라미터를 추가할 쿼리 파라미터 딕셔너리
+
+        Returns:
+            str: WHERE 조건
+        """
+        moment = datetime.combine(mark_date, datetime.min.time()) + timedelta(hours=mark_hour - lookback_hours)
+        params[f'{name}_date'] = moment.strftime('%Y-%m-%d')
+        params[f'{name}_hour'] = moment.hour
+        return (
+            f"(statistics_date > %({name}_date)s OR "
+            f"(statistics_date = %({name}_date)s AND hour > %({name}_hour)s))"
+        )
+
+    def get_hours_statistics(
+        self,
+        target_date: date,
+        hours: List[int],
+        object_ids: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        특정 날짜의 일부 시간만 집계 조회 (감시 모드의 증분 갱신용)
+
+        Args:
+            target_date: 날짜
+            hours: 시간 리스트
+            object_ids: 객체 ID 리스트 (None이면 전체)
+
+        Returns:
+            list: get_sites_statistics()와 같은 형식의 집계 행 리스트
+        """
+        params = {'date': target_date.strftime('%Y-%m-%d')}
+        hour_placeholders = []
+        for i, hour in enumerate(sorted(set(hours))):
+            params[f'hour_{i}'] = hour
+            hour_placeholders.append(f"%(hour_{i})s")
+
+        return self._get_grouped_statistics(
+            f"statistics_date = %(date)s AND hour IN ({', '.join(hour_placeholders)})",
+            params,
+            object_ids=object_ids
+        )
+
+    def _get_grouped_statistics(
+        self,
+        date_condition: str,
+        params: Dict,
+        object_ids: Optional[List[str]] = None,
+        device_ids: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        object_id/device_id/날짜/field_key/hour별 집계 쿼리 실행
+
+        Args:
+            date_condition: 날짜 WHERE 조건
+            params: 쿼리 파라미터 (date_condition의 파라미터 포함)
+            object_ids: 객체 ID 리스트
+            device_ids: 디바이스 ID 리스트
+
+        Returns:
+            list: 집계 행 리스트
+        """
+        where_conditions = [
+            date_condition,
+            "field_key IN ('Temperature', 'Humidity')",
+            "period_type = 'HOURLY'"
+        ]
+
+        if object_ids:
+            object_placeholders = []
+            for i, object_id in enumerate(object_ids):
+                params[f'object_{i}'] = object_id
+                object_placeholders.append(f"%(object_{i})s")
+            where_conditions.append(f"object_id IN ({', '.join(object_placeholders)})")
+
+        if device_ids:
+            device_placeholders = []
+            for i, device_id in enumerate(device_ids):
+                params[f'device_{i}'] = device_id
+                device_placeholders.append(f"%(device_{i})s")
+            where_conditions.append(f"device_id IN ({', '.join(device_placeholders)})")
+
+        where_clause = " AND ".join(where_conditions)
+
+        # 평균은 행 수와 합계로 받아 사이트 단위로 다시 합칠 때 get_daily_statistics()와 같은 값이 되도록 함
+        query = f"""
+            SELECT
+                object_id,
+                device_id,
+                statistics_date,
+                field_key,
+                hour,
+                SUM(avg_value) as sum_avg,
+                COUNT(*) as row_count,
+                MAX(max_value) as max_value,
+                MIN(min_value) as min_value,
+                SUM(count) as total_count
+            FROM tb_sensor_statistics
+            WHERE {where_clause}
+            GROUP BY object_id, device_id, statistics_date, field_key, hour
+        """
+
+        return self.db.execute_query(query, params)
+
+    @staticmethod
+    def build_daily_statistics(
+        rows: List[Dict],
+        target_date: date,
+        device_ids: Optional[List[str]] = None,
+        object_id: Optional[str] = None
+    ) -> Dict:
+        """
+        get_sites_statistics() 결과에서 한 사이트/날짜의 데이터 구성
+
+        Args:
+            rows: get_sites_statistics()의 결과
+            target_date: 날짜
+            device_ids: 디바이스 ID 리스트 (None이면 전체)
+            object_id: 객체 ID
+
+        Returns:
+            dict: get_daily_statistics()와 같은 형식
+        """
+        date_str = target_date.strftime('%Y-%m-%d')
+        device_set = set(device_ids) if device_ids else None
+
+        result = {'date': target_date}
+        for field_key, name in (('Temperature', 'temperature'), ('Humidity', 'humidity')):
+            hours: Dict[int, Dict] = {}
+            for row in rows:
+                if row['field_key'] != field_key or str(row['statistics_date']) != date_str:
+                    continue
+                if object_id and row['object_id'] != object_id:
+                    continue
+                if device_set is not None and row['device_id'] not in device_set:
+                    continue
+
+                hour = hours.setdefault(row['hour'], {
+                    'sum_avg': 0.0, 'row_count': 0, 'max_value': None, 'min_value': None, 'total_count': 0
+                })
+                hour['sum_avg'] += float(row['sum_avg'])
+                hour['row_count'] += int(row['row_count'])
+                hour['total_count'] += int(row['total_count'] or 0)
+                max_value, min_value = float(row['max_value']), float(row['min_value'])
+                hour['max_value'] = max_value if hour['max_value'] is None else max(hour['max_value'], max_value)
+                hour['min_value'] = min_value if hour['min_value'] is None else min(hour['min_value'], min_value)
+
+            if not hours:
+                result[name] = {'hourly_data': [], 'max': 0.0, 'min': 0.0, 'avg': 0.0}
+                continue
+
+            hourly_data = [
+                {
+                    'hour': hour,
+                    'avg_value': stats['sum_avg'] / stats['row_count'],
+                    'max_value': stats['max_value'],
+                    'min_value': stats['min_value'],
+                    'total_count': stats['total_count']
+                }
+                for hour, stats in sorted(hours.items())
+            ]
+            result[name] = {
+                'hourly_data': hourly_data,
+                'max': max(stats['max_value'] for stats in hours.values()),
+                'min': min(stats['min_value'] for stats in hours.values()),
+                'avg': sum(stats['sum_avg'] for stats in hours.values()) / sum(stats['row_count'] for stats in hours.values())
+            }
+
+        return result
+
     def get_available_devices(self, target_date: date) -> Dict[str, List[str]]:
         """
         특정 날짜에 데이터가 있는 디바이스 목록 조회
@@ -2,7 +2,7 @@
 센서 데이터를 분석하여 날씨 지표를 계산하는 모듈
 """
 
-from typing import Dict
+from typing import Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +11,14 @@ logger = logging.getLogger(__name__)
 class WeatherAnalyzer:
     """날씨 데이터 분석 클래스"""
 
+    # analyze_batch()용 카테고리 경계값 (_categorize_* 함수와 동일)
+    TEMP_BINS = [0, 10, 15, 20, 28, 33]
+    TEMP_LABELS = ['한파', '추움', '선선', '쾌적', '적정', '더움', '폭염']
+    HUMIDITY_BINS = [30, 40, 60, 80]
+    HUMIDITY_LABELS = ['매우 건조', '건조', '적정', '습함', '매우 습함']
+    TEMP_DIFF_BINS = [5, 10, 15]
+    TEMP_DIFF_LABELS = ['작음', '보통', '큼', '매우 큼']
+
     def __init__(self, sensor_data: Dict):
         """
         Args:
@@ -83,6 +91,64 @@ class WeatherAnalyzer:
 
         return result
 
+    @classmethod
+    def analyze_batch(cls, sensor_data_list: List[Dict]) -> List[Dict]:
+        """
+        여러 사이트의 센서 데이터를 한 번에 분석 (analyze()의 벡터화 버전)
+
+        Args:
+            sensor_data_list: SensorDataFetcher 형식의 센서 데이터 리스트
+
+        Returns:
+            list: 입력 순서와 같은 analyze() 형식 결과 리스트
+        """
+        if not sensor_data_list:
+            return []
+
+        # numpy는 일괄 분석에서만 필요하므로 단일 실행 시작 시간에 포함하지 않음
+        import numpy as np
+
+        temperature = np.array([
+            [data.get('temperature', {}).get(key, 0) for key in ('max', 'min', 'avg')]
+            for data in sensor_data_list
+        ], dtype=float)
+        humidity = np.array([
+            [data.get('humidity', {}).get(key, 0) for key in ('max', 'min', 'avg')]
+            for data in sensor_data_list
+        ], dtype=float)
+
+        max_temp, min_temp, avg_temp = temperature.T
+        max_humidity, min_humidity, avg_humidity = humidity.T
+        temp_diff = max_temp - min_temp
+        humidity_diff = max_humidity - min_humidity
+        discomfort_index = 0.81 * avg_temp + 0.01 * avg_humidity * (0.99 * avg_temp - 14.3) + 46.3
+
+        temp_category = np.digitize(avg_temp, cls.TEMP_BINS)
+        humidity_category = np.digitize(avg_humidity, cls.HUMIDITY_BINS)
+        temp_diff_category = np.digitize(temp_diff, cls.TEMP_DIFF_BINS)
+
+        # 반올림은 analyze()와 같은 결과가 나오도록 파이썬 round 사용
+        results = []
+        for i, data in enumerate(sensor_data_list):
+            results.append({
+                'max_temp': round(float(max_temp[i]), 1),
+                'min_temp': round(float(min_temp[i]), 1),
+                'temp_diff': round(float(temp_diff[i]), 1),
+                'avg_temp': round(float(avg_temp[i]), 1),
+                'max_humidity': round(float(max_humidity[i]), 1),
+                'min_humidity': round(float(min_humidity[i]), 1),
+                'humidity_diff': round(float(humidity_diff[i]), 1),
+                'avg_humidity': round(float(avg_humidity[i]), 1),
+                'discomfort_index': round(float(discomfort_index[i]), 1),
+                'temp_category': cls.TEMP_LABELS[temp_category[i]],
+                'humidity_category': cls.HUMIDITY_LABELS[humidity_category[i]],
+                'temp_diff_category': cls.TEMP_DIFF_LABELS[temp_diff_category[i]],
+                'date': data.get('date')
+            })
+
+        logger.info(f"일괄 분석 완료: {len(results)}건")
+        return results
+
     @staticmethod
     def _calculate_discomfort_index(temp: float, humidity: float) -> float:
         """
@@ -3,16 +3,13 @@ MariaDB 데이터베이스 연결 관리 모듈
 """
 
 import os
-from dotenv import load_dotenv
 import pymysql
 from pymysql.cursors import DictCursor
 import logging
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from ..tracing import span
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class DatabaseConnection:
@@ -65,6 +62,16 @@ class DatabaseConnection:
             pass
         self._connect()
 
+    def ensure_connection(self):
+        """
+        연결 상태 확인 후 끊겼으면 재연결 (데몬 모드 등 장기 실행 프로세스용)
+        """
+        try:
+            self.connection.ping(reconnect=True)
+        except pymysql.Error as e:
+            logger.warning(f"연결 확인 실패, 재연결 시도: {e}")
+            self.reconnect()
+
     def execute_query(self, query, params=None):
         """
         SELECT 쿼리 실행
@@ -76,23 +83,26 @@ class DatabaseConnection:
         Returns:
             list: 쿼리 결과 (딕셔너리 리스트)
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                result = cursor.fetchall()
-                return result
-        except pymysql.Error as e:
-            logger.error(f"쿼리 실행 실패: {e}")
-            logger.error(f"Query: {query}")
-            # 연결 끊김 시 재연결 시도
-            if e.args[0] in (2006, 2013):  # MySQL server has gone away
+        with span('db.query') as current:
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    result = cursor.fetchall()
+            except pymysql.Error as e:
+                logger.error(f"쿼리 실행 실패: {e}")
+                logger.error(f"Query: {query}")
+                # 연결 끊김 시 재연결 시도
+                if e.args[0] not in (2006, 2013):  # MySQL server has gone away
+                    raise
                 logger.info("재연결 시도 중...")
                 self.reconnect()
                 with self.connection.cursor() as cursor:
                     cursor.execute(query, params)
                     result = cursor.fetchall()
-                    return result
-            raise
+
+            if current is not None:
+                current.attrs['rows'] = len(result)
+            return result
 
     def execute_one(self, query, params=None):
         """
@@ -106,7 +116,7 @@ class DatabaseConnection:
             dict: 단일 쿼리 결과
         """
         try:
-            with self.connection.cursor() as cursor:
+            with span('db.query'), self.connection.cursor() as cursor:
                 cursor.execute(query, params)
                 result = cursor.fetchone()
                 return result
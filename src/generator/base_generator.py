@@ -0,0 +1,564 @@
+"""
+전광판 문구 생성기 공통 모듈
+캐시, 지연 예산, 결과 정제, 규칙 기반 폴백은 모든 생성 백엔드가 공유하고,
+각 백엔드는 _query_api / generate_batch / check_server_health만 구현합니다.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+import logging
+import re
+
+from .prompt_templates import PromptTemplates
+from .message_cache import get_message_cache, comparison_cache_key, display_cache_key
+from ..tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+# 지연 예산 초과 후에도 계속 실행되는 LLM 생성 작업용 스레드 풀
+_budget_executor: Optional[ThreadPoolExecutor] = None
+_budget_executor_lock = threading.Lock()
+
+
+def _get_budget_executor() -> ThreadPoolExecutor:
+    """
+    지연 예산 모드용 공유 스레드 풀 (첫 호출 시 생성)
+    풀에서 대기한 시간도 예산에 포함되므로, 동시 생성 수(MODEL_SERVER_MAX_CONCURRENCY)에
+    예산을 넘겨 계속 실행 중인 작업까지 받을 수 있도록 기본값을 그 두 배로 잡습니다.
+    """
+    global _budget_executor
+
+    with _budget_executor_lock:
+        if _budget_executor is None:
+            default_workers = 2 * int(os.getenv('MODEL_SERVER_MAX_CONCURRENCY', 8))
+            _budget_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv('LATENCY_BUDGET_WORKERS', default_workers)),
+                thread_name_prefix='llm-budget'
+            )
+        return _budget_executor
+
+
+class FallbackMessage(str):
+    """규칙 기반 폴백 문구 (LLM 생성 문구와 구분하기 위한 str)"""
+
+
+def is_fallback(message) -> bool:
+    """
+    생성 결과가 규칙 기반 폴백 문구인지 확인
+
+    Args:
+        message: 생성기가 반환한 문구
+
+    Returns:
+        bool: 폴백 문구면 True (LLM 생성 문구나 캐시된 문구면 False)
+    """
+    return isinstance(message, FallbackMessage)
+
+
+class BaseMessageGenerator:
+    """전광판 문구 생성 공통 클래스 (생성 백엔드는 하위 클래스에서 구현)"""
+
+    def __init__(self):
+        # 입력이 같은 요청은 모델 호출 없이 재사용 (MESSAGE_CACHE_ENABLED=false면 None)
+        self.message_cache = get_message_cache()
+
+    def check_server_health(self, endpoints=None) -> bool:
+        """
+        생성 백엔드 상태 확인
+
+        Returns:
+            bool: 요청을 처리할 수 있으면 True
+        """
+        raise NotImplementedError
+
+    def _query_api(
+        self,
+        prompt: str,
+        max_new_tokens: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> Optional[str]:
+        """
+        프롬프트 하나로 텍스트 생성
+
+        Returns:
+            str: 생성된 텍스트 (실패 시 None)
+        """
+        raise NotImplementedError
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_new_tokens: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        여러 프롬프트를 배치로 생성
+
+        Returns:
+            list: 프롬프트 순서와 같은 생성 텍스트 리스트 (실패한 항목은 None)
+        """
+        raise NotImplementedError
+
+    def generate_message(
+        self,
+        analysis_data: Dict,
+        use_few_shot: bool = True,
+        max_length: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> str:
+        """
+        날씨 분석 데이터를 바탕으로 전광판 문구 생성
+
+        Args:
+            analysis_data: WeatherAnalyzer.analyze()의 결과
+            use_few_shot: Few-shot 예시 포함 여부
+            max_length: 생성할 최대 토큰 수
+            temperature: 생성 다양성
+            top_p: Nucleus sampling
+            repetition_penalty: 반복 방지 패널티
+
+        Returns:
+            str: 생성된 전광판 문구 (실패 시 FallbackMessage)
+        """
+        cache_key = display_cache_key(
+            analysis_data,
+            use_few_shot=use_few_shot,
+            max_length=max_length,
+            temperature=temperature,
+            top_p=top_p,
+            repetition_penalty=repetition_penalty
+        )
+        cached = self._get_cached_message(cache_key)
+        if cached:
+            logger.info(f"✓ 캐시된 문구 사용: {cached}")
+            return cached
+
+        # 프롬프트 생성
+        with span('prompt.build'):
+            if use_few_shot:
+                prompt = PromptTemplates.get_display_message_prompt_with_examples(analysis_data)
+            else:
+                prompt = PromptTemplates.get_display_message_prompt(analysis_data)
+
+        logger.info("문구 생성 시작...")
+
+        # 모델 호출
+        full_output = self._query_api(
+            prompt,
+            max_new_tokens=max_length,
+            temperature=temperature,
+            top_p=top_p,
+            repetition_penalty=repetition_penalty
+        )
+
+        if full_output:
+            # 결과 정제
+            message = self._extract_message(full_output)
+
+            # 메시지가 비어있거나 너무 짧으면 폴백 사용
+            if not message or len(message) < 5:
+                logger.warning(f"생성된 문구가 너무 짧음: '{message}', 폴백 사용")
+                return self._get_fallback_message(analysis_data)
+
+            logger.info(f"✓ 문구 생성 완료: {message}")
+            self._put_cached_message(cache_key, message)
+            return message
+        else:
+            # 생성 실패 시 폴백
+            logger.warning("LLM 생성 실패, 폴백 메시지 사용")
+            return self._get_fallback_message(analysis_data)
+
+    def generate_comparison_message(
+        self,
+        comparison_data: Dict,
+        max_length: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2,
+        latency_budget_ms: Optional[int] = None
+    ) -> str:
+        """
+        어제와 오늘의 온도 비교 데이터를 바탕으로 전광판 문구 생성
+
+        Args:
+            comparison_data: WeatherAnalyzer.compare_two_days()의 결과
+            max_length: 생성할 최대 토큰 수
+            temperature: 생성 다양성
+            top_p: Nucleus sampling
+            repetition_penalty: 반복 방지 패널티
+            latency_budget_ms: 지연 예산 (밀리초, 기본값: 환경변수 LATENCY_BUDGET_MS 또는 0 = 제한 없음)
+                예산 안에 생성이 끝나지 않으면 폴백 문구를 바로 반환하고,
+                LLM 생성은 계속 진행되어 결과가 다음 새로고침을 위해 캐시에 저장됩니다.
+
+        Returns:
+            str: 생성된 전광판 문구 (실패 시 FallbackMessage)
+        """
+        generation_kwargs = dict(
+            max_length=max_length,
+            temperature=temperature,
+            top_p=top_p,
+            repetition_penalty=repetition_penalty
+        )
+
+        # 같은 입력의 이전 문구 (재실행, 입력이 같은 다른 사이트, 예산 초과 후 늦게 완성된 문구)
+        cache_key = comparison_cache_key(comparison_data, **generation_kwargs)
+        cached = self._get_cached_message(cache_key)
+        if cached:
+            logger.info(f"✓ 캐시된 문구 사용: {cached}")
+            return cached
+
+        # 프롬프트 생성
+        with span('prompt.build'):
+            prompt = PromptTemplates.get_temperature_comparison_prompt(comparison_data)
+
+        logger.info("온도 비교 문구 생성 시작...")
+
+        if latency_budget_ms is None:
+            latency_budget_ms = int(os.getenv('LATENCY_BUDGET_MS', 0))
+
+        if latency_budget_ms > 0:
+            future = _get_budget_executor().submit(
+                self._generate_comparison_llm, prompt, **generation_kwargs
+            )
+            try:
+                message = future.result(timeout=latency_budget_ms / 1000)
+            except FutureTimeoutError:
+                logger.warning(f"지연 예산 {latency_budget_ms}ms 초과, 폴백 메시지 사용 (LLM 생성은 계속 진행)")
+                future.add_done_callback(lambda f: self._store_late_message(cache_key, f))
+                return self._get_comparison_fallback_message(comparison_data)
+        else:
+            message = self._generate_comparison_llm(prompt, **generation_kwargs)
+
+        if message:
+            self._put_cached_message(cache_key, message)
+            return message
+
+        return self._get_comparison_fallback_message(comparison_data)
+
+    def _generate_comparison_llm(
+        self,
+        prompt: str,
+        max_length: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> Optional[str]:
+        """
+        온도 비교 프롬프트로 모델을 호출하고 문구를 추출합니다.
+
+        Returns:
+            str: 추출된 문구 (API 실패 또는 너무 짧은 경우 None)
+        """
+        # API 호출
+        full_output = self._query_api(
+            prompt,
+            max_new_tokens=max_length,
+            temperature=temperature,
+            top_p=top_p,
+            repetition_penalty=repetition_penalty
+        )
+
+        if full_output:
+            # 결과 정제
+            message = self._extract_message(full_output)
+
+            # 메시지가 비어있거나 너무 짧으면 폴백 사용
+            if not message or len(message) < 5:
+                logger.warning(f"생성된 문구가 너무 짧음: '{message}', 폴백 사용")
+                return None
+
+            logger.info(f"✓ 온도 비교 문구 생성 완료: {message}")
+            return message
+        else:
+            # 생성 실패 시 폴백
+            logger.warning("LLM 생성 실패, 폴백 메시지 사용")
+            return None
+
+    def generate_messages(
+        self,
+        analysis_list: List[Dict],
+        use_few_shot: bool = True,
+        max_length: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> List[str]:
+        """
+        여러 날씨 분석 데이터의 문구를 배치로 생성 (캐시에 있는 항목은 생성 생략)
+
+        Args:
+            analysis_list: WeatherAnalyzer.analyze() 결과 리스트
+            use_few_shot: Few-shot 예시 포함 여부
+            max_length: 생성할 최대 토큰 수
+            temperature: 생성 다양성
+            top_p: Nucleus sampling
+            repetition_penalty: 반복 방지 패널티
+
+        Returns:
+            list: 입력 순서와 같은 문구 리스트 (실패 시 FallbackMessage)
+        """
+        cache_keys = [
+            display_cache_key(
+                analysis_data,
+                use_few_shot=use_few_shot,
+                max_length=max_length,
+                temperature=temperature,
+                top_p=top_p,
+                repetition_penalty=repetition_penalty
+            )
+            for analysis_data in analysis_list
+        ]
+        messages: List[Optional[str]] = [self._get_cached_message(key) for key in cache_keys]
+
+        # 캐시에 없는 항목만 배치 생성
+        missing = [i for i, message in enumerate(messages) if not message]
+        if missing:
+            if use_few_shot:
+                prompts = [PromptTemplates.get_display_message_prompt_with_examples(analysis_list[i]) for i in missing]
+            else:
+                prompts = [PromptTemplates.get_display_message_prompt(analysis_list[i]) for i in missing]
+            outputs = self.generate_batch(
+                prompts,
+                max_new_tokens=max_length,
+                temperature=temperature,
+                top_p=top_p,
+                repetition_penalty=repetition_penalty
+            )
+            for i, output in zip(missing, outputs):
+                message = self._extract_message(output) if output else None
+                if not message or len(message) < 5:
+                    message = self._get_fallback_message(analysis_list[i])
+                else:
+                    self._put_cached_message(cache_keys[i], message)
+                messages[i] = message
+
+        logger.info(f"캐시 적중 {len(analysis_list) - len(missing)}/{len(analysis_list)}")
+        return messages
+
+    def generate_comparison_messages(
+        self,
+        comparison_list: List[Dict],
+        max_length: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> List[str]:
+        """
+        여러 온도 비교 데이터의 문구를 배치로 생성 (캐시에 있는 항목은 생성 생략)
+
+        Args:
+            comparison_list: WeatherAnalyzer.compare_two_days() 결과 리스트
+            max_length: 생성할 최대 토큰 수
+            temperature: 생성 다양성
+            top_p: Nucleus sampling
+            repetition_penalty: 반복 방지 패널티
+
+        Returns:
+            list: 입력 순서와 같은 문구 리스트 (실패 시 FallbackMessage)
+        """
+        cache_keys = [
+            comparison_cache_key(
+                comparison_data,
+                max_length=max_length,
+                temperature=temperature,
+                top_p=top_p,
+                repetition_penalty=repetition_penalty
+            )
+            for comparison_data in comparison_list
+        ]
+        messages: List[Optional[str]] = [self._get_cached_message(key) for key in cache_keys]
+
+        # 캐시에 없는 항목만 배치 생성
+        missing = [i for i, message in enumerate(messages) if not message]
+        if missing:
+            outputs = self.generate_batch(
+                [PromptTemplates.get_temperature_comparison_prompt(comparison_list[i]) for i in missing],
+                max_new_tokens=max_length,
+                temperature=temperature,
+                top_p=top_p,
+                repetition_penalty=repetition_penalty
+            )
+            for i, output in zip(missing, outputs):
+                message = self._extract_message(output) if output else None
+                if not message or len(message) < 5:
+                    message = self._get_comparison_fallback_message(comparison_list[i])
+                else:
+                    self._put_cached_message(cache_keys[i], message)
+                messages[i] = message
+
+        logger.info(f"캐시 적중 {len(comparison_list) - len(missing)}/{len(comparison_list)}")
+        return messages
+
+    def _get_cached_message(self, cache_key: str) -> Optional[str]:
+        """캐시된 문구 조회 (캐시 비활성화 시 None)"""
+        return self.message_cache.get(cache_key) if self.message_cache is not None else None
+
+    def _put_cached_message(self, cache_key: str, message: str):
+        """LLM 문구를 캐시에 저장"""
+        if self.message_cache is not None:
+            self.message_cache.put(cache_key, message)
+
+    def _store_late_message(self, cache_key: str, future):
+        """
+        지연 예산을 넘겨 늦게 완성된 LLM 문구를 문구 캐시에 저장합니다.
+        폴백 문구는 실행 상태에 기록되지 않으므로 같은 입력의 다음 실행이 캐시에서 이 문구를 사용합니다.
+
+        Args:
+            cache_key: 문구 캐시 키
+            future: 완료된 생성 작업
+        """
+        try:
+            message = future.result()
+        except Exception as e:
+            logger.warning(f"늦은 LLM 생성 실패: {e}")
+            return
+
+        if not message:
+            return
+
+        if self.message_cache is None:
+            logger.warning(f"⚠️  문구 캐시가 꺼져 있어 늦게 완성된 LLM 문구를 재사용할 수 없습니다: {message}")
+            return
+
+        self._put_cached_message(cache_key, message)
+        logger.info(f"✓ 늦게 완성된 LLM 문구 캐시 저장 (다음 새로고침에서 사용): {message}")
+
+    @staticmethod
+    def _extract_message(full_output: str) -> str:
+        """
+        생성된 텍스트에서 전광판 문구만 추출
+
+        Args:
+            full_output: 모델이 생성한 전체 텍스트
+
+        Returns:
+            str: 추출된 전광판 문구
+        """
+        # 첫 번째 문장만 추출
+        sentences = re.split(r'[.!?]\s*', full_output)
+        if sentences:
+            message = sentences[0].strip()
+        else:
+            message = full_output.strip()
+
+        # 따옴표 제거
+        message = message.strip('"\'')
+
+        # 길이 제한
+        max_msg_length = int(os.getenv('MAX_MESSAGE_LENGTH', 70))
+        if len(message) > max_msg_length:
+            message = message[:max_msg_length]
+
+        return message
+
+    @staticmethod
+    def _get_fallback_message(analysis_data: Dict) -> FallbackMessage:
+        """
+        LLM 생성 실패 시 규칙 기반 폴백 메시지
+
+        Args:
+            analysis_data: 날씨 분석 데이터
+
+        Returns:
+            FallbackMessage: 폴백 메시지
+        """
+        temp_diff = analysis_data['temp_diff']
+        avg_temp = analysis_data['avg_temp']
+        avg_humidity = analysis_data['avg_humidity']
+
+        # 규칙 기반 메시지 생성
+        if temp_diff >= 15:
+            return FallbackMessage(f"일교차가 {temp_diff:.0f}도로 매우 큽니다. 건강 관리 유의하세요!")
+        elif temp_diff >= 10:
+            return FallbackMessage(f"오늘 일교차가 {temp_diff:.0f}도로 큽니다. 외출 시 겉옷을 챙기세요!")
+        elif avg_temp >= 33:
+            return FallbackMessage(f"폭염 주의! 충분한 수분 섭취와 무리한 야외활동 자제하세요.")
+        elif avg_temp >= 28:
+            return FallbackMessage(f"더운 날씨가 계속됩니다. 충분한 수분 섭취하세요!")
+        elif avg_temp < 0:
+            return FallbackMessage(f"한파 주의! 따뜻하게 입고 외출하세요.")
+        elif avg_temp < 10:
+            return FallbackMessage(f"쌀쌀한 날씨입니다. 따뜻하게 입고 외출하세요.")
+        elif avg_humidity < 30:
+            return FallbackMessage(f"건조한 날씨입니다. 수분 섭취와 보습에 신경 쓰세요.")
+        elif avg_humidity >= 80:
+            return FallbackMessage(f"습한 날씨입니다. 실내 환기에 유의하세요.")
+        else:
+            return FallbackMessage(f"오늘 최저 {analysis_data['min_temp']:.0f}°C, 최고 {analysis_data['max_temp']:.0f}°C입니다. 좋은 하루 보내세요!")
+
+    @staticmethod
+    def _get_comparison_fallback_message(comparison_data: Dict) -> FallbackMessage:
+        """
+        온도 비교 문구 생성 실패 시 규칙 기반 폴백 메시지
+
+        Args:
+            comparison_data: 온도 비교 데이터
+
+        Returns:
+            FallbackMessage: 폴백 메시지
+        """
+        yesterday_avg = comparison_data['yesterday_avg_temp']
+        today_avg = comparison_data['today_avg_temp']
+        temp_change = comparison_data['temp_change']
+        direction = comparison_data['temp_change_direction']
+        today_data = comparison_data['today_analysis']
+        temp_diff = today_data['temp_diff']
+
+        # 일교차가 매우 큰 경우 우선 처리
+        if temp_diff >= 15:
+            return FallbackMessage(f"일교차가 {temp_diff:.0f}도로 매우 큽니다. 겉옷 꼭 챙기세요!")
+        elif temp_diff >= 10:
+            return FallbackMessage(f"일교차 {temp_diff:.0f}도. 아침저녁으로 쌀쌀하니 겉옷 챙기세요!")
+
+        # 온도 변화에 따른 메시지
+        if abs(temp_change) < 1:
+            return FallbackMessage(f"어제와 비슷한 날씨입니다. 좋은 하루 보내세요!")
+        elif direction == '상승':
+            if temp_change >= 5:
+                return FallbackMessage(f"어제보다 {abs(temp_change):.1f}도 높아졌습니다. 가볍게 입으세요!")
+            else:
+                return FallbackMessage(f"어제보다 조금 따뜻합니다. 좋은 하루 되세요!")
+        else:  # 하강
+            if abs(temp_change) >= 5:
+                return FallbackMessage(f"어제보다 {abs(temp_change):.1f}도 낮습니다. 따뜻하게 입으세요!")
+            else:
+                return FallbackMessage(f"어제보다 조금 선선합니다. 건강 유의하세요!")
+
+    def generate_multiple_messages(
+        self,
+        analysis_data: Dict,
+        num_messages: int = 3
+    ) -> list:
+        """
+        여러 개의 문구를 생성하여 선택할 수 있도록 함
+
+        Args:
+            analysis_data: 날씨 분석 데이터
+            num_messages: 생성할 문구 개수
+
+        Returns:
+            list: 생성된 문구 리스트
+        """
+        messages = []
+        for i in range(num_messages):
+            # temperature를 약간씩 조정하여 다양한 문구 생성
+            temp = 0.4 + (i * 0.15)
+            message = self.generate_message(
+                analysis_data,
+                use_few_shot=True,
+                temperature=temp
+            )
+            messages.append(message)
+            logger.info(f"문구 {i+1}/{num_messages}: {message}")
+
+        return messages
@@ -0,0 +1,158 @@
+"""
+모델 서버 호출용 서킷 브레이커 모듈
+연속 실패 시 회로를 열어 네트워크 대기 없이 바로 폴백을 사용하고,
+백그라운드 프로브가 서버 복구를 확인하면 다시 닫습니다.
+"""
+
+import os
+import time
+import threading
+from typing import Callable, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 서버 URL별 공유 서킷 브레이커
+_breakers: Dict[str, 'CircuitBreaker'] = {}
+_breakers_lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 클래스"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        probe: Callable[[], bool],
+        failure_threshold: Optional[int] = None,
+        probe_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            name: 브레이커 이름 (로그 표시용, 보통 서버 URL)
+            probe: 서버 복구 여부를 확인하는 함수 (복구 시 True)
+            failure_threshold: 회로를 여는 연속 실패 횟수 (기본값: 환경변수 CIRCUIT_FAILURE_THRESHOLD 또는 3)
+            probe_interval: 회로가 열린 동안 프로브 간격 (초, 기본값: 환경변수 CIRCUIT_PROBE_INTERVAL 또는 10)
+        """
+        self.name = name
+        self.probe = probe
+        self.failure_threshold = failure_threshold or int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 3))
+        self.probe_interval = probe_interval or float(os.getenv('CIRCUIT_PROBE_INTERVAL', 10))
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_health_check: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._probe_thread: Optional[threading.Thread] = None
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인 (회로가 닫혀 있을 때만 True)"""
+        return self.state == self.CLOSED
+
+    def claim_initial_check(self) -> bool:
+        """
+        회로가 닫혀 있고 아직 헬스 체크를 하지 않았다면 확인 시각을 기록하고 True 반환
+        여러 생성기가 동시에 초기화되어도 한 곳에서만 시작 시 헬스 체크를 하도록 확인과 기록을 함께 처리합니다.
+        """
+        with self._lock:
+            if self.state != self.CLOSED or self.last_health_check is not None:
+                return False
+            self.last_health_check = time.time()
+            return True
+
+    def record_success(self):
+        """요청 성공 기록"""
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                self._close()
+
+    def record_failure(self):
+        """요청 실패 기록 (연속 실패가 임계값에 도달하면 회로를 엶)"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self):
+        """실패 횟수와 관계없이 회로를 엽니다 (헬스 체크 실패 등)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                self._open()
+
+    def _open(self):
+        """회로를 열고 백그라운드 프로브를 시작합니다 (락 보유 상태에서 호출)"""
+        self.state = self.OPEN
+        self.opened_at = time.time()
+        logger.warning(f"⚠️  서킷 브레이커 열림: {self.name} (이후 요청은 바로 폴백 사용)")
+
+        if self._probe_thread is None or not self._probe_thread.is_alive():
+            self._probe_thread = threading.Thread(
+                target=self._probe_loop,
+                name=f"circuit-probe-{self.name}",
+                daemon=True
+            )
+            self._probe_thread.start()
+
+    def _close(self):
+        """회로를 닫습니다 (락 보유 상태에서 호출)"""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        logger.info(f"✓ 서킷 브레이커 닫힘: {self.name} (서버 복구)")
+
+    def _probe_loop(self):
+        """회로가 닫힐 때까지 주기적으로 서버 상태를 확인합니다 (half-open 프로브)"""
+        while self.state != self.CLOSED:
+            time.sleep(self.probe_interval)
+
+            with self._lock:
+                if self.state == self.CLOSED:
+                    break
+                self.state = self.HALF_OPEN
+
+            try:
+                recovered = self.probe()
+            except Exception:
+                recovered = False
+
+            with self._lock:
+                self.last_health_check = time.time()
+                if recovered:
+                    self._close()
+                elif self.state == self.HALF_OPEN:
+                    self.state = self.OPEN
+
+    def status(self) -> Dict:
+        """브레이커 상태 요약"""
+        return {
+            'name': self.name,
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'opened_at': self.opened_at
+        }
+
+
+def get_circuit_breaker(name: str, probe: Callable[[], bool]) -> CircuitBreaker:
+    """
+    이름(서버 URL)별 공유 서킷 브레이커 반환 (없으면 생성)
+
+    Args:
+        name: 브레이커 이름
+        probe: 서버 복구 확인 함수 (처음 생성할 때만 사용)
+
+    Returns:
+        CircuitBreaker: 공유 브레이커
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, probe)
+            _breakers[name] = breaker
+        return breaker
@@ -0,0 +1,156 @@
+"""
+여러 모델 서버에 요청을 분산하는 엔드포인트 풀 모듈
+진행 중 요청 수가 가장 적고 지연 시간 EWMA가 낮은 서버를 선택합니다.
+"""
+
+import os
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .http_session import normalize_server_url, get_unix_socket_path
+
+logger = logging.getLogger(__name__)
+
+# URL 목록별 공유 엔드포인트 풀 (장기 실행 프로세스에서 지연 통계 유지)
+_pools: Dict[Tuple[str, ...], 'EndpointPool'] = {}
+_pools_lock = threading.Lock()
+
+
+def parse_server_urls(server_url: Optional[str]) -> List[str]:
+    """
+    쉼표로 구분된 서버 URL 문자열을 리스트로 변환
+
+    Args:
+        server_url: 'http://a:8000,unix:///tmp/kormo.sock' 형식 문자열
+
+    Returns:
+        list: 끝의 '/'를 제거한 URL 리스트 (unix:// 는 http+unix:// 로 변환)
+    """
+    return [
+        normalize_server_url(url.strip().rstrip('/'))
+        for url in (server_url or '').split(',') if url.strip()
+    ]
+
+
+class Endpoint:
+    """모델 서버 하나의 상태 (진행 중 요청 수, 지연 시간 통계, 서킷 브레이커)"""
+
+    def __init__(self, url: str, breaker: CircuitBreaker, ewma_alpha: float):
+        self.url = url
+        self.generate_url = f"{url}/generate"
+        self.health_url = f"{url}/health"
+        self.socket_path = get_unix_socket_path(url)
+        self.breaker = breaker
+        self.ewma_alpha = ewma_alpha
+
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.latencies = deque(maxlen=int(os.getenv('ENDPOINT_LATENCY_WINDOW', 200)))
+
+    def p95_latency(self, min_samples: int = 10) -> Optional[float]:
+        """최근 성공 요청의 p95 지연 시간 (표본이 부족하면 None)"""
+        if len(self.latencies) < min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def status(self) -> Dict:
+        """엔드포인트 상태 요약"""
+        return {
+            'url': self.url,
+            'outstanding': self.outstanding,
+            'ewma_latency': self.ewma_latency,
+            'p95_latency': self.p95_latency(),
+            'breaker': self.breaker.state
+        }
+
+
+class EndpointPool:
+    """최소 진행 요청 + 지연 시간 EWMA 기반 모델 서버 선택 클래스"""
+
+    def __init__(self, urls: List[str], probe_factory: Callable[[str], Callable[[], bool]]):
+        """
+        Args:
+            urls: 모델 서버 URL 리스트
+            probe_factory: health URL을 받아 서킷 브레이커 프로브 함수를 만드는 함수
+        """
+        ewma_alpha = float(os.getenv('ENDPOINT_EWMA_ALPHA', 0.3))
+        self.endpoints = [
+            Endpoint(url, get_circuit_breaker(url, probe_factory(f"{url}/health")), ewma_alpha)
+            for url in urls
+        ]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def pick(self, exclude: Optional[Endpoint] = None) -> Optional[Endpoint]:
+        """
+        요청을 보낼 엔드포인트 선택 (회로가 닫힌 서버 중 진행 요청 수, EWMA 순)
+
+        Args:
+            exclude: 제외할 엔드포인트 (헤지 요청 시 첫 번째 서버)
+
+        Returns:
+            Endpoint: 선택된 엔드포인트 (사용 가능한 서버가 없으면 None)
+        """
+        with self._lock:
+            candidates = [
+                ep for ep in self.endpoints
+                if ep is not exclude and ep.breaker.allow_request()
+            ]
+            if not candidates:
+                return None
+            # 지연 기록이 없는 서버는 우선 시도하여 통계를 쌓음
+            return min(candidates, key=lambda ep: (ep.outstanding, ep.ewma_latency or 0.0))
+
+    def begin(self, endpoint: Endpoint):
+        """요청 시작 기록"""
+        with self._lock:
+            endpoint.outstanding += 1
+
+    def end(self, endpoint: Endpoint, latency: Optional[float] = None):
+        """
+        요청 종료 기록
+
+        Args:
+            endpoint: 요청을 보낸 엔드포인트
+            latency: 성공한 요청의 지연 시간 (초, 실패 시 None)
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if latency is not None:
+                endpoint.latencies.append(latency)
+                if endpoint.ewma_latency is None:
+                    endpoint.ewma_latency = latency
+                else:
+                    endpoint.ewma_latency = (
+                        endpoint.ewma_alpha * latency + (1 - endpoint.ewma_alpha) * endpoint.ewma_latency
+                    )
+
+    def status(self) -> List[Dict]:
+        """전체 엔드포인트 상태"""
+        return [ep.status() for ep in self.endpoints]
+
+
+def get_endpoint_pool(urls: List[str], probe_factory: Callable[[str], Callable[[], bool]]) -> EndpointPool:
+    """
+    URL 목록별 공유 엔드포인트 풀 반환 (없으면 생성)
+
+    Args:
+        urls: 모델 서버 URL 리스트
+        probe_factory: 서킷 브레이커 프로브 생성 함수
+
+    Returns:
+        EndpointPool: 공유 풀
+    """
+    key = tuple(urls)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = EndpointPool(urls, probe_factory)
+            _pools[key] = pool
+        return pool
@@ -0,0 +1,216 @@
+"""
+모델 서버 호출용 공유 HTTP 세션 관리 모듈
+keep-alive 연결 풀을 프로세스 내 모든 생성기 인스턴스가 함께 사용합니다.
+"""
+
+import os
+import random
+import socket
+import threading
+from typing import Dict, Optional
+from urllib.parse import quote, unquote, urlparse
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+from ..tracing import current_trace_id
+
+# 선택: msgpack 바이너리 응답 (설치되어 있으면 서버에 요청)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# 풀 크기별 공유 세션 (장기 실행 프로세스에서 재사용)
+_shared_sessions: Dict[int, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def normalize_server_url(url: str) -> str:
+    """
+    unix:///path/to.sock 형식을 requests가 처리할 수 있는 http+unix:// URL로 변환
+
+    Args:
+        url: 서버 URL (http://, https:// 또는 unix://)
+
+    Returns:
+        str: 변환된 URL (unix:// 가 아니면 그대로)
+    """
+    if url.startswith('unix://'):
+        return 'http+unix://' + quote(url[len('unix://'):], safe='')
+    return url
+
+
+def get_unix_socket_path(url: str) -> Optional[str]:
+    """http+unix:// URL의 소켓 경로 (다른 스킴이면 None)"""
+    if url.startswith('http+unix://'):
+        return unquote(urlparse(url).netloc)
+    return None
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """TCP 대신 Unix 도메인 소켓으로 연결하는 HTTP 연결"""
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__('localhost', **kwargs)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    """Unix 도메인 소켓 연결 풀 (keep-alive 연결 재사용)"""
+
+    def __init__(self, socket_path: str, maxsize: int):
+        super().__init__('localhost', maxsize=maxsize)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        return _UnixHTTPConnection(self.socket_path, timeout=self.timeout.connect_timeout)
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """http+unix:// URL을 Unix 도메인 소켓으로 보내는 requests 어댑터"""
+
+    def __init__(self, pool_size: int):
+        self._unix_pool_size = pool_size
+        self._unix_pools: Dict[str, _UnixHTTPConnectionPool] = {}
+        self._unix_pools_lock = threading.Lock()
+        super().__init__(max_retries=0)
+
+    def get_connection(self, url, proxies=None):
+        socket_path = get_unix_socket_path(url)
+        with self._unix_pools_lock:
+            pool = self._unix_pools.get(socket_path)
+            if pool is None:
+                pool = _UnixHTTPConnectionPool(socket_path, self._unix_pool_size)
+                self._unix_pools[socket_path] = pool
+            return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        # requests 2.32+ 에서 사용하는 연결 조회 경로
+        return self.get_connection(request.url, proxies)
+
+    def request_url(self, request, proxies):
+        return request.path_url
+
+    def close(self):
+        with self._unix_pools_lock:
+            for pool in self._unix_pools.values():
+                pool.close()
+            self._unix_pools.clear()
+        super().close()
+
+
+def get_default_pool_size() -> int:
+    """환경변수 MODEL_SERVER_POOL_SIZE 값 (기본값: 10)"""
+    return int(os.getenv('MODEL_SERVER_POOL_SIZE', 10))
+
+
+def create_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    keep-alive 연결 풀을 가진 새 세션 생성
+
+    Args:
+        pool_size: 호스트당 유지할 최대 연결 수 (기본값: MODEL_SERVER_POOL_SIZE)
+
+    Returns:
+        requests.Session: 연결 풀이 설정된 세션
+    """
+    pool_size = pool_size or get_default_pool_size()
+
+    session = requests.Session()
+    # 재시도는 호출 측에서 503 상태를 보고 직접 처리
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # 같은 호스트의 모델 서버는 Unix 도메인 소켓으로 연결 가능 (unix:///path/to.sock)
+    session.mount('http+unix://', UnixSocketAdapter(pool_size))
+
+    return session
+
+
+def get_shared_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    프로세스 전체에서 공유하는 세션 반환 (없으면 생성)
+
+    Args:
+        pool_size: 연결 풀 크기 (기본값: MODEL_SERVER_POOL_SIZE)
+
+    Returns:
+        requests.Session: 공유 세션
+    """
+    pool_size = pool_size or get_default_pool_size()
+
+    with _sessions_lock:
+        session = _shared_sessions.get(pool_size)
+        if session is None:
+            session = create_session(pool_size)
+            _shared_sessions[pool_size] = session
+            logger.debug(f"공유 HTTP 세션 생성 (풀 크기: {pool_size})")
+        return session
+
+
+def close_shared_sessions():
+    """공유 세션의 연결을 모두 닫습니다 (프로세스 종료 시)"""
+    with _sessions_lock:
+        for session in _shared_sessions.values():
+            session.close()
+        _shared_sessions.clear()
+
+
+def get_backoff_delay(attempt: int, base: float, max_delay: float = 10.0) -> float:
+    """
+    지수 백오프 + full jitter 대기 시간 계산
+
+    Args:
+        attempt: 재시도 횟수 (0부터 시작)
+        base: 기본 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    return random.uniform(0, min(max_delay, base * (2 ** attempt)))
+
+
+def get_generate_headers() -> Dict[str, str]:
+    """
+    생성 요청 헤더 (prompt 에코 없는 slim 응답, msgpack 설치 시 바이너리 응답 요청, 추적 ID)
+    구버전 서버는 헤더를 무시하고 기존 JSON으로 응답합니다.
+    """
+    headers = {'X-Response-Mode': 'slim'}
+    if msgpack is not None:
+        headers['Accept'] = 'application/msgpack, application/json'
+
+    # 추적 중이면 서버 로그와 연결할 수 있도록 추적 ID 전달
+    trace_id = current_trace_id()
+    if trace_id:
+        headers['X-Trace-Id'] = trace_id
+    return headers
+
+
+def decode_response(response) -> Dict:
+    """
+    Content-Type에 따라 응답 본문을 디코딩
+
+    Args:
+        response: HTTP 응답
+
+    Returns:
+        dict: 응답 데이터
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if msgpack is not None and content_type.startswith('application/msgpack'):
+        return msgpack.unpackb(response.content, raw=False)
+    return response.json()
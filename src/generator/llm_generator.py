@@ -0,0 +1,114 @@
+"""
+프로세스 내 모델 직접 로드 방식의 문구 생성 모듈
+model_server.py의 모델 로드/생성/배치 코드를 그대로 사용하며 HTTP를 거치지 않습니다.
+같은 호스트에서 실행하는 백필/평가 작업용입니다.
+"""
+
+from typing import List, Optional
+import logging
+
+from .base_generator import BaseMessageGenerator
+from ..tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class MessageGenerator(BaseMessageGenerator):
+    """프로세스 내 모델 기반 전광판 문구 생성 클래스 (USE_MODEL_SERVER=false)"""
+
+    def __init__(self, warmup: Optional[bool] = None):
+        """
+        Args:
+            warmup: 로드 후 워밍업 실행 여부 (기본값: 환경변수 WARMUP_ENABLED 설정을 따름)
+        """
+        super().__init__()
+
+        # torch/transformers는 이 백엔드를 선택한 경우에만 import
+        import model_server
+
+        self._server = model_server
+        # 모델은 하나뿐이므로 지연 예산 작업 등 여러 스레드의 토큰화/생성을 직렬화
+        self._model_lock = model_server.generation_lock
+
+        logger.info("직접 모델 로드 모드로 초기화")
+        model_server.apply_tuned_config()
+        model_server.load_model()
+
+        if warmup is None or warmup:
+            model_server.run_warmup()
+
+    def check_server_health(self, endpoints=None) -> bool:
+        """모델 로드 상태 확인"""
+        return self._server.model_loaded
+
+    def _query_api(
+        self,
+        prompt: str,
+        max_new_tokens: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2
+    ) -> Optional[str]:
+        """
+        로드된 모델로 직접 텍스트 생성
+
+        Returns:
+            str: 생성된 텍스트 (실패 시 None)
+        """
+        try:
+            with span('server.generate'), self._model_lock:
+                return self._server._run_generation(
+                    prompt,
+                    max_new_tokens=max_new_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    repetition_penalty=repetition_penalty
+                )
+        except Exception as e:
+            logger.error(f"모델 생성 실패: {e}", exc_info=True)
+            return None
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_new_tokens: int = 50,
+        temperature: float = 0.5,
+        top_p: float = 0.85,
+        repetition_penalty: float = 1.2,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        여러 프롬프트를 배치로 나누어 직접 생성
+
+        Args:
+            prompts: 입력 프롬프트 리스트
+            max_new_tokens: 최대 생성 토큰 수
+            temperature: 생성 다양성
+            top_p: Nucleus sampling
+            repetition_penalty: 반복 방지 패널티
+            batch_size: 배치 크기 (기본값: 튜닝된 model_server.max_batch_size)
+
+        Returns:
+            list: 프롬프트 순서와 같은 생성 텍스트 리스트 (실패한 배치는 None)
+        """
+        batch_size = batch_size or self._server.max_batch_size
+        results: List[Optional[str]] = []
+
+        for i in range(0, len(prompts), batch_size):
+            chunk = prompts[i:i + batch_size]
+            try:
+                with span('server.generate_batch', prompts=len(chunk)), self._model_lock:
+                    results.extend(self._server._run_batch_generation(
+                        chunk,
+                        max_new_tokens=max_new_tokens,
+                        temperature=temperature,
+                        top_p=top_p,
+                        repetition_penalty=repetition_penalty
+                    ))
+            except Exception as e:
+                logger.error(f"배치 생성 실패 ({i}~{i + len(chunk) - 1}): {e}", exc_info=True)
+                results.extend([None] * len(chunk))
+
+            logger.info(f"배치 생성 진행: {min(i + batch_size, len(prompts))}/{len(prompts)}")
+
+        return results
@@ -4,66 +4,178 @@ model_server.py가 실행 중이어야 합니다.
 """
 
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from dotenv import load_dotenv
 import requests
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
-import re
 
-from .prompt_templates import PromptTemplates
+from .base_generator import BaseMessageGenerator
+from .http_session import get_shared_session, get_backoff_delay, get_generate_headers, decode_response
+from .endpoint_pool import Endpoint, get_endpoint_pool, parse_server_urls
+from ..tracing import span, record
 
 logger = logging.getLogger(__name__)
 load_dotenv()
 
 
-class MessageGeneratorLocalAPI:
+# 헤지(중복) 요청용 스레드 풀 (지연 예산 작업 안에서도 호출되므로 별도 풀 사용)
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    """헤지 요청용 공유 스레드 풀 (첫 호출 시 생성)"""
+    global _hedge_executor
+
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv('HEDGE_WORKERS', 8)),
+                thread_name_prefix='llm-hedge'
+            )
+        return _hedge_executor
+
+
+def _server_state(health: Dict) -> Optional[str]:
+    """/health 응답의 세부 상태 (state 필드가 없는 이전 서버는 status 사용)"""
+    return health.get('state', health.get('status'))
+
+
+def probe_server_ready(session: requests.Session, health_url: str) -> bool:
+    """
+    서킷 브레이커 프로브: 서버가 요청을 처리할 수 있는지 로그 없이 확인
+
+    Args:
+        session: HTTP 세션
+        health_url: 서버 /health URL
+
+    Returns:
+        bool: 요청 처리 가능 여부
+    """
+    try:
+        response = session.get(health_url, timeout=(2, 5))
+        if response.status_code != 200:
+            return False
+        data = response.json()
+        # 유휴 언로드 상태는 첫 요청에서 복원되므로 복구로 간주
+        return bool(data.get('ready', data.get('model_loaded'))) or _server_state(data) == 'idle'
+    except Exception:
+        return False
+
+
+class MessageGeneratorLocalAPI(BaseMessageGenerator):
     """로컬 모델 서버 API 기반 전광판 문구 생성 클래스"""
 
     def __init__(
         self,
         server_url: Optional[str] = None,
-        timeout: int = 120
+        timeout: int = 120,
+        session: Optional[requests.Session] = None,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        hedge_requests: Optional[bool] = None
     ):
         """
         Args:
-            server_url: 모델 서버 URL (기본값: 환경변수 또는 http://localhost:8000)
+            server_url: 모델 서버 URL, 쉼표로 여러 대 지정 가능 (기본값: 환경변수 또는 http://localhost:8000)
             timeout: API 타임아웃 (초)
+            session: 사용할 HTTP 세션 (기본값: 프로세스 공유 keep-alive 세션)
+            pool_size: 공유 세션 연결 풀 크기 (기본값: 환경변수 MODEL_SERVER_POOL_SIZE 또는 10)
+            max_retries: 503 (모델 로딩 중) 응답 시 재시도 횟수 (기본값: 환경변수 MODEL_SERVER_MAX_RETRIES 또는 3)
+            retry_backoff: 재시도 기본 대기 시간 (초, 기본값: 환경변수 MODEL_SERVER_RETRY_BACKOFF 또는 1.0)
+            hedge_requests: 첫 서버가 p95보다 느리면 다른 서버에 중복 요청 (기본값: 환경변수 HEDGE_REQUESTS 또는 false)
         """
-        self.server_url = server_url or os.getenv(
+        super().__init__()
+
+        self.server_urls = parse_server_urls(server_url or os.getenv(
             'MODEL_SERVER_URL',
             'http://localhost:8000'
-        )
+        ))
+        self.server_url = self.server_urls[0]
         self.timeout = timeout
+        self.session = session or get_shared_session(pool_size)
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('MODEL_SERVER_MAX_RETRIES', 3))
+        self.retry_backoff = retry_backoff if retry_backoff is not None else float(os.getenv('MODEL_SERVER_RETRY_BACKOFF', 1.0))
+        self.hedge_requests = hedge_requests if hedge_requests is not None else (
+            os.getenv('HEDGE_REQUESTS', 'false').lower() == 'true'
+        )
         self.generate_url = f"{self.server_url}/generate"
         self.health_url = f"{self.server_url}/health"
 
-        logger.info(f"로컬 API 모드로 초기화: {self.server_url}")
+        # 서버 URL 목록별로 공유되는 엔드포인트 풀 (서버마다 서킷 브레이커와 지연 통계 유지)
+        self.endpoint_pool = get_endpoint_pool(
+            self.server_urls,
+            lambda health_url: (lambda: probe_server_ready(self.session, health_url))
+        )
+        self.breaker = self.endpoint_pool.endpoints[0].breaker
+
+        logger.info(f"로컬 API 모드로 초기화: {', '.join(self.server_urls)}")
 
-        # 서버 상태 확인
-        if not self.check_server_health():
-            logger.warning("⚠️  모델 서버가 실행 중이 아닙니다!")
-            logger.warning(f"다음 명령으로 서버를 시작하세요: python model_server.py")
+        # 서버 상태 확인 (회로가 열려 있거나 이미 확인한 서버면 생략)
+        endpoints = self.endpoint_pool.endpoints
+        if not any(ep.breaker.allow_request() for ep in endpoints):
+            logger.warning("⚠️  서킷 브레이커가 열려 있습니다. 서버 복구 전까지 폴백 메시지를 사용합니다.")
+        else:
+            unchecked = [ep for ep in endpoints if ep.breaker.claim_initial_check()]
+            if unchecked and not self.check_server_health(unchecked):
+                logger.warning("⚠️  모델 서버가 실행 중이 아닙니다!")
+                logger.warning(f"다음 명령으로 서버를 시작하세요: python model_server.py")
+
+    def check_server_health(self, endpoints: Optional[List[Endpoint]] = None) -> bool:
+        """
+        서버 상태 확인 (요청을 처리할 수 없는 서버는 서킷 브레이커를 엶)
 
-    def check_server_health(self) -> bool:
-        """서버 상태 확인"""
+        Args:
+            endpoints: 확인할 엔드포인트 (기본값: 전체)
+
+        Returns:
+            bool: 요청을 처리할 수 있는 서버가 하나라도 있으면 True
+        """
+        results = [
+            self._check_endpoint_health(ep)
+            for ep in (endpoints or self.endpoint_pool.endpoints)
+        ]
+        return any(results)
+
+    def _check_endpoint_health(self, endpoint: Endpoint) -> bool:
+        """서버 하나의 상태 확인"""
+        breaker = endpoint.breaker
         try:
-            response = requests.get(self.health_url, timeout=5)
+            response = self.session.get(endpoint.health_url, timeout=(2, 5))
             if response.status_code == 200:
                 data = response.json()
-                if data.get('model_loaded'):
-                    logger.info("✓ 모델 서버 연결 성공 (모델 로드 완료)")
+                # 구버전 서버는 'ready' 필드가 없으므로 model_loaded로 판단
+                if data.get('ready', data.get('model_loaded')):
+                    logger.info(f"✓ 모델 서버 연결 성공 (모델 로드 완료): {endpoint.url}")
+                    breaker.record_success()
                     return True
+                elif _server_state(data) == 'warming_up':
+                    logger.warning(f"⚠️  모델 서버 연결됨 (워밍업 중...): {endpoint.url}")
+                    breaker.trip()
+                    return False
+                elif _server_state(data) in ('idle', 'warming'):
+                    # 유휴 상태는 첫 요청이 복원을 시작해야 하므로 회로를 열지 않음
+                    logger.warning(f"⚠️  모델 서버 연결됨 (유휴 언로드 상태, 첫 요청 시 복원): {endpoint.url}")
+                    return False
                 else:
-                    logger.warning("⚠️  모델 서버 연결됨 (모델 로딩 중...)")
+                    logger.warning(f"⚠️  모델 서버 연결됨 (모델 로딩 중...): {endpoint.url}")
+                    breaker.trip()
                     return False
             else:
-                logger.warning(f"서버 응답 오류: {response.status_code}")
+                logger.warning(f"서버 응답 오류: {response.status_code} ({endpoint.url})")
+                breaker.trip()
                 return False
         except requests.exceptions.ConnectionError:
-            logger.warning("서버 연결 실패: 서버가 실행 중이 아닙니다.")
+            logger.warning(f"서버 연결 실패: 서버가 실행 중이 아닙니다. ({endpoint.url})")
+            breaker.trip()
             return False
         except Exception as e:
-            logger.warning(f"서버 상태 확인 실패: {e}")
+            logger.warning(f"서버 상태 확인 실패: {e} ({endpoint.url})")
+            breaker.trip()
             return False
 
     def _query_api(
@@ -76,6 +188,8 @@ class MessageGeneratorLocalAPI:
     ) -> Optional[str]:
         """
         로컬 모델 서버 API로 텍스트 생성
+        서버가 여러 대면 진행 요청 수/EWMA가 가장 낮은 서버를 선택하고,
+        헤지 모드에서는 첫 서버가 p95보다 느리면 두 번째 서버에 같은 요청을 보냅니다.
 
         Args:
             prompt: 입력 프롬프트
@@ -96,269 +210,198 @@ class MessageGeneratorLocalAPI:
             "do_sample": True
         }
 
-        try:
-            logger.debug(f"API 요청: {self.generate_url}")
-            response = requests.post(
-                self.generate_url,
-                json=payload,
-                timeout=self.timeout
-            )
+        # 모든 서버의 회로가 열려 있으면 네트워크 대기 없이 바로 폴백
+        primary = self.endpoint_pool.pick()
+        if primary is None:
+            logger.warning("서킷 브레이커 열림: API 호출 생략")
+            return None
 
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result.get('generated_text', '')
-                generation_time = result.get('generation_time', 0)
-                logger.info(f"✓ API 생성 성공 (소요 시간: {generation_time:.2f}초)")
-                return generated_text
+        hedge_delay = primary.p95_latency() if self.hedge_requests and len(self.endpoint_pool) > 1 else None
+        if hedge_delay is None:
+            return self._post_generate(primary, payload)
 
-            elif response.status_code == 503:
-                logger.warning("모델이 아직 로딩 중입니다. 잠시 후 다시 시도하세요.")
-                return None
+        executor = _get_hedge_executor()
+        first = executor.submit(self._post_generate, primary, payload)
+        try:
+            return first.result(timeout=hedge_delay)
+        except FutureTimeoutError:
+            pass
 
-            else:
-                logger.error(f"API 오류 {response.status_code}: {response.text}")
-                return None
+        secondary = self.endpoint_pool.pick(exclude=primary)
+        if secondary is None:
+            return first.result()
 
-        except requests.exceptions.Timeout:
-            logger.error(f"API 타임아웃 ({self.timeout}초 초과)")
-            return None
-        except requests.exceptions.ConnectionError:
-            logger.error("서버 연결 실패. model_server.py가 실행 중인지 확인하세요.")
-            return None
-        except Exception as e:
-            logger.error(f"API 호출 실패: {e}")
-            return None
+        logger.info(f"헤지 요청 전송: {primary.url}가 p95({hedge_delay:.2f}초)보다 느려 {secondary.url}에도 요청")
+        second = executor.submit(self._post_generate, secondary, payload)
 
-    def generate_message(
-        self,
-        analysis_data: Dict,
-        use_few_shot: bool = True,
-        max_length: int = 50,
-        temperature: float = 0.5,
-        top_p: float = 0.85,
-        repetition_penalty: float = 1.2
-    ) -> str:
+        # 먼저 성공한 결과 사용 (느린 요청은 백그라운드에서 마무리됨)
+        for future in as_completed([first, second]):
+            result = future.result()
+            if result:
+                return result
+        return None
+
+    def _post_generate(self, endpoint: Endpoint, payload: Dict) -> Optional[str]:
         """
-        날씨 분석 데이터를 바탕으로 전광판 문구 생성
+        서버 하나에 /generate 요청 (503 로딩 중 재시도 포함)
 
         Args:
-            analysis_data: WeatherAnalyzer.analyze()의 결과
-            use_few_shot: Few-shot 예시 포함 여부
-            max_length: 생성할 최대 토큰 수
-            temperature: 생성 다양성
-            top_p: Nucleus sampling
-            repetition_penalty: 반복 방지 패널티
+            endpoint: 요청을 보낼 엔드포인트
+            payload: 요청 본문
 
         Returns:
-            str: 생성된 전광판 문구
+            str: 생성된 텍스트 (실패 시 None)
         """
-        # 프롬프트 생성
-        if use_few_shot:
-            prompt = PromptTemplates.get_display_message_prompt_with_examples(analysis_data)
-        else:
-            prompt = PromptTemplates.get_display_message_prompt(analysis_data)
-
-        logger.info("API를 통한 문구 생성 시작...")
+        breaker = endpoint.breaker
+        self.endpoint_pool.begin(endpoint)
+        start_time = time.time()
+        latency = None
 
-        # API 호출
-        full_output = self._query_api(
-            prompt,
-            max_new_tokens=max_length,
-            temperature=temperature,
-            top_p=top_p,
-            repetition_penalty=repetition_penalty
-        )
-
-        if full_output:
-            # 결과 정제
-            message = self._extract_message(full_output)
+        try:
+            for attempt in range(self.max_retries + 1):
+                logger.debug(f"API 요청: {endpoint.generate_url}")
+                with span('http.generate', endpoint=endpoint.url, attempt=attempt) as current:
+                    response = self.session.post(
+                        endpoint.generate_url,
+                        json=payload,
+                        headers=get_generate_headers(),
+                        timeout=self.timeout
+                    )
+                    if current is not None:
+                        current.attrs['status'] = response.status_code
+
+                if response.status_code == 200:
+                    result = decode_response(response)
+                    generated_text = result.get('generated_text', '')
+                    generation_time = result.get('generation_time', 0)
+                    record('server.generate', generation_time, endpoint=endpoint.url)
+                    logger.info(f"✓ API 생성 성공 (소요 시간: {generation_time:.2f}초)")
+                    latency = time.time() - start_time
+                    breaker.record_success()
+                    return generated_text
+
+                elif response.status_code == 503:
+                    if response.headers.get('X-Model-Status') == 'warming':
+                        # 유휴 복원은 오래 걸리므로 기다리지 않고 폴백 사용
+                        logger.warning("모델 서버가 유휴 상태에서 복원 중입니다. 폴백을 사용합니다.")
+                        return None
+
+                    if attempt < self.max_retries:
+                        delay = get_backoff_delay(attempt, self.retry_backoff)
+                        logger.warning(f"모델이 아직 로딩 중입니다. {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                        time.sleep(delay)
+                        continue
+
+                    logger.warning("모델이 아직 로딩 중입니다. 잠시 후 다시 시도하세요.")
+                    breaker.record_failure()
+                    return None
 
-            # 메시지가 비어있거나 너무 짧으면 폴백 사용
-            if not message or len(message) < 5:
-                logger.warning(f"생성된 문구가 너무 짧음: '{message}', 폴백 사용")
-                return self._get_fallback_message(analysis_data)
+                else:
+                    logger.error(f"API 오류 {response.status_code}: {response.text}")
+                    breaker.record_failure()
+                    return None
 
-            logger.info(f"✓ 문구 생성 완료: {message}")
-            return message
-        else:
-            # API 실패 시 폴백
-            logger.warning("API 생성 실패, 폴백 메시지 사용")
-            return self._get_fallback_message(analysis_data)
+        except requests.exceptions.Timeout:
+            logger.error(f"API 타임아웃 ({self.timeout}초 초과): {endpoint.url}")
+            breaker.record_failure()
+            return None
+        except requests.exceptions.ConnectionError:
+            logger.error(f"서버 연결 실패. model_server.py가 실행 중인지 확인하세요. ({endpoint.url})")
+            breaker.record_failure()
+            return None
+        except Exception as e:
+            logger.error(f"API 호출 실패: {e}")
+            breaker.record_failure()
+            return None
+        finally:
+            self.endpoint_pool.end(endpoint, latency)
 
-    def generate_comparison_message(
+    def generate_batch(
         self,
-        comparison_data: Dict,
-        max_length: int = 50,
+        prompts: List[str],
+        max_new_tokens: int = 50,
         temperature: float = 0.5,
         top_p: float = 0.85,
-        repetition_penalty: float = 1.2
-    ) -> str:
+        repetition_penalty: float = 1.2,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
         """
-        어제와 오늘의 온도 비교 데이터를 바탕으로 전광판 문구 생성
+        여러 프롬프트를 /generate/batch로 나누어 생성 (백필 등 대량 작업용)
 
         Args:
-            comparison_data: WeatherAnalyzer.compare_two_days()의 결과
-            max_length: 생성할 최대 토큰 수
+            prompts: 입력 프롬프트 리스트
+            max_new_tokens: 최대 생성 토큰 수
             temperature: 생성 다양성
             top_p: Nucleus sampling
             repetition_penalty: 반복 방지 패널티
+            batch_size: 요청 하나에 담을 프롬프트 수 (기본값: 환경변수 API_BATCH_SIZE 또는 16)
 
         Returns:
-            str: 생성된 전광판 문구
+            list: 프롬프트 순서와 같은 생성 텍스트 리스트 (실패한 배치는 None)
         """
-        # 프롬프트 생성
-        prompt = PromptTemplates.get_temperature_comparison_prompt(comparison_data)
-
-        logger.info("온도 비교 문구 생성 시작...")
-
-        # API 호출
-        full_output = self._query_api(
-            prompt,
-            max_new_tokens=max_length,
-            temperature=temperature,
-            top_p=top_p,
-            repetition_penalty=repetition_penalty
-        )
-
-        if full_output:
-            # 결과 정제
-            message = self._extract_message(full_output)
-
-            # 메시지가 비어있거나 너무 짧으면 폴백 사용
-            if not message or len(message) < 5:
-                logger.warning(f"생성된 문구가 너무 짧음: '{message}', 폴백 사용")
-                return self._get_comparison_fallback_message(comparison_data)
-
-            logger.info(f"✓ 온도 비교 문구 생성 완료: {message}")
-            return message
-        else:
-            # API 실패 시 폴백
-            logger.warning("API 생성 실패, 폴백 메시지 사용")
-            return self._get_comparison_fallback_message(comparison_data)
-
-    def _extract_message(self, full_output: str) -> str:
-        """
-        생성된 텍스트에서 전광판 문구만 추출
-
-        Args:
-            full_output: API가 생성한 전체 텍스트
-
-        Returns:
-            str: 추출된 전광판 문구
-        """
-        # 첫 번째 문장만 추출
-        sentences = re.split(r'[.!?]\s*', full_output)
-        if sentences:
-            message = sentences[0].strip()
-        else:
-            message = full_output.strip()
-
-        # 따옴표 제거
-        message = message.strip('"\'')
-
-        # 길이 제한
-        max_msg_length = int(os.getenv('MAX_MESSAGE_LENGTH', 70))
-        if len(message) > max_msg_length:
-            message = message[:max_msg_length]
-
-        return message
+        batch_size = batch_size or int(os.getenv('API_BATCH_SIZE', 16))
+        payload = {
+            "max_new_tokens": max_new_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "repetition_penalty": repetition_penalty,
+            "do_sample": True
+        }
+        results: List[Optional[str]] = []
 
-    def _get_fallback_message(self, analysis_data: Dict) -> str:
-        """
-        API 실패 시 규칙 기반 폴백 메시지
+        for i in range(0, len(prompts), batch_size):
+            chunk = prompts[i:i + batch_size]
+            texts = self._post_generate_batch(dict(payload, prompts=chunk))
+            results.extend(texts if texts and len(texts) == len(chunk) else [None] * len(chunk))
 
-        Args:
-            analysis_data: 날씨 분석 데이터
+            logger.info(f"배치 생성 진행: {min(i + batch_size, len(prompts))}/{len(prompts)}")
 
-        Returns:
-            str: 폴백 메시지
-        """
-        temp_diff = analysis_data['temp_diff']
-        avg_temp = analysis_data['avg_temp']
-        avg_humidity = analysis_data['avg_humidity']
-
-        # 규칙 기반 메시지 생성
-        if temp_diff >= 15:
-            return f"일교차가 {temp_diff:.0f}도로 매우 큽니다. 건강 관리 유의하세요!"
-        elif temp_diff >= 10:
-            return f"오늘 일교차가 {temp_diff:.0f}도로 큽니다. 외출 시 겉옷을 챙기세요!"
-        elif avg_temp >= 33:
-            return f"폭염 주의! 충분한 수분 섭취와 무리한 야외활동 자제하세요."
-        elif avg_temp >= 28:
-            return f"더운 날씨가 계속됩니다. 충분한 수분 섭취하세요!"
-        elif avg_temp < 0:
-            return f"한파 주의! 따뜻하게 입고 외출하세요."
-        elif avg_temp < 10:
-            return f"쌀쌀한 날씨입니다. 따뜻하게 입고 외출하세요."
-        elif avg_humidity < 30:
-            return f"건조한 날씨입니다. 수분 섭취와 보습에 신경 쓰세요."
-        elif avg_humidity >= 80:
-            return f"습한 날씨입니다. 실내 환기에 유의하세요."
-        else:
-            return f"오늘 최저 {analysis_data['min_temp']:.0f}°C, 최고 {analysis_data['max_temp']:.0f}°C입니다. 좋은 하루 보내세요!"
+        return results
 
-    def _get_comparison_fallback_message(self, comparison_data: Dict) -> str:
+    def _post_generate_batch(self, payload: Dict) -> Optional[List[str]]:
         """
-        온도 비교 문구 생성 실패 시 규칙 기반 폴백 메시지
+        서버 하나에 /generate/batch 요청 (모델 복원/로딩 중이면 서버에서 대기)
 
         Args:
-            comparison_data: 온도 비교 데이터
+            payload: 요청 본문 (prompts 포함)
 
         Returns:
-            str: 폴백 메시지
+            list: 생성된 텍스트 리스트 (실패 시 None)
         """
-        yesterday_avg = comparison_data['yesterday_avg_temp']
-        today_avg = comparison_data['today_avg_temp']
-        temp_change = comparison_data['temp_change']
-        direction = comparison_data['temp_change_direction']
-        today_data = comparison_data['today_analysis']
-        temp_diff = today_data['temp_diff']
-
-        # 일교차가 매우 큰 경우 우선 처리
-        if temp_diff >= 15:
-            return f"일교차가 {temp_diff:.0f}도로 매우 큽니다. 겉옷 꼭 챙기세요!"
-        elif temp_diff >= 10:
-            return f"일교차 {temp_diff:.0f}도. 아침저녁으로 쌀쌀하니 겉옷 챙기세요!"
-
-        # 온도 변화에 따른 메시지
-        if abs(temp_change) < 1:
-            return f"어제와 비슷한 날씨입니다. 좋은 하루 보내세요!"
-        elif direction == '상승':
-            if temp_change >= 5:
-                return f"어제보다 {abs(temp_change):.1f}도 높아졌습니다. 가볍게 입으세요!"
-            else:
-                return f"어제보다 조금 따뜻합니다. 좋은 하루 되세요!"
-        else:  # 하강
-            if abs(temp_change) >= 5:
-                return f"어제보다 {abs(temp_change):.1f}도 낮습니다. 따뜻하게 입으세요!"
-            else:
-                return f"어제보다 조금 선선합니다. 건강 유의하세요!"
+        endpoint = self.endpoint_pool.pick()
+        if endpoint is None:
+            logger.warning("서킷 브레이커 열림: 배치 API 호출 생략")
+            return None
 
-    def generate_multiple_messages(
-        self,
-        analysis_data: Dict,
-        num_messages: int = 3
-    ) -> list:
-        """
-        여러 개의 문구를 생성하여 선택할 수 있도록 함
+        breaker = endpoint.breaker
+        self.endpoint_pool.begin(endpoint)
 
-        Args:
-            analysis_data: 날씨 분석 데이터
-            num_messages: 생성할 문구 개수
+        try:
+            # 대량 작업은 지연보다 처리량이 중요하므로 서버가 준비될 때까지 기다림
+            headers = dict(get_generate_headers(), **{'X-Wait-For-Model': 'true'})
+            with span('http.generate_batch', endpoint=endpoint.url, prompts=len(payload['prompts'])):
+                response = self.session.post(
+                    f"{endpoint.url}/generate/batch",
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout * len(payload['prompts'])
+                )
 
-        Returns:
-            list: 생성된 문구 리스트
-        """
-        messages = []
-        for i in range(num_messages):
-            # temperature를 약간씩 조정하여 다양한 문구 생성
-            temp = 0.4 + (i * 0.15)
-            message = self.generate_message(
-                analysis_data,
-                use_few_shot=True,
-                temperature=temp
-            )
-            messages.append(message)
-            logger.info(f"문구 {i+1}/{num_messages}: {message}")
+            if response.status_code == 200:
+                result = decode_response(response)
+                record('server.generate_batch', result.get('generation_time', 0), endpoint=endpoint.url)
+                logger.info(f"✓ 배치 API 생성 성공 ({len(payload['prompts'])}개, 소요 시간: {result.get('generation_time', 0):.2f}초)")
+                breaker.record_success()
+                return result.get('generated_texts')
+
+            logger.error(f"배치 API 오류 {response.status_code}: {response.text}")
+            breaker.record_failure()
+            return None
 
-        return messages
+        except requests.exceptions.RequestException as e:
+            logger.error(f"배치 API 호출 실패: {e} ({endpoint.url})")
+            breaker.record_failure()
+            return None
+        finally:
+            # 배치 지연 시간은 단건 요청 EWMA/p95에 반영하지 않음
+            self.endpoint_pool.end(endpoint)
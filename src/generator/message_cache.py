@@ -0,0 +1,222 @@
+"""
+생성된 전광판 문구의 영구 캐시 모듈
+반올림한 입력값(온도, 분석 카테고리)과 프롬프트 버전, 어댑터로 키를 만들어
+같은 날짜 재실행이나 입력이 같은 사이트에서 모델 호출 없이 문구를 재사용합니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Optional
+import logging
+
+from .prompt_templates import PromptTemplates
+
+logger = logging.getLogger(__name__)
+
+# 경로별 공유 캐시
+_caches: Dict[str, 'MessageCache'] = {}
+_caches_lock = threading.Lock()
+
+
+def get_adapter_id() -> str:
+    """
+    캐시 키에 포함할 모델/어댑터 식별자
+    환경변수 MODEL_ADAPTER_ID가 있으면 사용하고, 없으면 USE_FINETUNED/ADAPTER_PATH로 결정합니다.
+    """
+    adapter_id = os.getenv('MODEL_ADAPTER_ID')
+    if adapter_id:
+        return adapter_id
+    if os.getenv('USE_FINETUNED', 'false').lower() == 'true':
+        return os.path.basename(os.path.normpath(os.getenv('ADAPTER_PATH', './finetuned_model')))
+    return 'base'
+
+
+def _category_tuple(analysis_data: Optional[Dict]) -> tuple:
+    """분석 결과의 카테고리 튜플 (온도, 습도, 일교차)"""
+    analysis_data = analysis_data or {}
+    return (
+        analysis_data.get('temp_category'),
+        analysis_data.get('humidity_category'),
+        analysis_data.get('temp_diff_category')
+    )
+
+
+def _make_key(kind: str, inputs: tuple, generation_params: Dict) -> str:
+    """정규화된 입력과 프롬프트 버전, 어댑터, 생성 파라미터로 캐시 키 생성"""
+    raw = json.dumps(
+        [kind, inputs, PromptTemplates.VERSION, get_adapter_id(), sorted(generation_params.items())],
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def comparison_cache_key(comparison_data: Dict, **generation_params) -> str:
+    """
+    온도 비교 문구 캐시 키
+
+    Args:
+        comparison_data: WeatherAnalyzer.compare_two_days()의 결과
+        **generation_params: 생성 파라미터 (max_length, temperature 등)
+
+    Returns:
+        str: 캐시 키
+    """
+    inputs = (
+        round(comparison_data['yesterday_avg_temp']),
+        round(comparison_data['today_avg_temp']),
+        comparison_data.get('temp_change_direction'),
+        _category_tuple(comparison_data.get('today_analysis'))
+    )
+    return _make_key('comparison', inputs, generation_params)
+
+
+def display_cache_key(analysis_data: Dict, **generation_params) -> str:
+    """
+    일반 전광판 문구 캐시 키
+
+    Args:
+        analysis_data: WeatherAnalyzer.analyze()의 결과
+        **generation_params: 생성 파라미터 (use_few_shot, temperature 등)
+
+    Returns:
+        str: 캐시 키
+    """
+    inputs = (
+        round(analysis_data['max_temp']),
+        round(analysis_data['min_temp']),
+        round(analysis_data['avg_temp']),
+        round(analysis_data['avg_humidity']),
+        _category_tuple(analysis_data)
+    )
+    return _make_key('display', inputs, generation_params)
+
+
+class MessageCache:
+    """TTL + LRU 제거 방식의 SQLite 문구 캐시 클래스"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: 환경변수 MESSAGE_CACHE_PATH 또는 ./data/cache/messages.sqlite3)
+            ttl_seconds: 항목 유효 시간 (초, 기본값: 환경변수 MESSAGE_CACHE_TTL_HOURS 또는 168시간)
+            max_entries: 최대 항목 수, 초과 시 오래 사용하지 않은 항목부터 제거
+                (기본값: 환경변수 MESSAGE_CACHE_MAX_ENTRIES 또는 5000)
+        """
+        self.path = path or os.getenv('MESSAGE_CACHE_PATH', './data/cache/messages.sqlite3')
+        self.ttl_seconds = ttl_seconds or float(os.getenv('MESSAGE_CACHE_TTL_HOURS', 168)) * 3600
+        self.max_entries = max_entries or int(os.getenv('MESSAGE_CACHE_MAX_ENTRIES', 5000))
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # 지연 예산 콜백 등 여러 스레드에서 접근하므로 락으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS messages ('
+            ' key TEXT PRIMARY KEY,'
+            ' message TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_messages_last_used ON messages(last_used)')
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 문구 조회 (만료된 항목은 삭제)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            str: 캐시된 문구 (없거나 만료되면 None)
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT message, created_at FROM messages WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                message, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    self._conn.execute('DELETE FROM messages WHERE key = ?', (key,))
+                    self._conn.commit()
+                    return None
+
+                self._conn.execute('UPDATE messages SET last_used = ? WHERE key = ?', (now, key))
+                self._conn.commit()
+                return message
+        except sqlite3.Error as e:
+            # 캐시 오류는 생성 경로를 막지 않음
+            logger.warning(f"문구 캐시 조회 실패: {e}")
+            return None
+
+    def put(self, key: str, message: str):
+        """
+        문구 저장 (최대 항목 수를 넘으면 LRU 제거)
+
+        Args:
+            key: 캐시 키
+            message: LLM이 생성한 문구 (폴백 문구는 저장하지 않음)
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO messages (key, message, created_at, last_used) VALUES (?, ?, ?, ?)',
+                    (key, message, now, now)
+                )
+                self._conn.execute('DELETE FROM messages WHERE created_at < ?', (now - self.ttl_seconds,))
+                self._conn.execute(
+                    'DELETE FROM messages WHERE key IN ('
+                    ' SELECT key FROM messages ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"문구 캐시 저장 실패: {e}")
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_message_cache(path: Optional[str] = None) -> Optional[MessageCache]:
+    """
+    경로별 공유 문구 캐시 반환 (MESSAGE_CACHE_ENABLED=false 이거나 열 수 없으면 None)
+
+    Args:
+        path: SQLite 파일 경로 (기본값: 환경변수 MESSAGE_CACHE_PATH)
+
+    Returns:
+        MessageCache: 공유 캐시
+    """
+    if os.getenv('MESSAGE_CACHE_ENABLED', 'true').lower() != 'true':
+        return None
+
+    path = path or os.getenv('MESSAGE_CACHE_PATH', './data/cache/messages.sqlite3')
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = MessageCache(path)
+            except Exception as e:
+                logger.warning(f"⚠️  문구 캐시를 열 수 없습니다 ({path}): {e}")
+                return None
+            _caches[path] = cache
+        return cache
@@ -6,6 +6,9 @@ LLM 프롬프트 템플릿 관리
 class PromptTemplates:
     """프롬프트 템플릿 관리 클래스"""
 
+    # 프롬프트 내용을 바꾸면 올려서 이전 문구 캐시를 무효화
+    VERSION = '1'
+
     @staticmethod
     def get_display_message_prompt(analysis_data: dict) -> str:
         """
@@ -0,0 +1,117 @@
+"""
+파이프라인(main.py)과 모델 서버(model_server.py) 공용 로깅 설정 모듈
+로그 호출은 메모리 큐에 레코드를 넣기만 하고, 파일/표준 출력 쓰기는
+백그라운드 스레드(QueueListener)가 담당하여 로그 I/O가 생성 지연에 포함되지 않습니다.
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import logging
+
+from .tracing import current_trace_id
+
+# 프로세스당 하나의 백그라운드 기록 스레드
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+# JSON 레코드에 추가 필드로 넣지 않을 LogRecord 기본 속성
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'trace_id'}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 포맷 (logger.info(..., extra={...})의 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+            'thread': record.threadName
+        }
+        trace_id = getattr(record, 'trace_id', None)
+        if trace_id:
+            entry['trace_id'] = trace_id
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _ContextQueueHandler(QueueHandler):
+    """호출 스레드의 추적 ID를 레코드에 담아 큐에 넣는 핸들러"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # contextvars는 기록 스레드에서 보이지 않으므로 큐에 넣기 전에 복사
+        record.trace_id = current_trace_id()
+        # 인자로 넘긴 객체가 나중에 바뀌어도 호출 시점의 메시지가 기록되도록 미리 포맷
+        # (같은 프로세스의 큐이므로 exc_info는 그대로 전달하여 포맷터가 처리)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(
+    log_file: Optional[str] = None,
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    force: bool = False
+) -> QueueListener:
+    """
+    루트 로거를 큐 기반 비동기 로깅으로 설정 (이미 설정되어 있으면 그대로 사용)
+
+    Args:
+        log_file: 로그 파일 경로 (기본값: 환경변수 LOG_FILE, 없으면 표준 출력만)
+        level: 로그 레벨 (기본값: 환경변수 LOG_LEVEL 또는 INFO)
+        log_format: 'json' 또는 'text' (기본값: 환경변수 LOG_FORMAT 또는 json)
+        force: 기존 설정을 버리고 다시 설정 (fork한 워커 프로세스용, 부모의 기록 스레드는 복사되지 않음)
+
+    Returns:
+        QueueListener: 백그라운드 기록 리스너
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None and not force:
+            return _listener
+
+        level = (level or os.getenv('LOG_LEVEL', 'INFO')).upper()
+        log_format = log_format or os.getenv('LOG_FORMAT', 'json')
+        log_file = log_file or os.getenv('LOG_FILE')
+
+        if log_format == 'json':
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_file:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(_ContextQueueHandler(log_queue))
+        root.setLevel(level)
+
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        if _listener is None:
+            # 종료 시 큐에 남은 레코드까지 기록
+            atexit.register(lambda: _listener is not None and _listener.stop())
+        _listener = listener
+        return listener
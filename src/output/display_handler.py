@@ -5,7 +5,7 @@
 import json
 import os
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,7 +42,8 @@ class DisplayHandler:
         date: datetime,
         message: str,
         analysis_data: Dict,
-        log_type: str = "daily"
+        log_type: str = "daily",
+        site: Optional[str] = None
     ):
         """
         생성된 문구와 분석 데이터를 로그 파일에 저장
@@ -52,6 +53,7 @@ class DisplayHandler:
             message: 생성된 문구
             analysis_data: 분석 데이터
             log_type: 로그 타입 ('daily', 'monthly')
+            site: 사이트 이름 (여러 사이트 실행 시 구분용)
         """
         # 로그 파일명 생성
         if log_type == "daily":
@@ -77,6 +79,8 @@ class DisplayHandler:
                 'temp_diff_category': analysis_data.get('temp_diff_category')
             }
         }
+        if site:
+            log_entry['site'] = site
 
         # JSONL 형식으로 저장 (한 줄에 하나의 JSON)
         try:
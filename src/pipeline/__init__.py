@@ -0,0 +1,38 @@
+"""
+파이프라인 실행 모듈 (단일 실행, 여러 사이트, 데몬 모드, 감시 모드, 백필, 작업 큐)
+
+하위 모듈은 처음 사용할 때 import합니다.
+(cron 단일 실행이 yaml 등 다른 모드의 의존성까지 불러오지 않도록)
+"""
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'PipelineContext': '.context',
+    'run_pipeline': '.runner',
+    'Site': '.sites',
+    'load_sites': '.sites',
+    'run_sites': '.multi_site',
+    'CronSchedule': '.scheduler',
+    'run_daemon': '.scheduler',
+    'ChangeSource': '.watcher',
+    'PollingChangeSource': '.watcher',
+    'run_watcher': '.watcher',
+    'run_backfill': '.backfill',
+    'run_pregeneration': '.pregenerate',
+    'WorkQueue': '.work_queue',
+    'run_producer': '.work_queue',
+    'run_consumer': '.work_queue',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """공개 이름 첫 접근 시 하위 모듈 import"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,168 @@
+"""
+과거 기간 문구 재생성(백필) 모듈
+기간 전체를 한 번에 조회하고 일괄 분석/배치 생성하며,
+완료한 날짜를 체크포인트 파일에 기록하여 중단 후 이어서 실행할 수 있습니다.
+"""
+
+import os
+import json
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set
+import logging
+
+from ..analyzer.sensor_data_fetcher import SensorDataFetcher
+from ..analyzer.weather_analyzer import WeatherAnalyzer
+from ..generator.base_generator import is_fallback
+from .context import PipelineContext
+from .state_file import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def _load_checkpoint(path: str) -> Dict[str, List[str]]:
+    """체크포인트 파일 로드 (없으면 빈 딕셔너리)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️  체크포인트 파일을 읽을 수 없습니다 ({path}): {e}")
+        return {}
+
+
+def _save_checkpoint(path: str, key: str, completed: Set[str]):
+    """
+    체크포인트 파일에 한 사이트의 완료 날짜 기록
+    (다른 사이트를 백필하는 프로세스의 기록을 덮어쓰지 않도록 잠근 상태에서 다시 읽어 병합)
+    """
+    with file_lock(path):
+        checkpoint = _load_checkpoint(path)
+        checkpoint[key] = sorted(completed)
+        write_json_atomic(path, checkpoint, indent=2)
+
+
+def run_backfill(
+    ctx: PipelineContext,
+    start_date: date,
+    end_date: date,
+    device_ids: Optional[List[str]] = None,
+    object_id: Optional[str] = None,
+    compare_with_yesterday: bool = True,
+    checkpoint_path: Optional[str] = None,
+    chunk_days: Optional[int] = None,
+    site: Optional[str] = None
+) -> Dict[date, str]:
+    """
+    기간 내 날짜별 문구를 재생성하여 문구 로그에 기록
+
+    Args:
+        ctx: 실행 자원
+        start_date: 시작 날짜 (포함)
+        end_date: 종료 날짜 (포함)
+        device_ids: 디바이스 ID 리스트 (기본값: 전체)
+        object_id: 객체 ID
+        compare_with_yesterday: 전날과 비교 문구 생성 여부
+        checkpoint_path: 체크포인트 파일 (기본값: 환경변수 BACKFILL_CHECKPOINT 또는 ./data/backfill_checkpoint.json)
+        chunk_days: 한 번에 생성하고 체크포인트를 기록할 일수 (기본값: 환경변수 BACKFILL_CHUNK_DAYS 또는 30)
+        site: 사이트 이름 (체크포인트/로그 구분용)
+
+    Returns:
+        dict: 날짜 → 생성된 문구 (이번 실행에서 LLM 문구를 생성한 날짜만, 폴백 날짜는 미완료로 남김)
+    """
+    checkpoint_path = checkpoint_path or os.getenv('BACKFILL_CHECKPOINT', './data/backfill_checkpoint.json')
+    chunk_days = chunk_days or int(os.getenv('BACKFILL_CHUNK_DAYS', 30))
+    checkpoint_key = site or object_id or 'default'
+
+    completed: Set[str] = set(_load_checkpoint(checkpoint_path).get(checkpoint_key, []))
+
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    pending = [day for day in days if day.isoformat() not in completed]
+    logger.info(f"백필 대상: {len(days)}일 중 {len(pending)}일 (완료 {len(days) - len(pending)}일 생략)")
+    if not pending:
+        return {}
+
+    # 1. 기간 통합 조회 (첫날 비교용 전날 포함)
+    step_start = time.time()
+    fetch_start = pending[0] - timedelta(days=1) if compare_with_yesterday else pending[0]
+    rows = SensorDataFetcher(ctx.db).get_range_statistics(fetch_start, pending[-1], device_ids, object_id)
+
+    rows_by_date = defaultdict(list)
+    for row in rows:
+        rows_by_date[str(row['statistics_date'])].append(row)
+
+    needed_days = sorted(set(pending) | ({day - timedelta(days=1) for day in pending} if compare_with_yesterday else set()))
+    sensor_data = {
+        day: SensorDataFetcher.build_daily_statistics(
+            rows_by_date.get(day.isoformat(), []), day, device_ids=device_ids, object_id=object_id
+        )
+        for day in needed_days
+    }
+    logger.info(f"✓ 기간 데이터 조회 완료 (소요 시간: {time.time() - step_start:.2f}초)")
+
+    # 2. 일괄 분석
+    available_days = [day for day in needed_days if sensor_data[day]['temperature']['hourly_data']]
+    analyses = dict(zip(
+        available_days,
+        WeatherAnalyzer.analyze_batch([sensor_data[day] for day in available_days])
+    ))
+
+    skipped = [day for day in pending if day not in analyses]
+    if skipped:
+        logger.warning(f"⚠️  온도 데이터가 없는 날짜 {len(skipped)}일 생략: {', '.join(str(day) for day in skipped[:10])}")
+
+    # 3. 구간별 배치 생성 + 체크포인트 기록
+    generator = ctx.generator
+    target_days = [day for day in pending if day in analyses]
+    results: Dict[date, str] = {}
+
+    for i in range(0, len(target_days), chunk_days):
+        chunk = target_days[i:i + chunk_days]
+        step_start = time.time()
+
+        comparisons = {}
+        if compare_with_yesterday:
+            for day in chunk:
+                yesterday = day - timedelta(days=1)
+                if yesterday in analyses:
+                    comparisons[day] = WeatherAnalyzer.compare_two_days(analyses[yesterday], analyses[day])
+
+        messages: Dict[date, str] = {}
+        if comparisons:
+            comparison_days = list(comparisons)
+            messages.update(zip(
+                comparison_days,
+                generator.generate_comparison_messages([comparisons[day] for day in comparison_days])
+            ))
+        display_days = [day for day in chunk if day not in messages]
+        if display_days:
+            messages.update(zip(
+                display_days,
+                generator.generate_messages([analyses[day] for day in display_days])
+            ))
+
+        # 폴백 문구가 나온 날짜는 기록하지 않고 다음 실행에서 다시 생성
+        fallback_days = [day for day in chunk if is_fallback(messages[day])]
+        if fallback_days:
+            logger.warning(
+                f"⚠️  LLM 생성 실패로 {len(fallback_days)}일 미완료 처리: "
+                f"{', '.join(str(day) for day in fallback_days[:10])}"
+            )
+
+        for day in chunk:
+            if day in fallback_days:
+                continue
+            ctx.display.log_message(day, messages[day], analyses[day], site=site)
+            completed.add(day.isoformat())
+            results[day] = messages[day]
+
+        _save_checkpoint(checkpoint_path, checkpoint_key, completed)
+
+        logger.info(
+            f"✓ 백필 진행: {min(i + chunk_days, len(target_days))}/{len(target_days)}일 "
+            f"({chunk[0]} ~ {chunk[-1]}, 소요 시간: {time.time() - step_start:.2f}초)"
+        )
+
+    return results
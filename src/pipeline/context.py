@@ -0,0 +1,162 @@
+"""
+파이프라인 실행 자원 관리 모듈
+DB 연결, 문구 생성기, 출력 핸들러를 실행 사이에 유지하여
+데몬 모드에서 매 실행마다 재연결/헬스 체크 비용을 내지 않도록 합니다.
+"""
+
+import os
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+import logging
+
+from ..database.connection import DatabaseConnection
+from ..output.display_handler import DisplayHandler
+from .run_state import RunState
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineContext:
+    """실행 사이에 재사용되는 파이프라인 자원 클래스"""
+
+    def __init__(self, use_api_mode: Optional[bool] = None, log_dir: str = './data/logs'):
+        """
+        Args:
+            use_api_mode: 모델 서버 API 사용 여부 (기본값: 환경변수 USE_MODEL_SERVER 또는 true)
+            log_dir: 문구 로그 디렉토리
+        """
+        if use_api_mode is None:
+            use_api_mode = os.getenv('USE_MODEL_SERVER', 'true').lower() == 'true'
+        self.use_api_mode = use_api_mode
+
+        self.display = DisplayHandler(log_dir)
+        self._db: Optional[DatabaseConnection] = None
+        self._secondary_db: Optional[DatabaseConnection] = None
+        self._generator = None
+        self._generator_lock = threading.Lock()
+        self._run_state: Optional[RunState] = None
+
+        # 단계 병렬 실행용 (어제 데이터 조회, 생성기 준비) 및 출력 후 로그 기록용 스레드
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pipeline')
+        self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pipeline-output')
+
+        # 여러 사이트 문구 동시 생성용 스레드 (첫 사용 시 생성, 실행 사이에 유지)
+        self._generation_executor: Optional[ThreadPoolExecutor] = None
+        self._generation_executor_lock = threading.Lock()
+
+    @property
+    def db(self) -> DatabaseConnection:
+        """DB 연결 (첫 접근 시 연결, 이후에는 연결 상태만 확인)"""
+        if self._db is None:
+            self._db = DatabaseConnection()
+        else:
+            self._db.ensure_connection()
+        return self._db
+
+    @property
+    def secondary_db(self) -> DatabaseConnection:
+        """병렬 조회용 두 번째 DB 연결 (pymysql 연결은 스레드 간 공유 불가)"""
+        if self._secondary_db is None:
+            self._secondary_db = DatabaseConnection()
+        else:
+            self._secondary_db.ensure_connection()
+        return self._secondary_db
+
+    @property
+    def generator(self):
+        """문구 생성기 (첫 접근 시 생성 및 서버 헬스 체크)"""
+        with self._generator_lock:
+            if self._generator is None:
+                if self.use_api_mode:
+                    from ..generator.llm_generator_local_api import MessageGeneratorLocalAPI
+
+                    logger.info("모드: 로컬 모델 서버 API 사용")
+                    self._generator = MessageGeneratorLocalAPI()
+                else:
+                    from ..generator.llm_generator import MessageGenerator
+
+                    logger.info("모드: 직접 모델 로드")
+                    self._generator = MessageGenerator()
+            return self._generator
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        단계 병렬 실행 (현재 추적 span이 작업 스레드에서도 이어지도록 컨텍스트 복사)
+
+        Args:
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            Future: 실행 결과
+        """
+        return self.executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+    def submit_generation(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        문구 생성 동시 실행 (동시 생성 수: 환경변수 MODEL_SERVER_MAX_CONCURRENCY 또는 8)
+        생성기의 keep-alive 세션, 지연 예산, 헤지 요청을 그대로 사용하도록 동기 생성기를 스레드에서 호출합니다.
+
+        Args:
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            Future: 실행 결과
+        """
+        with self._generation_executor_lock:
+            if self._generation_executor is None:
+                self._generation_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv('MODEL_SERVER_MAX_CONCURRENCY', 8)),
+                    thread_name_prefix='pipeline-generate'
+                )
+        return self._generation_executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+    @property
+    def run_state(self) -> RunState:
+        """사이트별 마지막 실행 입력 해시 (첫 접근 시 파일 로드)"""
+        if self._run_state is None:
+            self._run_state = RunState()
+        return self._run_state
+
+    def run_in_background(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        전광판 갱신 이후의 로그/파일 출력을 백그라운드에서 순서대로 실행
+
+        Args:
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            Future: 실행 결과
+        """
+        def run():
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"백그라운드 작업 실패 ({getattr(func, '__name__', func)}): {e}", exc_info=True)
+
+        return self._background.submit(run)
+
+    def close(self):
+        """백그라운드 작업 완료 대기 후 DB 연결 종료"""
+        self._background.shutdown(wait=True)
+        self.executor.shutdown(wait=True)
+        if self._generation_executor is not None:
+            self._generation_executor.shutdown(wait=True)
+            self._generation_executor = None
+        for db in (self._db, self._secondary_db):
+            if db is not None:
+                db.close()
+        self._db = None
+        self._secondary_db = None
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
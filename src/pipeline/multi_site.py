@@ -0,0 +1,329 @@
+"""
+여러 사이트 동시 실행 모듈
+모든 사이트 데이터를 한 번의 쿼리로 조회하고 일괄 분석한 뒤,
+문구 생성은 동시 요청 수를 제한하여 병렬로 실행합니다.
+"""
+
+import time
+import threading
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from ..analyzer.sensor_data_fetcher import SensorDataFetcher
+from ..analyzer.weather_analyzer import WeatherAnalyzer
+from ..generator.base_generator import is_fallback
+from ..tracing import span
+from .context import PipelineContext
+from .run_state import input_hash
+from .sites import Site
+
+logger = logging.getLogger(__name__)
+
+
+def site_object_ids(sites: List[Site]) -> Optional[List[str]]:
+    """조회할 object_id 리스트 (object_id가 없는 사이트가 있으면 None = 전체)"""
+    if all(site.object_id for site in sites):
+        return sorted({site.object_id for site in sites})
+    return None
+
+
+def fetch_site_rows(ctx: PipelineContext, sites: List[Site], target_date: date) -> List[Dict]:
+    """
+    전체 사이트의 오늘/어제 시간별 집계 행을 한 번에 조회
+
+    Returns:
+        list: SensorDataFetcher.get_sites_statistics() 형식의 집계 행 리스트
+    """
+    target_dates = [target_date]
+    if any(site.compare for site in sites):
+        target_dates.append(target_date - timedelta(days=1))
+
+    return SensorDataFetcher(ctx.db).get_sites_statistics(target_dates, site_object_ids(sites))
+
+
+def _build_site_data(rows: List[Dict], sites: List[Site], target_date: date) -> Dict[str, Dict]:
+    """
+    집계 행에서 사이트별 오늘/어제 센서 데이터 구성
+
+    Returns:
+        dict: 사이트 이름 → {'today': 센서 데이터, 'yesterday': 센서 데이터 또는 None}
+    """
+    yesterday_date = target_date - timedelta(days=1)
+
+    # 사이트마다 전체 행을 훑지 않도록 (object_id, 날짜)별로 미리 분류
+    rows_by_key = defaultdict(list)
+    for row in rows:
+        date_str = str(row['statistics_date'])
+        rows_by_key[(row['object_id'], date_str)].append(row)
+        rows_by_key[(None, date_str)].append(row)
+
+    site_data = {}
+    for site in sites:
+        data = {}
+        for key, day in (('today', target_date), ('yesterday', yesterday_date)):
+            if key == 'yesterday' and not site.compare:
+                data[key] = None
+                continue
+            data[key] = SensorDataFetcher.build_daily_statistics(
+                rows_by_key.get((site.object_id, day.strftime('%Y-%m-%d')), []),
+                day,
+                device_ids=site.device_ids,
+                object_id=site.object_id
+            )
+        site_data[site.name] = data
+
+    return site_data
+
+
+def _generate_concurrent(
+    ctx: PipelineContext,
+    jobs: List[Dict],
+    max_concurrency: Optional[int]
+) -> Dict[str, object]:
+    """API 모드: 미리 준비된 생성기로 동시 요청 수를 제한하여 생성 (지연 예산, 헤지 요청 적용)"""
+    generator = ctx.generator
+    limit = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+    def generate(job: Dict) -> str:
+        with limit or nullcontext():
+            if job['comparison']:
+                return generator.generate_comparison_message(job['comparison'])
+            if job['site'].multiple:
+                return generator.generate_multiple_messages(job['analysis'], num_messages=3)[0]
+            return generator.generate_message(job['analysis'])
+
+    futures = {job['site'].name: ctx.submit_generation(generate, job) for job in jobs}
+
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = e
+    return results
+
+
+def _generate_direct(ctx: PipelineContext, jobs: List[Dict]) -> Dict[str, str]:
+    """직접 로드 모드: 온도 비교 문구는 배치 생성, 나머지는 순차 생성"""
+    generator = ctx.generator
+    results = {}
+
+    comparison_jobs = [job for job in jobs if job['comparison']]
+    if comparison_jobs:
+        try:
+            messages = generator.generate_comparison_messages([job['comparison'] for job in comparison_jobs])
+        except Exception as e:
+            messages = [e] * len(comparison_jobs)
+        for job, message in zip(comparison_jobs, messages):
+            results[job['site'].name] = message
+
+    for job in jobs:
+        if job['comparison']:
+            continue
+        try:
+            if job['site'].multiple:
+                results[job['site'].name] = generator.generate_multiple_messages(job['analysis'], num_messages=3)[0]
+            else:
+                results[job['site'].name] = generator.generate_message(job['analysis'])
+        except Exception as e:
+            results[job['site'].name] = e
+
+    return results
+
+
+def prepare_site_jobs(
+    ctx: PipelineContext,
+    sites: List[Site],
+    target_date: date,
+    force: bool = False,
+    rows: Optional[List[Dict]] = None
+) -> Tuple[Dict[str, Optional[Dict]], List[Dict]]:
+    """
+    통합 조회 + 일괄 분석으로 사이트별 생성 작업 구성 (입력이 이전 실행과 같은 사이트는 제외)
+
+    Args:
+        ctx: 실행 자원
+        sites: 실행할 사이트 리스트
+        target_date: 조회할 날짜 (오늘)
+        force: 입력이 이전 실행과 같은 사이트도 작업에 포함
+        rows: 이미 조회한 집계 행 (감시 모드의 증분 갱신, None이면 새로 조회)
+
+    Returns:
+        tuple: (사이트 이름 → 결과 (입력 변화 없는 사이트만 채워짐, 나머지는 None),
+                생성 작업 리스트 {'site', 'analysis', 'comparison', 'digest'})
+    """
+    results: Dict[str, Optional[Dict]] = {site.name: None for site in sites}
+    if not sites:
+        return results, []
+
+    # 1. 통합 조회
+    step_start = time.time()
+    with span('db.fetch_sites', sites=len(sites)):
+        if rows is None:
+            rows = fetch_site_rows(ctx, sites, target_date)
+        site_data = _build_site_data(rows, sites, target_date)
+    logger.info(f"✓ {len(sites)}개 사이트 데이터 조회 완료 (소요 시간: {time.time() - step_start:.2f}초)")
+
+    # 2. 일괄 분석
+    step_start = time.time()
+    valid_sites = []
+    for site in sites:
+        if site_data[site.name]['today']['temperature']['hourly_data']:
+            valid_sites.append(site)
+        else:
+            logger.warning(f"⚠️  [{site.name}] 오늘 온도 데이터가 없습니다.")
+
+    with span('analyze', sites=len(valid_sites)):
+        today_analyses = WeatherAnalyzer.analyze_batch([site_data[site.name]['today'] for site in valid_sites])
+
+        compare_sites = [
+            site for site in valid_sites
+            if site.compare and site_data[site.name]['yesterday']['temperature']['hourly_data']
+        ]
+        yesterday_analyses = dict(zip(
+            [site.name for site in compare_sites],
+            WeatherAnalyzer.analyze_batch([site_data[site.name]['yesterday'] for site in compare_sites])
+        ))
+
+    jobs = []
+    for site, today_analysis in zip(valid_sites, today_analyses):
+        comparison = None
+        if site.name in yesterday_analyses:
+            comparison = WeatherAnalyzer.compare_two_days(yesterday_analyses[site.name], today_analysis)
+        digest = input_hash(target_date, today_analysis, comparison, site.multiple)
+
+        # 입력이 이전 실행과 같은 사이트는 이전 문구 유지 (생성/출력 생략)
+        previous_message = None if force else ctx.run_state.get_unchanged(site.name, digest)
+        if previous_message is not None:
+            results[site.name] = {
+                'message': previous_message,
+                'today_analysis': today_analysis,
+                'comparison_result': comparison,
+                'unchanged': True
+            }
+            continue
+
+        jobs.append({'site': site, 'analysis': today_analysis, 'comparison': comparison, 'digest': digest})
+
+    unchanged = len(valid_sites) - len(jobs)
+    logger.info(f"✓ 일괄 분석 완료 (입력 변화 없음 {unchanged}개, 소요 시간: {time.time() - step_start:.2f}초)")
+    return results, jobs
+
+
+def generate_site_messages(
+    ctx: PipelineContext,
+    jobs: List[Dict],
+    max_concurrency: Optional[int] = None
+) -> Dict[str, object]:
+    """
+    생성 작업의 문구를 동시에 생성
+
+    Returns:
+        dict: 사이트 이름 → 문구 (실패 시 예외 객체)
+    """
+    step_start = time.time()
+    with span('generate', sites=len(jobs)):
+        if ctx.use_api_mode:
+            messages = _generate_concurrent(ctx, jobs, max_concurrency)
+        else:
+            messages = _generate_direct(ctx, jobs)
+    logger.info(f"✓ {len(jobs)}개 사이트 문구 생성 완료 (소요 시간: {time.time() - step_start:.2f}초)")
+    return messages
+
+
+def publish_site_message(
+    ctx: PipelineContext,
+    job: Dict,
+    message,
+    target_date: date,
+    background: bool = True
+) -> Optional[Dict]:
+    """
+    생성된 문구를 전광판에 출력하고 로그/텍스트 파일/실행 상태 기록 (폴백 문구는 실행 상태 제외)
+
+    Args:
+        ctx: 실행 자원
+        job: 생성 작업
+        message: 생성 결과 (문구 또는 예외 객체)
+        target_date: 대상 날짜
+        background: 로그/파일 기록을 백그라운드에서 할지 여부 (False면 기록까지 마친 뒤 반환)
+
+    Returns:
+        dict: {'message', 'today_analysis', 'comparison_result', 'unchanged'} (실패 시 None)
+    """
+    site = job['site']
+    if isinstance(message, Exception) or not message:
+        logger.error(f"✗ [{site.name}] 문구 생성 실패: {message}")
+        return None
+
+    try:
+        with span('output', site=site.name):
+            ctx.display.send_to_display(message)
+    except Exception as e:
+        logger.error(f"✗ [{site.name}] 출력 실패: {e}", exc_info=True)
+        return None
+
+    # 문구 로그/텍스트 파일은 전광판 갱신 후 기록
+    writes = [
+        (ctx.display.log_message, (target_date, message, job['analysis']), {'site': site.name}),
+        (ctx.display.export_to_text, (message, job['analysis']), {'output_file': site.board})
+    ]
+    if is_fallback(message):
+        # 폴백 문구는 기록하지 않아 같은 입력의 다음 실행에서 LLM 생성을 다시 시도
+        logger.warning(f"⚠️  [{site.name}] 폴백 문구 출력: 실행 상태를 기록하지 않습니다.")
+    else:
+        writes.append((ctx.run_state.put, (site.name, job['digest'], message), {}))
+    for func, args, kwargs in writes:
+        if background:
+            ctx.run_in_background(func, *args, **kwargs)
+        else:
+            func(*args, **kwargs)
+
+    return {
+        'message': message,
+        'today_analysis': job['analysis'],
+        'comparison_result': job['comparison'],
+        'unchanged': False
+    }
+
+
+def run_sites(
+    ctx: PipelineContext,
+    sites: List[Site],
+    target_date: date,
+    max_concurrency: Optional[int] = None,
+    force: bool = False,
+    rows: Optional[List[Dict]] = None
+) -> Dict[str, Optional[Dict]]:
+    """
+    여러 사이트의 파이프라인을 한 번에 실행 (사이트별 실패는 서로 영향 없음)
+
+    Args:
+        ctx: 실행 자원
+        sites: 실행할 사이트 리스트
+        target_date: 조회할 날짜 (오늘)
+        max_concurrency: 동시 생성 요청 수 (기본값: 환경변수 MODEL_SERVER_MAX_CONCURRENCY 또는 8, 그보다 크게는 불가)
+        force: 입력이 이전 실행과 같은 사이트도 문구를 다시 생성하고 출력
+        rows: 이미 조회한 집계 행 (감시 모드의 증분 갱신, None이면 새로 조회)
+
+    Returns:
+        dict: 사이트 이름 → {'message', 'today_analysis', 'comparison_result', 'unchanged'} (실패 시 None)
+    """
+    # 1~2. 통합 조회 + 일괄 분석
+    results, jobs = prepare_site_jobs(ctx, sites, target_date, force=force, rows=rows)
+    if not jobs:
+        return results
+
+    # 3. 동시 생성
+    messages = generate_site_messages(ctx, jobs, max_concurrency)
+
+    # 4. 사이트별 출력
+    for job in jobs:
+        results[job['site'].name] = publish_site_message(ctx, job, messages.get(job['site'].name), target_date)
+
+    succeeded = sum(1 for result in results.values() if result)
+    logger.info(f"사이트 실행 결과: 성공 {succeeded}/{len(sites)}")
+    return results
@@ -0,0 +1,207 @@
+"""
+다음 날 문구 사전 생성 모듈
+끝난 날(기준일)까지의 분석값으로 대상일 입력을 추정(추세 또는 평년값)하고,
+추정값 주변의 후보 비교 문구를 한가한 시간(자정 이후, 아침 갱신 전)에 미리 생성하여 문구 캐시에 저장합니다.
+아침 갱신 시 실제 입력이 후보와 같으면(반올림 기준) 모델 호출 없이 캐시에서 바로 사용됩니다.
+"""
+
+import os
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+
+from ..analyzer.sensor_data_fetcher import SensorDataFetcher
+from ..analyzer.weather_analyzer import WeatherAnalyzer
+from ..tracing import span
+from .context import PipelineContext
+from .multi_site import site_object_ids
+from .sites import Site
+
+logger = logging.getLogger(__name__)
+
+# 추정에 사용하는 센서 데이터 항목
+_FIELDS = (('temperature', 'max'), ('temperature', 'min'), ('temperature', 'avg'),
+           ('humidity', 'max'), ('humidity', 'min'), ('humidity', 'avg'))
+
+
+def default_target_date(now: Optional[datetime] = None) -> date:
+    """
+    사전 생성 대상 날짜 (오늘 아침 갱신용)
+    기준일(어제)이 끝나야 아침 갱신과 같은 최종 하루 통계로 후보를 만들 수 있으므로
+    내일 문구는 만들지 않습니다.
+
+    Args:
+        now: 현재 시각 (기본값: datetime.now())
+
+    Returns:
+        date: 대상 날짜
+    """
+    now = now or datetime.now()
+    return now.date()
+
+
+def project_values(history: List[Dict], method: str = 'trend') -> Dict[tuple, float]:
+    """
+    지난 며칠의 센서 데이터로 다음 날 값 추정
+
+    Args:
+        history: 날짜순(오래된 것부터) 센서 데이터 리스트 (마지막 항목이 기준일)
+        method: 'trend' (선형 추세) 또는 'climatology' (기간 평균)
+
+    Returns:
+        dict: (항목, 통계) → 추정값
+    """
+    projected = {}
+    n = len(history)
+    for field, stat in _FIELDS:
+        values = [data[field][stat] for data in history]
+        mean = sum(values) / n
+
+        if method == 'trend' and n >= 2:
+            # 최소제곱 직선을 다음 날(x = n)로 연장
+            x_mean = (n - 1) / 2
+            slope = (
+                sum((x - x_mean) * (value - mean) for x, value in enumerate(values))
+                / sum((x - x_mean) ** 2 for x in range(n))
+            )
+            projected[(field, stat)] = mean + slope * (n - x_mean)
+        else:
+            projected[(field, stat)] = mean
+
+    return projected
+
+
+def candidate_sensor_data(projected: Dict[tuple, float], target_date: date, spread: int) -> List[Dict]:
+    """
+    추정 평균 온도 주변의 정수 온도별 후보 센서 데이터 (analyze_batch 입력 형식)
+
+    Args:
+        projected: project_values() 결과
+        target_date: 대상 날짜
+        spread: 추정값 위아래로 만들 후보 온도 범위 (°C)
+
+    Returns:
+        list: 후보 센서 데이터 리스트
+    """
+    center = round(projected[('temperature', 'avg')])
+    candidates = []
+    for avg_temp in range(center - spread, center + spread + 1):
+        # 최고/최저 온도는 평균과의 간격을 유지한 채 이동 (일교차 카테고리 유지)
+        shift = avg_temp - projected[('temperature', 'avg')]
+        candidates.append({
+            'date': target_date,
+            'temperature': {
+                'max': projected[('temperature', 'max')] + shift,
+                'min': projected[('temperature', 'min')] + shift,
+                'avg': float(avg_temp)
+            },
+            'humidity': {stat: projected[('humidity', stat)] for stat in ('max', 'min', 'avg')}
+        })
+    return candidates
+
+
+def run_pregeneration(
+    ctx: PipelineContext,
+    sites: List[Site],
+    target_date: Optional[date] = None,
+    method: Optional[str] = None,
+    history_days: Optional[int] = None,
+    spread: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    사이트별 다음 날 후보 비교 문구를 생성하여 문구 캐시에 저장
+
+    Args:
+        ctx: 실행 자원
+        sites: 사이트 리스트 (어제와 비교하는 사이트만 대상)
+        target_date: 문구를 미리 만들 날짜 (기본값: default_target_date())
+        method: 추정 방법 'trend' 또는 'climatology' (기본값: 환경변수 PREGEN_METHOD 또는 trend)
+        history_days: 추정에 사용할 일수 (기본값: 환경변수 PREGEN_HISTORY_DAYS 또는 7)
+        spread: 추정 평균 온도 위아래 후보 범위 (°C, 기본값: 환경변수 PREGEN_SPREAD 또는 2)
+
+    Returns:
+        dict: 사이트 이름 → 생성(또는 캐시 확인)한 후보 문구 수
+    """
+    target_date = target_date or default_target_date()
+    method = method or os.getenv('PREGEN_METHOD', 'trend')
+    history_days = history_days or int(os.getenv('PREGEN_HISTORY_DAYS', 7))
+    spread = spread if spread is not None else int(os.getenv('PREGEN_SPREAD', 2))
+
+    base_date = target_date - timedelta(days=1)
+    history_dates = [base_date - timedelta(days=i) for i in range(history_days - 1, -1, -1)]
+
+    # 진행 중인 날의 부분 통계로 만든 문구는 아침 갱신의 '어제'(최종 통계)와 캐시 키가 달라 쓰이지 않음
+    if base_date >= date.today():
+        logger.warning(f"⚠️  기준일({base_date})이 아직 끝나지 않아 사전 생성을 건너뜁니다. 자정 이후에 실행하세요.")
+        return {}
+
+    compare_sites = [site for site in sites if site.compare]
+    if len(compare_sites) < len(sites):
+        logger.info(f"비교 문구를 쓰지 않는 사이트 {len(sites) - len(compare_sites)}개는 사전 생성에서 제외")
+    if not compare_sites:
+        return {}
+
+    generator = ctx.generator
+    if getattr(generator, 'message_cache', None) is None:
+        logger.warning("⚠️  문구 캐시가 비활성화되어 있어 사전 생성 결과를 사용할 수 없습니다 (MESSAGE_CACHE_ENABLED).")
+        return {}
+
+    logger.info(f"사전 생성 대상: {target_date} (기준일 {base_date}, 추정: {method} {history_days}일, 후보 ±{spread}°C)")
+
+    # 1. 기간 통합 조회
+    step_start = time.time()
+    with span('db.fetch_history', sites=len(compare_sites)):
+        rows = SensorDataFetcher(ctx.db).get_sites_statistics(history_dates, site_object_ids(compare_sites))
+
+    rows_by_key = defaultdict(list)
+    for row in rows:
+        date_str = str(row['statistics_date'])
+        rows_by_key[(row['object_id'], date_str)].append(row)
+        rows_by_key[(None, date_str)].append(row)
+    logger.info(f"✓ 기간 데이터 조회 완료 (소요 시간: {time.time() - step_start:.2f}초)")
+
+    # 2. 사이트별 다음 날 추정 및 후보 비교 데이터 구성
+    comparisons: List[Dict] = []
+    site_counts: Dict[str, int] = {}
+    for site in compare_sites:
+        history = []
+        for day in history_dates:
+            data = SensorDataFetcher.build_daily_statistics(
+                rows_by_key.get((site.object_id, day.isoformat()), []),
+                day,
+                device_ids=site.device_ids,
+                object_id=site.object_id
+            )
+            if data['temperature']['hourly_data'] and data['humidity']['hourly_data']:
+                history.append(data)
+
+        # 아침 갱신의 '어제'가 될 기준일 데이터가 있어야 비교 문구를 만들 수 있음
+        if not history or history[-1]['date'] != base_date:
+            logger.warning(f"⚠️  [{site.name}] 기준일({base_date}) 데이터가 없어 사전 생성을 건너뜁니다.")
+            continue
+
+        base_analysis, *candidate_analyses = WeatherAnalyzer.analyze_batch(
+            [history[-1]] + candidate_sensor_data(project_values(history, method), target_date, spread)
+        )
+        site_comparisons = [
+            WeatherAnalyzer.compare_two_days(base_analysis, candidate)
+            for candidate in candidate_analyses
+        ]
+        comparisons.extend(site_comparisons)
+        site_counts[site.name] = len(site_comparisons)
+
+    if not comparisons:
+        return site_counts
+
+    # 3. 배치 생성 (이미 캐시에 있는 후보는 생성 생략)
+    step_start = time.time()
+    with span('generate', candidates=len(comparisons)):
+        generator.generate_comparison_messages(comparisons)
+    logger.info(
+        f"✓ 후보 문구 {len(comparisons)}개 사전 생성 완료 "
+        f"({len(site_counts)}개 사이트, 소요 시간: {time.time() - step_start:.2f}초)"
+    )
+
+    return site_counts
@@ -0,0 +1,127 @@
+"""
+실행 입력 해시 저장 모듈
+사이트별 마지막 실행의 입력 해시(반올림한 분석값, 프롬프트 버전, 어댑터)와 문구를 기록하여
+입력이 바뀌지 않은 재실행에서는 모델 호출과 전광판/로그 출력을 생략합니다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import date, datetime
+from typing import Dict, Optional
+import logging
+
+from ..generator.message_cache import comparison_cache_key, display_cache_key
+from .state_file import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def input_hash(
+    target_date: date,
+    today_analysis: Dict,
+    comparison_result: Optional[Dict] = None,
+    generate_multiple: bool = False
+) -> str:
+    """
+    실행 입력 해시 (문구 캐시 키와 같은 정규화 + 날짜)
+
+    Args:
+        target_date: 대상 날짜 (날짜가 바뀌면 같은 입력이어도 새로 기록)
+        today_analysis: 오늘 분석 결과
+        comparison_result: 어제와 비교 결과 (비교 모드인 경우)
+        generate_multiple: 여러 문구 생성 모드 여부
+
+    Returns:
+        str: 입력 해시
+    """
+    if comparison_result:
+        key = comparison_cache_key(comparison_result)
+    else:
+        key = display_cache_key(today_analysis, multiple=generate_multiple)
+    return hashlib.sha256(f"{target_date.isoformat()}:{key}".encode('utf-8')).hexdigest()
+
+
+class RunState:
+    """사이트별 마지막 실행 입력 해시/문구 저장 클래스 (JSON 파일)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 상태 파일 경로 (기본값: 환경변수 RUN_STATE_PATH 또는 ./data/state/run_state.json)
+        """
+        self.path = path or os.getenv('RUN_STATE_PATH', './data/state/run_state.json')
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._state: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """상태 파일 로드 (없거나 깨졌으면 빈 상태)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            self._mtime = os.path.getmtime(self.path)
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️  실행 상태 파일을 읽을 수 없습니다 ({self.path}): {e}")
+            return {}
+
+    def _refresh(self):
+        """다른 프로세스가 파일을 갱신했으면 다시 로드 (_lock 안에서 호출)"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._state.update(self._load())
+
+    def has(self, key: str) -> bool:
+        """이전 실행 기록 여부"""
+        with self._lock:
+            self._refresh()
+            return key in self._state
+
+    def get_unchanged(self, key: str, digest: str) -> Optional[str]:
+        """
+        입력 해시가 이전 실행과 같으면 이전 문구 반환
+
+        Args:
+            key: 사이트 구분 키
+            digest: input_hash() 결과
+
+        Returns:
+            str: 이전 문구 (입력이 바뀌었거나 기록이 없으면 None)
+        """
+        with self._lock:
+            self._refresh()
+            entry = self._state.get(key)
+        if entry and entry.get('input_hash') == digest:
+            return entry.get('message')
+        return None
+
+    def put(self, key: str, digest: str, message: str):
+        """
+        실행 결과 기록 (파일 잠금 후 다시 읽어 병합, 임시 파일에 쓴 뒤 교체)
+
+        Args:
+            key: 사이트 구분 키
+            digest: input_hash() 결과
+            message: 출력한 문구
+        """
+        # 스레드 간에는 _lock, 같은 파일을 쓰는 다른 프로세스(작업 큐 소비자 등)와는 파일 잠금으로 보호하고
+        # 잠근 상태에서 파일을 다시 읽어 병합하므로 다른 프로세스의 기록을 덮어쓰지 않음
+        with self._lock:
+            try:
+                with file_lock(self.path):
+                    self._state.update(self._load())
+                    self._state[key] = {
+                        'input_hash': digest,
+                        'message': message,
+                        'updated_at': datetime.now().isoformat()
+                    }
+                    write_json_atomic(self.path, self._state, indent=2)
+                    self._mtime = os.path.getmtime(self.path)
+            except OSError as e:
+                logger.warning(f"⚠️  실행 상태 저장 실패 ({self.path}): {e}")
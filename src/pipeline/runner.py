@@ -0,0 +1,200 @@
+"""
+센서 데이터 조회 → 분석 → 문구 생성 → 출력 파이프라인 실행 모듈
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+import logging
+
+from ..analyzer.sensor_data_fetcher import SensorDataFetcher
+from ..analyzer.weather_analyzer import WeatherAnalyzer
+from ..generator.base_generator import is_fallback
+from ..tracing import span
+from .context import PipelineContext
+from .run_state import input_hash
+
+logger = logging.getLogger(__name__)
+
+
+def run_pipeline(
+    ctx: PipelineContext,
+    target_date: date,
+    device_ids: Optional[List[str]] = None,
+    object_id: Optional[str] = None,
+    generate_multiple: bool = False,
+    compare_with_yesterday: bool = True,
+    board: Optional[str] = None,
+    site: Optional[str] = None,
+    force: bool = False
+) -> Optional[Dict]:
+    """
+    한 사이트의 파이프라인 1회 실행 (2~5단계)
+
+    Args:
+        ctx: 실행 자원 (DB 연결, 생성기, 출력 핸들러)
+        target_date: 조회할 날짜 (오늘)
+        device_ids: 디바이스 ID 리스트 (기본값: 전체)
+        object_id: 객체 ID (사이트 위치/그룹)
+        generate_multiple: 여러 개의 문구 생성 여부
+        compare_with_yesterday: 어제와 비교할지 여부
+        board: 전광판 텍스트 출력 파일 (기본값: ./data/current_message.txt)
+        site: 사이트 이름 (로그 구분용)
+        force: 입력이 이전 실행과 같아도 문구를 다시 생성하고 출력
+
+    Returns:
+        dict: {'message', 'today_analysis', 'comparison_result', 'unchanged'} (오늘 데이터가 없으면 None)
+    """
+    yesterday_date = target_date - timedelta(days=1)
+    state_key = site or board or object_id or 'default'
+
+    # 생성기 준비(모델 서버 헬스 체크)는 DB 조회와 동시에 진행
+    # (이전 실행 기록이 있으면 입력이 바뀐 경우에만 필요하므로 미리 준비하지 않음)
+    generator_future = None
+    if force or not ctx.run_state.has(state_key):
+        generator_future = ctx.submit(lambda: ctx.generator)
+
+    # 2. 센서 데이터 조회 (어제 데이터는 두 번째 연결로 동시에 조회)
+    logger.info("[2단계] 센서 데이터 조회 중...")
+    step_start = time.time()
+
+    def fetch_yesterday():
+        with span('db.fetch_yesterday'):
+            return SensorDataFetcher(ctx.secondary_db).get_daily_statistics(
+                target_date=yesterday_date,
+                device_ids=device_ids,
+                object_id=object_id
+            )
+
+    yesterday_future = None
+    if compare_with_yesterday:
+        yesterday_future = ctx.submit(fetch_yesterday)
+
+    with span('db.fetch_today'):
+        fetcher = SensorDataFetcher(ctx.db)
+
+        # 사용 가능한 디바이스 확인
+        if device_ids is None and object_id is None:
+            available_devices = fetcher.get_available_devices(target_date)
+            logger.info(f"사용 가능한 디바이스:")
+            logger.info(f"  - 온도 센서: {', '.join(available_devices['temperature'])}")
+            logger.info(f"  - 습도 센서: {', '.join(available_devices['humidity'])}")
+
+        # 오늘 데이터 조회
+        today_sensor_data = fetcher.get_daily_statistics(
+            target_date=target_date,
+            device_ids=device_ids,
+            object_id=object_id
+        )
+
+    # 데이터 확인
+    if not today_sensor_data['temperature']['hourly_data']:
+        logger.warning("⚠️  오늘 온도 데이터가 없습니다.")
+        return None
+
+    # 어제 데이터 조회 결과 (비교 모드인 경우)
+    yesterday_sensor_data = None
+    if yesterday_future is not None:
+        with span('db.wait_yesterday'):
+            yesterday_sensor_data = yesterday_future.result()
+        if not yesterday_sensor_data['temperature']['hourly_data']:
+            logger.warning("⚠️  어제 온도 데이터가 없습니다. 비교 모드를 해제합니다.")
+            compare_with_yesterday = False
+
+    step_elapsed = time.time() - step_start
+    logger.info(f"✓ 데이터 조회 완료 (소요 시간: {step_elapsed:.2f}초)")
+
+    # 3. 데이터 분석
+    logger.info("[3단계] 데이터 분석 중...")
+    step_start = time.time()
+
+    with span('analyze'):
+        today_analyzer = WeatherAnalyzer(today_sensor_data)
+        today_analysis = today_analyzer.analyze()
+
+    logger.info(f"오늘 분석 결과:")
+    logger.info(f"  - 최저 온도: {today_analysis['min_temp']}°C")
+    logger.info(f"  - 최고 온도: {today_analysis['max_temp']}°C")
+    logger.info(f"  - 평균 온도: {today_analysis['avg_temp']}°C")
+    logger.info(f"  - 일교차: {today_analysis['temp_diff']}°C ({today_analysis['temp_diff_category']})")
+    logger.info(f"  - 평균 습도: {today_analysis['avg_humidity']}% ({today_analysis['humidity_category']})")
+
+    # 어제와 비교 (비교 모드인 경우)
+    comparison_result = None
+    if compare_with_yesterday and yesterday_sensor_data:
+        with span('analyze', day='yesterday'):
+            yesterday_analyzer = WeatherAnalyzer(yesterday_sensor_data)
+            yesterday_analysis = yesterday_analyzer.analyze()
+
+        logger.info(f"어제 분석 결과:")
+        logger.info(f"  - 평균 온도: {yesterday_analysis['avg_temp']}°C")
+
+        comparison_result = WeatherAnalyzer.compare_two_days(yesterday_analysis, today_analysis)
+
+    step_elapsed = time.time() - step_start
+    logger.info(f"✓ 데이터 분석 완료 (소요 시간: {step_elapsed:.2f}초)")
+
+    # 입력이 이전 실행과 같으면 이전 문구를 그대로 사용 (모델 호출, 출력 파일 갱신 생략)
+    digest = input_hash(target_date, today_analysis, comparison_result, generate_multiple)
+    previous_message = None if force else ctx.run_state.get_unchanged(state_key, digest)
+    if previous_message is not None:
+        logger.info(f"✓ 입력 변화 없음: 이전 문구 유지 (--force 로 다시 생성) - {previous_message}")
+        return {
+            'message': previous_message,
+            'today_analysis': today_analysis,
+            'comparison_result': comparison_result,
+            'unchanged': True
+        }
+
+    # 4. LLM 문구 생성
+    logger.info("[4단계] LLM 문구 생성 중...")
+    step_start = time.time()
+
+    with span('generator.ready'):
+        generator = generator_future.result() if generator_future is not None else ctx.generator
+
+    with span('generate'):
+        if comparison_result:
+            # 어제와 오늘 비교 문구 생성
+            message = generator.generate_comparison_message(comparison_result)
+        elif generate_multiple:
+            # 여러 개의 문구 생성
+            messages = generator.generate_multiple_messages(today_analysis, num_messages=3)
+            logger.info(f"생성된 문구들:")
+            for i, msg in enumerate(messages, 1):
+                logger.info(f"  {i}. {msg}")
+
+            # 첫 번째 문구 사용
+            message = messages[0]
+        else:
+            # 단일 문구 생성
+            message = generator.generate_message(today_analysis)
+
+    step_elapsed = time.time() - step_start
+    logger.info(f"✓ 문구 생성 완료 (소요 시간: {step_elapsed:.2f}초)")
+
+    # 5. 출력 및 로깅
+    logger.info("[5단계] 출력 및 로깅...")
+    step_start = time.time()
+    display = ctx.display
+    with span('output'):
+        display.send_to_display(message)
+
+    # 문구 로그/텍스트 파일은 전광판 갱신 후 백그라운드에서 기록 (종료 시 ctx.close()가 완료 대기)
+    ctx.run_in_background(display.log_message, target_date, message, today_analysis, site=site)
+    ctx.run_in_background(display.export_to_text, message, today_analysis, output_file=board)
+    if is_fallback(message):
+        # 폴백 문구는 기록하지 않아 같은 입력의 다음 실행에서 LLM 생성을 다시 시도
+        logger.warning("⚠️  폴백 문구 출력: 실행 상태를 기록하지 않습니다.")
+    else:
+        ctx.run_in_background(ctx.run_state.put, state_key, digest, message)
+
+    step_elapsed = time.time() - step_start
+    logger.info(f"✓ 출력 및 로깅 완료 (소요 시간: {step_elapsed:.2f}초)")
+
+    return {
+        'message': message,
+        'today_analysis': today_analysis,
+        'comparison_result': comparison_result,
+        'unchanged': False
+    }
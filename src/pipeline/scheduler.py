@@ -0,0 +1,184 @@
+"""
+데몬 모드 스케줄러 모듈
+사이트별 cron 표현식에 따라 파이프라인을 실행하며,
+DB 연결/HTTP 세션/캐시를 프로세스 안에서 계속 유지합니다.
+"""
+
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Set
+import logging
+
+from ..tracing import trace
+from .context import PipelineContext
+from .multi_site import run_sites
+from .pregenerate import run_pregeneration
+from .sites import Site
+
+logger = logging.getLogger(__name__)
+
+
+class CronSchedule:
+    """
+    cron 표현식 (분 시 일 월 요일) 파서
+    '*', 'a-b', 'a,b', '*/n', 'a-b/n' 형식을 지원합니다. 요일은 0(또는 7)=일요일입니다.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron 표현식 (예: '*/30 6-22 * * *')
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: '{expression}'")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+
+        # 일/요일이 모두 제한되면 cron과 같이 둘 중 하나만 맞아도 실행
+        # (Vixie cron과 같이 '*'로 시작하는 필드('*', '*/2')는 제한이 없는 필드로 보고 두 조건을 모두 적용)
+        self._any_day = fields[2].startswith('*')
+        self._any_weekday = fields[4].startswith('*')
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        """cron 필드 하나를 값 집합으로 변환"""
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_str = part.split('/', 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"잘못된 cron 간격: '{field}'")
+
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 초과: '{field}' ({low}-{high})")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        """날짜가 일/요일 조건에 맞는지 확인"""
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_run(self, after: datetime) -> datetime:
+        """
+        after 이후 첫 실행 시각 계산 (분 단위)
+
+        Args:
+            after: 기준 시각
+
+        Returns:
+            datetime: 다음 실행 시각
+        """
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+
+        while t < limit:
+            if t.month not in self.months:
+                # 다음 달 1일 0시로 이동
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+                continue
+            if t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+                continue
+            return t
+
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식: '{self.expression}'")
+
+
+def run_daemon(
+    ctx: PipelineContext,
+    sites: List[Site],
+    stop_event: Optional[threading.Event] = None
+):
+    """
+    사이트별 cron 주기로 파이프라인을 반복 실행 (stop_event가 설정될 때까지)
+    환경변수 PREGEN_CRON이 있으면 그 주기로 다음 날 후보 문구도 사전 생성합니다.
+
+    Args:
+        ctx: 실행 사이에 유지할 파이프라인 자원
+        sites: cron이 지정된 사이트 리스트
+        stop_event: 종료 신호 (SIGTERM 등)
+    """
+    stop_event = stop_event or threading.Event()
+
+    schedules = [(site, CronSchedule(site.cron)) for site in sites if site.cron]
+    if not schedules:
+        logger.error("✗ cron이 지정된 사이트가 없습니다.")
+        return
+
+    now = datetime.now()
+    next_runs = {site.name: schedule.next_run(now) for site, schedule in schedules}
+    for site, _ in schedules:
+        logger.info(f"  - {site.name}: '{site.cron}' (다음 실행: {next_runs[site.name]:%Y-%m-%d %H:%M})")
+
+    # 한가한 시간의 다음 날 문구 사전 생성
+    pregen_schedule = CronSchedule(os.getenv('PREGEN_CRON')) if os.getenv('PREGEN_CRON') else None
+    next_pregen = pregen_schedule.next_run(now) if pregen_schedule else None
+    if next_pregen:
+        logger.info(f"  - 사전 생성: '{pregen_schedule.expression}' (다음 실행: {next_pregen:%Y-%m-%d %H:%M})")
+
+    # 첫 실행 전에 생성기 헬스 체크를 끝내 둠
+    ctx.generator
+
+    while not stop_event.is_set():
+        next_time = min(list(next_runs.values()) + ([next_pregen] if next_pregen else []))
+        wait_seconds = (next_time - datetime.now()).total_seconds()
+        if wait_seconds > 0 and stop_event.wait(wait_seconds):
+            break
+
+        now = datetime.now()
+        if next_pregen and next_pregen <= now and not stop_event.is_set():
+            logger.info("[데몬] 다음 날 문구 사전 생성")
+            try:
+                with trace('pregenerate'):
+                    run_pregeneration(ctx, [site for site, _ in schedules])
+            except Exception as e:
+                logger.error(f"✗ 사전 생성 실패: {e}", exc_info=True)
+            next_pregen = pregen_schedule.next_run(datetime.now())
+
+        due = [(site, schedule) for site, schedule in schedules if next_runs[site.name] <= now]
+        if stop_event.is_set() or not due:
+            continue
+
+        # 같은 시각에 실행할 사이트는 통합 조회/동시 생성으로 한 번에 처리
+        logger.info(f"[데몬] 사이트 실행: {', '.join(site.name for site, _ in due)}")
+        try:
+            with trace('daemon'):
+                run_sites(ctx, [site for site, _ in due], target_date=date.today())
+        except Exception as e:
+            # 조회 실패 등이 데몬 전체를 멈추지 않도록 함
+            logger.error(f"✗ 사이트 실행 실패: {e}", exc_info=True)
+
+        # 실행이 길어져 지난 주기는 건너뜀
+        for site, schedule in due:
+            next_runs[site.name] = schedule.next_run(datetime.now())
+
+    logger.info("데몬 모드 종료")
@@ -0,0 +1,90 @@
+"""
+사이트(전광판) 설정 파일 로드 모듈
+사이트별 object_id, 디바이스, 출력 파일, 실행 주기(cron)를 YAML로 관리합니다.
+
+예시:
+    sites:
+      - name: park_a
+        object_id: OBJ001
+        devices: [TEMP01, HUMI01]
+        board: ./data/boards/park_a.txt
+        cron: "*/30 6-22 * * *"
+"""
+
+from typing import Dict, List, Optional
+import logging
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+class Site:
+    """전광판 하나에 해당하는 사이트 설정 클래스"""
+
+    def __init__(
+        self,
+        name: str,
+        object_id: Optional[str] = None,
+        device_ids: Optional[List[str]] = None,
+        board: Optional[str] = None,
+        cron: Optional[str] = None,
+        compare: bool = True,
+        multiple: bool = False
+    ):
+        """
+        Args:
+            name: 사이트 이름
+            object_id: tb_sensor_statistics의 object_id (위치/그룹)
+            device_ids: 디바이스 ID 리스트 (None이면 object_id 전체)
+            board: 전광판 텍스트 출력 파일 경로 (기본값: ./data/boards/<name>.txt)
+            cron: 데몬 모드 실행 주기 (cron 표현식 5필드)
+            compare: 어제와 비교 여부
+            multiple: 여러 개의 문구 생성 여부
+        """
+        self.name = name
+        self.object_id = object_id
+        self.device_ids = device_ids
+        self.board = board or f'./data/boards/{name}.txt'
+        self.cron = cron
+        self.compare = compare
+        self.multiple = multiple
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Site':
+        """YAML 항목에서 사이트 생성"""
+        return cls(
+            name=str(data['name']),
+            object_id=data.get('object_id'),
+            device_ids=data.get('devices'),
+            board=data.get('board'),
+            cron=data.get('cron'),
+            compare=data.get('compare', True),
+            multiple=data.get('multiple', False)
+        )
+
+    def __repr__(self):
+        return f"Site({self.name!r}, object_id={self.object_id!r})"
+
+
+def load_sites(path: str) -> List[Site]:
+    """
+    사이트 설정 파일 로드
+
+    Args:
+        path: YAML 파일 경로
+
+    Returns:
+        list: Site 리스트
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    sites = [Site.from_dict(item) for item in data.get('sites', [])]
+
+    names = [site.name for site in sites]
+    if len(names) != len(set(names)):
+        raise ValueError(f"사이트 이름이 중복되었습니다: {path}")
+
+    logger.info(f"사이트 설정 로드: {len(sites)}개 ({path})")
+    return sites
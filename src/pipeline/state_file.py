@@ -0,0 +1,62 @@
+"""
+JSON 상태 파일 공통 모듈 (실행 상태, 감시 기준 시점, 백필 체크포인트)
+여러 프로세스(데몬, 작업 큐 소비자 등)가 같은 파일을 쓰더라도
+기록이 사라지거나 임시 파일이 충돌하지 않도록 파일 잠금과 원자적 교체를 사용합니다.
+"""
+
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    상태 파일 옆의 잠금 파일({path}.lock)에 프로세스 간 배타 잠금
+
+    같은 프로세스 안에서 같은 경로로 중첩 호출하면 교착되므로,
+    스레드 간 보호는 호출자의 threading.Lock으로 따로 처리합니다.
+
+    Args:
+        path: 상태 파일 경로
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_json_atomic(path: str, data: Any, **dump_kwargs):
+    """
+    같은 디렉토리의 고유한 임시 파일에 쓴 뒤 교체 (중단되거나 동시에 써도 파일이 깨지지 않음)
+    읽기-병합-쓰기가 필요하면 file_lock() 안에서 호출합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: JSON으로 저장할 데이터
+        **dump_kwargs: json.dump 옵션 (indent 등)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,244 @@
+"""
+새 센서 통계 감시 모드 모듈
+고정 주기 대신 tb_sensor_statistics에 새 시간별 행이 들어왔을 때만
+영향받은 사이트/시간을 다시 집계하고, 반올림한 입력이 바뀐 사이트만 문구를 재생성합니다.
+
+ChangeSource를 구현하면 폴링 대신 binlog, 메시지 큐 등으로 교체할 수 있습니다.
+"""
+
+import os
+import json
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from ..analyzer.sensor_data_fetcher import SensorDataFetcher
+from ..tracing import trace
+from .context import PipelineContext
+from .multi_site import fetch_site_rows, run_sites, site_object_ids
+from .sites import Site
+from .state_file import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeSource:
+    """새 시간별 통계 발생을 알려주는 소스 기본 클래스"""
+
+    def poll(self) -> List[Dict]:
+        """
+        마지막 commit() 이후 새로 들어온 시간별 통계 목록
+        (재계산 확인을 위해 이미 처리한 시간을 다시 반환할 수 있으며, 실제로 바뀐 행만 갱신됨)
+
+        Returns:
+            list: {'object_id', 'statistics_date', 'hour'} 리스트
+        """
+        raise NotImplementedError
+
+    def commit(self, changes: List[Dict]):
+        """처리 완료 표시 (다음 poll()에서 다시 반환하지 않음)"""
+
+    def wait(self, stop_event: threading.Event) -> bool:
+        """
+        다음 poll()까지 대기
+
+        Returns:
+            bool: 종료 신호를 받았으면 True
+        """
+        return stop_event.wait(float(os.getenv('WATCH_INTERVAL_SECONDS', 60)))
+
+
+class PollingChangeSource(ChangeSource):
+    """
+    object_id별 기준 시점(statistics_date, hour) 이후의 행을 주기적으로 조회하는 소스
+    기준 시점에서 WATCH_LOOKBACK_HOURS만큼 이전 시간도 다시 반환하여 늦게 재계산된 행을 확인합니다.
+    """
+
+    def __init__(
+        self,
+        ctx: PipelineContext,
+        object_ids: Optional[List[str]] = None,
+        state_path: Optional[str] = None,
+        lookback_hours: Optional[int] = None
+    ):
+        """
+        Args:
+            ctx: 실행 자원 (DB 연결)
+            object_ids: 감시할 객체 ID 리스트 (None이면 전체)
+            state_path: 기준 시점 저장 파일 (기본값: 환경변수 WATCH_STATE_PATH 또는 ./data/state/watch_state.json)
+            lookback_hours: 다시 조회할 이전 시간 수 (기본값: 환경변수 WATCH_LOOKBACK_HOURS 또는 2)
+        """
+        self.ctx = ctx
+        self.object_ids = object_ids
+        self.state_path = state_path or os.getenv('WATCH_STATE_PATH', './data/state/watch_state.json')
+        self.lookback_hours = lookback_hours if lookback_hours is not None else int(os.getenv('WATCH_LOOKBACK_HOURS', 2))
+        # 공통 기준 시점 (객체별 기준 시점이 없는 새 객체에 적용) + object_id별 기준 시점
+        self.high_water_mark, self.object_marks = self._load()
+
+    def _load(self) -> Tuple[Optional[Tuple[date, int]], Dict[str, Tuple[date, int]]]:
+        """저장된 기준 시점 로드 (이전 형식 {'statistics_date', 'hour'}는 공통 기준 시점으로 사용)"""
+        if not os.path.exists(self.state_path):
+            return None, {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            high_water_mark = None
+            if 'statistics_date' in state:
+                high_water_mark = _to_date(state['statistics_date']), int(state['hour'])
+            object_marks = {
+                object_id: (_to_date(mark['statistics_date']), int(mark['hour']))
+                for object_id, mark in state.get('objects', {}).items()
+            }
+            return high_water_mark, object_marks
+        except Exception as e:
+            logger.warning(f"⚠️  감시 기준 시점 파일을 읽을 수 없습니다 ({self.state_path}): {e}")
+            return None, {}
+
+    def poll(self) -> List[Dict]:
+        """객체별 기준 시점(- 재조회 시간) 이후의 (object_id, 날짜, 시간) 목록 조회"""
+        after_date, after_hour = self.high_water_mark or (None, -1)
+        return SensorDataFetcher(self.ctx.db).get_changed_hours(
+            after_date,
+            after_hour,
+            self.object_ids,
+            object_marks=self.object_marks,
+            lookback_hours=self.lookback_hours if self.high_water_mark or self.object_marks else 0
+        )
+
+    def commit(self, changes: List[Dict]):
+        """객체별로 처리한 가장 늦은 (날짜, 시간)으로 기준 시점 이동 후 저장"""
+        if not changes:
+            return
+
+        moved = False
+        for change in changes:
+            mark = (_to_date(change['statistics_date']), int(change['hour']))
+            current = self.object_marks.get(change['object_id'])
+            if current is None or mark > current:
+                self.object_marks[change['object_id']] = mark
+                moved = True
+            if self.high_water_mark is None or mark > self.high_water_mark:
+                self.high_water_mark = mark
+                moved = True
+        if not moved:
+            return
+
+        state = {
+            'statistics_date': self.high_water_mark[0].isoformat(),
+            'hour': self.high_water_mark[1],
+            'objects': {
+                object_id: {'statistics_date': mark_date.isoformat(), 'hour': mark_hour}
+                for object_id, (mark_date, mark_hour) in sorted(self.object_marks.items())
+            }
+        }
+        with file_lock(self.state_path):
+            write_json_atomic(self.state_path, state)
+
+
+def _to_date(value) -> date:
+    """DB 날짜 값(date 또는 문자열)을 date로 변환"""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), '%Y-%m-%d').date()
+
+
+def _row_key(row: Dict) -> tuple:
+    """집계 행 식별 키 (같은 키의 새 행으로 교체)"""
+    return (row['object_id'], str(row['statistics_date']), row['device_id'], row['field_key'], row['hour'])
+
+
+def _affected_sites(sites: List[Site], changes: List[Dict], target_date: date) -> List[Site]:
+    """변경된 object_id/날짜의 영향을 받는 사이트 (오늘 변경 또는 비교 사이트의 어제 변경)"""
+    today_str = target_date.isoformat()
+    changed = defaultdict(set)
+    for change in changes:
+        changed[str(change['statistics_date'])].add(change['object_id'])
+
+    affected = []
+    for site in sites:
+        for date_str, object_ids in changed.items():
+            if date_str != today_str and not site.compare:
+                continue
+            if site.object_id is None or site.object_id in object_ids:
+                affected.append(site)
+                break
+    return affected
+
+
+def run_watcher(
+    ctx: PipelineContext,
+    sites: List[Site],
+    stop_event: Optional[threading.Event] = None,
+    source: Optional[ChangeSource] = None
+):
+    """
+    새 시간별 통계가 들어올 때마다 영향받은 사이트만 갱신 (stop_event가 설정될 때까지)
+
+    Args:
+        ctx: 실행 사이에 유지할 파이프라인 자원
+        sites: 감시할 사이트 리스트
+        stop_event: 종료 신호 (SIGTERM 등)
+        source: 변경 소스 (기본값: PollingChangeSource)
+    """
+    stop_event = stop_event or threading.Event()
+    source = source or PollingChangeSource(ctx, site_object_ids(sites))
+
+    # 오늘/어제 집계 행 (변경된 시간만 다시 조회하여 교체)
+    rows_index: Dict[tuple, Dict] = {}
+    current_date: Optional[date] = None
+
+    while not stop_event.is_set():
+        target_date = date.today()
+        yesterday_str = (target_date - timedelta(days=1)).isoformat()
+
+        try:
+            changes = source.poll()
+
+            if target_date != current_date:
+                # 첫 실행 또는 날짜 변경: 오늘/어제 전체 조회 후 모든 사이트 갱신
+                rows_index = {_row_key(row): row for row in fetch_site_rows(ctx, sites, target_date)}
+                current_date = target_date
+                affected = list(sites)
+            else:
+                relevant = [
+                    change for change in changes
+                    if str(change['statistics_date']) in (target_date.isoformat(), yesterday_str)
+                ]
+                by_date = defaultdict(list)
+                for change in relevant:
+                    by_date[str(change['statistics_date'])].append(change)
+
+                # 변경된 (날짜, 시간, object_id)만 다시 집계하고, 값이 실제로 바뀐 행만 반영
+                fetcher = SensorDataFetcher(ctx.db)
+                updated = []
+                for date_str, day_changes in by_date.items():
+                    for row in fetcher.get_hours_statistics(
+                        _to_date(date_str),
+                        [int(change['hour']) for change in day_changes],
+                        sorted({change['object_id'] for change in day_changes})
+                    ):
+                        key = _row_key(row)
+                        if rows_index.get(key) != row:
+                            rows_index[key] = row
+                            updated.append(row)
+
+                affected = _affected_sites(sites, updated, target_date)
+
+            if affected:
+                logger.info(f"[감시] 센서 통계 변경 {len(changes)}건 확인, 갱신 사이트: {', '.join(site.name for site in affected)}")
+                # 반올림한 입력이 바뀌지 않은 사이트는 run_sites에서 생성/출력 생략
+                with trace('watch'):
+                    run_sites(ctx, affected, target_date, rows=list(rows_index.values()))
+
+            source.commit(changes)
+
+        except Exception as e:
+            # 조회 실패 등이 감시 전체를 멈추지 않도록 함 (기준 시점은 그대로 두고 다음 주기에 재시도)
+            logger.error(f"✗ 감시 갱신 실패: {e}", exc_info=True)
+
+        if source.wait(stop_event):
+            break
+
+    logger.info("감시 모드 종료")
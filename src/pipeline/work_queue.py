@@ -0,0 +1,381 @@
+"""
+생성 작업 큐 모듈
+파이프라인을 생산자(조회 + 분석)와 소비자(생성 + 출력)로 나누고,
+두 단계 사이를 SQLite(WAL) 파일 큐로 연결합니다.
+
+- 최소 1회 전달: 소비자는 작업을 임대(lease)하고 출력까지 마친 뒤 완료 처리합니다.
+  임대 시간(가시성 타임아웃) 안에 완료하지 못하면(프로세스 종료 등) 다른 소비자에게 다시 전달됩니다.
+- 재시도: 생성/출력 실패 시 지수 백오프 후 재시도하고, 최대 시도 횟수를 넘으면 failed로 남깁니다.
+- 사이트별 순서: 대기 중인 작업은 사이트당 하나만 유지하고(새 입력이 덮어씀),
+  임대 중인 사이트의 작업은 다른 소비자가 가져가지 않습니다.
+
+같은 큐 파일을 여러 소비자 프로세스가 동시에 처리할 수 있습니다.
+(SQLite 잠금에 의존하므로 큐 파일은 로컬 디스크에 두어야 합니다)
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, List, Optional
+import logging
+
+from ..generator.base_generator import is_fallback
+from ..tracing import trace
+from .context import PipelineContext
+from .multi_site import generate_site_messages, prepare_site_jobs, publish_site_message
+from .sites import Site
+
+logger = logging.getLogger(__name__)
+
+
+def default_owner() -> str:
+    """소비자 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """임대/가시성 타임아웃 방식의 SQLite 생성 작업 큐 클래스"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        visibility_timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[float] = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: 환경변수 WORK_QUEUE_PATH 또는 ./data/queue/jobs.sqlite3)
+            visibility_timeout: 임대 유지 시간 (초, 기본값: 환경변수 WORK_QUEUE_VISIBILITY_SECONDS 또는 300)
+            max_attempts: 최대 시도 횟수 (기본값: 환경변수 WORK_QUEUE_MAX_ATTEMPTS 또는 5)
+            retry_delay: 첫 재시도 대기 시간 (초, 시도마다 2배, 기본값: 환경변수 WORK_QUEUE_RETRY_SECONDS 또는 10)
+        """
+        self.path = path or os.getenv('WORK_QUEUE_PATH', './data/queue/jobs.sqlite3')
+        self.visibility_timeout = visibility_timeout or float(os.getenv('WORK_QUEUE_VISIBILITY_SECONDS', 300))
+        self.max_attempts = max_attempts or int(os.getenv('WORK_QUEUE_MAX_ATTEMPTS', 5))
+        self.retry_delay = retry_delay or float(os.getenv('WORK_QUEUE_RETRY_SECONDS', 10))
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # 트랜잭션은 직접 시작 (_transaction)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' site TEXT NOT NULL,'
+            ' target_date TEXT NOT NULL,'
+            ' payload TEXT NOT NULL,'
+            " status TEXT NOT NULL DEFAULT 'pending',"
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' available_at REAL NOT NULL,'
+            ' lease_owner TEXT,'
+            ' leased_until REAL,'
+            ' last_error TEXT,'
+            ' created_at REAL NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        # 사이트당 대기 작업은 하나 (새 입력으로 교체)
+        self._conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_pending_site ON jobs(site) WHERE status = 'pending'"
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, available_at)')
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (다른 프로세스의 임대/재시도와 직렬화)"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def enqueue(self, site: str, target_date: date, payload: Dict) -> int:
+        """
+        생성 작업 추가 (같은 사이트의 대기 작업이 있으면 새 입력으로 교체)
+
+        Args:
+            site: 사이트 이름
+            target_date: 대상 날짜
+            payload: 작업 입력 (JSON 직렬화, 날짜는 문자열로 저장)
+
+        Returns:
+            int: 작업 ID
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'INSERT INTO jobs (site, target_date, payload, available_at, created_at, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)'
+                " ON CONFLICT(site) WHERE status = 'pending' DO UPDATE SET"
+                ' target_date = excluded.target_date, payload = excluded.payload, attempts = 0,'
+                ' available_at = excluded.available_at, last_error = NULL, updated_at = excluded.updated_at'
+                ' RETURNING id',
+                (site, target_date.isoformat(), json.dumps(payload, ensure_ascii=False, default=str), now, now, now)
+            ).fetchone()
+        return row[0]
+
+    def lease(self, owner: str, limit: int = 1) -> List[Dict]:
+        """
+        처리할 작업 임대 (대기 작업 + 임대 시간이 지난 작업, 사이트당 하나)
+
+        Args:
+            owner: 소비자 식별자
+            limit: 최대 작업 수
+
+        Returns:
+            list: {'id', 'site', 'target_date', 'payload', 'attempts'} 리스트
+        """
+        now = time.time()
+        with self._transaction():
+            # 임대 중에 소비자가 멈춘 작업은 시도 횟수를 다 쓰면 더 전달하지 않음
+            self._conn.execute(
+                "UPDATE jobs SET status = 'failed', lease_owner = NULL, updated_at = ?,"
+                " last_error = COALESCE(last_error, '임대 시간 초과')"
+                " WHERE status = 'leased' AND leased_until <= ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            rows = self._conn.execute(
+                'SELECT id, site, target_date, payload, attempts FROM jobs'
+                " WHERE ((status = 'pending' AND available_at <= ?) OR (status = 'leased' AND leased_until <= ?))"
+                "   AND site NOT IN (SELECT site FROM jobs WHERE status = 'leased' AND leased_until > ?)"
+                ' ORDER BY id',
+                (now, now, now)
+            ).fetchall()
+
+            # 같은 사이트의 작업이 여럿이면(임대 만료 + 새 대기 작업) 최신 입력만 처리
+            latest: Dict[str, tuple] = {}
+            for row in rows:
+                latest[row[1]] = row
+            superseded = [row[0] for row in rows if latest[row[1]][0] != row[0]]
+            if superseded:
+                self._conn.execute(
+                    f"DELETE FROM jobs WHERE id IN ({','.join('?' * len(superseded))})", superseded
+                )
+
+            leased = sorted(latest.values())[:limit]
+            for row in leased:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'leased', lease_owner = ?, leased_until = ?,"
+                    ' attempts = attempts + 1, updated_at = ? WHERE id = ?',
+                    (owner, now + self.visibility_timeout, now, row[0])
+                )
+
+        return [
+            {
+                'id': job_id,
+                'site': site,
+                'target_date': datetime.strptime(target_date, '%Y-%m-%d').date(),
+                'payload': json.loads(payload),
+                'attempts': attempts + 1
+            }
+            for job_id, site, target_date, payload, attempts in leased
+        ]
+
+    def complete(self, job_id: int, owner: str) -> bool:
+        """
+        처리 완료 (큐에서 삭제)
+
+        Returns:
+            bool: 임대가 유효했는지 여부 (False면 임대 만료 후 다른 소비자가 가져간 작업)
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, owner)
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, job_id: int, owner: str, error: str, retry: bool = True) -> bool:
+        """
+        처리 실패 (백오프 후 재시도, 시도 횟수를 다 쓰면 failed)
+
+        Args:
+            job_id: 작업 ID
+            owner: 소비자 식별자
+            error: 실패 사유
+            retry: False면 재시도 없이 failed (설정 오류 등)
+
+        Returns:
+            bool: 재시도 예정이면 True
+        """
+        now = time.time()
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT site, attempts FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, owner)
+            ).fetchone()
+            if row is None:
+                return False
+
+            site, attempts = row
+            if not retry or attempts >= self.max_attempts:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', lease_owner = NULL, last_error = ?, updated_at = ?"
+                    ' WHERE id = ?',
+                    (error, now, job_id)
+                )
+                return False
+
+            # 같은 사이트의 새 대기 작업이 이미 있으면 이전 입력은 재시도하지 않음
+            newer = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE site = ? AND status = 'pending'", (site,)
+            ).fetchone()
+            if newer:
+                self._conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+                return False
+
+            self._conn.execute(
+                "UPDATE jobs SET status = 'pending', lease_owner = NULL, leased_until = NULL,"
+                ' available_at = ?, last_error = ?, updated_at = ? WHERE id = ?',
+                (now + self.retry_delay * 2 ** (attempts - 1), error, now, job_id)
+            )
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return dict(rows)
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def run_producer(
+    ctx: PipelineContext,
+    sites: List[Site],
+    target_date: date,
+    queue: Optional[WorkQueue] = None,
+    force: bool = False
+) -> int:
+    """
+    통합 조회 + 일괄 분석 후 사이트별 생성 작업을 큐에 추가 (입력이 이전 실행과 같은 사이트는 제외)
+
+    Args:
+        ctx: 실행 자원
+        sites: 실행할 사이트 리스트
+        target_date: 조회할 날짜 (오늘)
+        queue: 작업 큐 (기본값: WorkQueue())
+        force: 입력이 이전 실행과 같은 사이트도 작업 추가
+
+    Returns:
+        int: 추가한 작업 수
+    """
+    queue = queue or WorkQueue()
+    _, jobs = prepare_site_jobs(ctx, sites, target_date, force=force)
+
+    for job in jobs:
+        queue.enqueue(job['site'].name, target_date, {
+            'analysis': job['analysis'],
+            'comparison': job['comparison'],
+            'digest': job['digest']
+        })
+
+    logger.info(f"✓ 생성 작업 {len(jobs)}개 추가 (큐: {queue.stats()})")
+    return len(jobs)
+
+
+def run_consumer(
+    ctx: PipelineContext,
+    sites: List[Site],
+    queue: Optional[WorkQueue] = None,
+    stop_event: Optional[threading.Event] = None,
+    batch_size: Optional[int] = None,
+    owner: Optional[str] = None
+):
+    """
+    큐의 생성 작업을 임대하여 문구 생성 + 출력 (stop_event가 설정될 때까지)
+
+    Args:
+        ctx: 실행 자원
+        sites: 사이트 리스트 (작업의 사이트 이름으로 출력 설정 조회)
+        queue: 작업 큐 (기본값: WorkQueue())
+        stop_event: 종료 신호 (SIGTERM 등, 진행 중인 작업은 마치고 종료)
+        batch_size: 한 번에 임대할 작업 수 (기본값: 환경변수 WORK_QUEUE_BATCH_SIZE 또는 8)
+        owner: 소비자 식별자 (기본값: 호스트:PID)
+    """
+    queue = queue or WorkQueue()
+    stop_event = stop_event or threading.Event()
+    batch_size = batch_size or int(os.getenv('WORK_QUEUE_BATCH_SIZE', 8))
+    owner = owner or default_owner()
+    poll_interval = float(os.getenv('WORK_QUEUE_POLL_SECONDS', 2))
+    sites_by_name = {site.name: site for site in sites}
+
+    logger.info(f"소비자 시작: {owner} (배치 {batch_size}개, 임대 {queue.visibility_timeout:.0f}초)")
+
+    while not stop_event.is_set():
+        try:
+            leased = queue.lease(owner, batch_size)
+        except sqlite3.Error as e:
+            logger.error(f"✗ 작업 임대 실패: {e}")
+            stop_event.wait(poll_interval)
+            continue
+
+        if not leased:
+            stop_event.wait(poll_interval)
+            continue
+
+        jobs = []
+        for item in leased:
+            site = sites_by_name.get(item['site'])
+            if site is None:
+                logger.error(f"✗ [{item['site']}] 사이트 설정에 없는 작업입니다.")
+                queue.fail(item['id'], owner, '사이트 설정 없음', retry=False)
+                continue
+            jobs.append({
+                'id': item['id'],
+                'site': site,
+                'target_date': item['target_date'],
+                'analysis': item['payload']['analysis'],
+                'comparison': item['payload']['comparison'],
+                'digest': item['payload']['digest'],
+                'attempts': item['attempts']
+            })
+
+        if not jobs:
+            continue
+
+        with trace('consume'):
+            try:
+                messages = generate_site_messages(ctx, jobs)
+            except Exception as e:
+                logger.error(f"✗ 문구 생성 실패: {e}", exc_info=True)
+                messages = {job['site'].name: e for job in jobs}
+
+            for job in jobs:
+                message = messages.get(job['site'].name)
+                if is_fallback(message) and job['attempts'] < queue.max_attempts:
+                    # 폴백 문구는 출력하지 않고 LLM 생성을 백오프 후 다시 시도 (재시도마다 전광판/로그 중복 방지)
+                    if queue.fail(job['id'], owner, '폴백 문구 (LLM 생성 실패)'):
+                        logger.warning(f"⚠️  [{job['site'].name}] LLM 생성 실패, 재시도 예정 (시도 {job['attempts']}/{queue.max_attempts})")
+                    continue
+
+                # 로그/파일/실행 상태 기록까지 마친 뒤 완료 처리 (중간에 종료되면 다시 전달)
+                result = publish_site_message(ctx, job, message, job['target_date'], background=False)
+                if result and is_fallback(message):
+                    # 마지막 시도: 폴백 문구를 출력하고 작업은 실패로 남김
+                    queue.fail(job['id'], owner, '폴백 문구 출력 (LLM 생성 재시도 소진)')
+                    logger.warning(f"⚠️  [{job['site'].name}] 재시도 소진, 폴백 문구 출력")
+                    continue
+                if result:
+                    if not queue.complete(job['id'], owner):
+                        logger.warning(f"⚠️  [{job['site'].name}] 임대 시간이 지난 뒤 완료되었습니다 (중복 출력 가능).")
+                    continue
+
+                error = str(message) if isinstance(message, Exception) or not message else '출력 실패'
+                if queue.fail(job['id'], owner, error):
+                    logger.warning(f"⚠️  [{job['site'].name}] 작업 재시도 예정 (시도 {job['attempts']}/{queue.max_attempts})")
+
+    logger.info("소비자 종료")
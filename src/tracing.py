@@ -0,0 +1,226 @@
+"""
+파이프라인 단계별 실행 시간 추적 모듈
+중첩 span으로 DB 조회, 분석, 프롬프트 생성, HTTP 호출, 서버 생성 시간을 기록하고
+실행마다 Chrome trace JSON(chrome://tracing, Perfetto) 또는 JSONL로 저장합니다.
+
+추적이 시작되지 않은 상태에서는 span()이 아무 일도 하지 않으므로 항상 호출해도 됩니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 현재 실행의 추적기와 부모 span (스레드 풀로 넘길 때는 contextvars.copy_context() 사용)
+_current_tracer: contextvars.ContextVar[Optional['Tracer']] = contextvars.ContextVar('tracer', default=None)
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('span', default=None)
+
+
+class Span:
+    """실행 구간 하나의 기록"""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attrs: Dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attrs = attrs
+        self.start = time.time()
+        self.duration: Optional[float] = None
+        self.thread_id = threading.get_ident()
+
+    def to_dict(self) -> Dict:
+        """JSONL 기록용 딕셔너리"""
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': self.start,
+            'duration': self.duration,
+            'thread_id': self.thread_id,
+            'attrs': self.attrs
+        }
+
+
+class Tracer:
+    """한 번의 파이프라인 실행에 대한 span 수집 클래스"""
+
+    def __init__(self, name: str = 'pipeline', trace_id: Optional[str] = None):
+        """
+        Args:
+            name: 추적 이름 (파일 이름에 사용)
+            trace_id: 추적 ID (기본값: 새로 생성, 모델 서버에 X-Trace-Id로 전달)
+        """
+        self.name = name
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.started_at = datetime.now()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attrs) -> Span:
+        """span 시작"""
+        return Span(name, self.trace_id, parent.span_id if parent else None, attrs)
+
+    def finish_span(self, span: Span, duration: Optional[float] = None):
+        """span 종료 및 기록"""
+        span.duration = duration if duration is not None else time.time() - span.start
+        with self._lock:
+            self.spans.append(span)
+
+    def record(self, name: str, duration: float, end: Optional[float] = None, **attrs):
+        """
+        외부에서 측정된 구간 기록 (예: 응답에 포함된 서버 생성 시간)
+
+        Args:
+            name: span 이름
+            duration: 소요 시간 (초)
+            end: 구간 종료 시각 (기본값: 현재)
+            **attrs: 추가 속성
+        """
+        span = self.start_span(name, _current_span.get(), **attrs)
+        span.start = (end or time.time()) - duration
+        self.finish_span(span, duration)
+
+    def export_chrome(self, path: str):
+        """Chrome trace 형식(JSON)으로 저장"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        events = [
+            {
+                'name': span.name,
+                'ph': 'X',
+                'ts': int(span.start * 1_000_000),
+                'dur': int((span.duration or 0) * 1_000_000),
+                'pid': os.getpid(),
+                'tid': span.thread_id,
+                'args': dict(span.attrs, span_id=span.span_id, parent_id=span.parent_id)
+            }
+            for span in spans
+        ]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'otherData': {'trace_id': self.trace_id}}, f, ensure_ascii=False)
+
+    def export_jsonl(self, path: str):
+        """span을 한 줄씩 JSONL 파일에 추가 (여러 실행의 p50/p95 집계용)"""
+        with self._lock:
+            spans = list(self.spans)
+        with open(path, 'a', encoding='utf-8') as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + '\n')
+
+    def export(self, trace_dir: Optional[str] = None, trace_format: Optional[str] = None) -> List[str]:
+        """
+        설정된 형식으로 저장
+
+        Args:
+            trace_dir: 저장 디렉토리 (기본값: 환경변수 TRACE_DIR 또는 ./data/traces)
+            trace_format: 'chrome', 'jsonl', 'both' (기본값: 환경변수 TRACE_FORMAT 또는 both)
+
+        Returns:
+            list: 저장한 파일 경로 리스트
+        """
+        trace_dir = trace_dir or os.getenv('TRACE_DIR', './data/traces')
+        trace_format = trace_format or os.getenv('TRACE_FORMAT', 'both')
+        os.makedirs(trace_dir, exist_ok=True)
+
+        paths = []
+        if trace_format in ('chrome', 'both'):
+            path = os.path.join(trace_dir, f"{self.name}_{self.started_at:%Y%m%d_%H%M%S}_{self.trace_id[:8]}.json")
+            self.export_chrome(path)
+            paths.append(path)
+        if trace_format in ('jsonl', 'both'):
+            path = os.path.join(trace_dir, 'spans.jsonl')
+            self.export_jsonl(path)
+            paths.append(path)
+        return paths
+
+    def summary(self) -> Dict[str, float]:
+        """span 이름별 합계 시간 (초)"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for span in self.spans:
+                totals[span.name] = totals.get(span.name, 0.0) + (span.duration or 0.0)
+        return totals
+
+
+def is_enabled() -> bool:
+    """환경변수 TRACE_ENABLED 값 (기본값: false)"""
+    return os.getenv('TRACE_ENABLED', 'false').lower() == 'true'
+
+
+@contextmanager
+def trace(name: str = 'pipeline', enabled: Optional[bool] = None):
+    """
+    실행 하나의 추적 시작 (종료 시 파일로 저장)
+
+    Args:
+        name: 추적 이름
+        enabled: 추적 여부 (기본값: 환경변수 TRACE_ENABLED)
+
+    Yields:
+        Tracer: 추적기 (비활성화 시 None)
+    """
+    if not (is_enabled() if enabled is None else enabled):
+        yield None
+        return
+
+    tracer = Tracer(name)
+    tracer_token = _current_tracer.set(tracer)
+    root = tracer.start_span(name)
+    span_token = _current_span.set(root)
+    try:
+        yield tracer
+    finally:
+        tracer.finish_span(root)
+        _current_span.reset(span_token)
+        _current_tracer.reset(tracer_token)
+        try:
+            paths = tracer.export()
+            logger.info(f"추적 저장 (trace_id={tracer.trace_id}): {', '.join(paths)}")
+        except Exception as e:
+            logger.warning(f"추적 저장 실패: {e}")
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    현재 추적에 중첩 span 기록 (추적 중이 아니면 아무 일도 하지 않음)
+
+    Args:
+        name: span 이름 (예: 'db.query', 'http.generate')
+        **attrs: 추가 속성
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+
+    current = tracer.start_span(name, _current_span.get(), **attrs)
+    token = _current_span.set(current)
+    try:
+        yield current
+    finally:
+        _current_span.reset(token)
+        tracer.finish_span(current)
+
+
+def record(name: str, duration: float, **attrs):
+    """현재 추적에 외부 측정 구간 기록 (추적 중이 아니면 무시)"""
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.record(name, duration, **attrs)
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 추적 ID (추적 중이 아니면 None)"""
+    tracer = _current_tracer.get()
+    return tracer.trace_id if tracer is not None else None
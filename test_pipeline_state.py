@@ -0,0 +1,254 @@
+"""
+파이프라인 상태 관리 테스트 - 모델 서버/DB 없이 실행
+작업 큐 임대/만료/재시도, cron 다음 실행 시각, 실행 상태 병합, 감시 모드 재조회 범위를 확인합니다.
+"""
+
+import os
+import json
+import time
+import tempfile
+from datetime import date, datetime
+from types import SimpleNamespace
+
+
+def test_work_queue_lease():
+    """작업 큐 임대/완료 테스트 (사이트당 대기 작업 하나, 임대 중인 사이트는 다시 임대하지 않음)"""
+    from src.pipeline.work_queue import WorkQueue
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, 'jobs.sqlite3'))
+        try:
+            first_id = queue.enqueue('공원', date(2026, 10, 19), {'value': 1})
+            second_id = queue.enqueue('공원', date(2026, 10, 19), {'value': 2})
+            assert first_id == second_id, "같은 사이트의 대기 작업은 새 입력으로 교체되어야 함"
+            print("✓ 같은 사이트 대기 작업 교체")
+
+            jobs = queue.lease('consumer-a', limit=5)
+            assert len(jobs) == 1 and jobs[0]['attempts'] == 1
+            assert jobs[0]['payload'] == {'value': 2}
+            assert jobs[0]['target_date'] == date(2026, 10, 19)
+            print(f"✓ 임대: {jobs[0]['site']} (시도 {jobs[0]['attempts']}회)")
+
+            queue.enqueue('공원', date(2026, 10, 19), {'value': 3})
+            assert queue.lease('consumer-b') == [], "임대 중인 사이트의 새 작업은 다른 소비자가 가져가면 안 됨"
+            print("✓ 임대 중인 사이트는 다시 임대하지 않음")
+
+            assert queue.complete(jobs[0]['id'], 'consumer-a')
+            assert queue.stats() == {'pending': 1}
+            print(f"✓ 완료 처리 후 상태: {queue.stats()}")
+        finally:
+            queue.close()
+
+
+def test_work_queue_expiry():
+    """작업 큐 임대 만료 테스트 (가시성 타임아웃이 지나면 다른 소비자에게 다시 전달)"""
+    from src.pipeline.work_queue import WorkQueue
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, 'jobs.sqlite3'), visibility_timeout=0.2, max_attempts=2)
+        try:
+            queue.enqueue('공원', date(2026, 10, 19), {})
+            job = queue.lease('consumer-a')[0]
+            time.sleep(0.3)
+
+            retried = queue.lease('consumer-b')
+            assert len(retried) == 1 and retried[0]['id'] == job['id'] and retried[0]['attempts'] == 2
+            print(f"✓ 임대 만료 후 재전달 (시도 {retried[0]['attempts']}회)")
+
+            assert not queue.complete(job['id'], 'consumer-a'), "만료된 임대의 완료 처리는 무시되어야 함"
+            print("✓ 만료된 임대의 완료 처리 무시")
+
+            time.sleep(0.3)
+            assert queue.lease('consumer-c') == [], "시도 횟수를 다 쓴 작업은 더 전달하지 않아야 함"
+            assert queue.stats() == {'failed': 1}
+            print(f"✓ 시도 횟수 소진 후 상태: {queue.stats()}")
+        finally:
+            queue.close()
+
+
+def test_work_queue_retry():
+    """작업 큐 실패 → 백오프 후 재시도 테스트"""
+    from src.pipeline.work_queue import WorkQueue
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, 'jobs.sqlite3'), max_attempts=2, retry_delay=0.2)
+        try:
+            queue.enqueue('공원', date(2026, 10, 19), {})
+            job = queue.lease('consumer-a')[0]
+
+            assert queue.fail(job['id'], 'consumer-a', '생성 실패'), "첫 실패는 재시도 예정이어야 함"
+            assert queue.lease('consumer-a') == [], "백오프 시간 전에는 다시 임대하지 않아야 함"
+            print("✓ 실패 후 백오프 대기")
+
+            time.sleep(0.3)
+            job = queue.lease('consumer-a')[0]
+            assert job['attempts'] == 2
+            print(f"✓ 백오프 후 재임대 (시도 {job['attempts']}회)")
+
+            assert not queue.fail(job['id'], 'consumer-a', '생성 실패'), "마지막 시도 실패는 재시도하지 않아야 함"
+            assert queue.stats() == {'failed': 1}
+            print(f"✓ 마지막 시도 실패 후 상태: {queue.stats()}")
+
+            queue.enqueue('정원', date(2026, 10, 19), {})
+            job = queue.lease('consumer-a')[0]
+            assert not queue.fail(job['id'], 'consumer-a', '설정 오류', retry=False)
+            assert queue.stats() == {'failed': 2}
+            print("✓ retry=False 실패는 바로 failed")
+        finally:
+            queue.close()
+
+
+def test_cron_schedule():
+    """cron 다음 실행 시각 테스트"""
+    from src.pipeline.scheduler import CronSchedule
+
+    cases = [
+        # (표현식, 기준 시각, 기대 실행 시각 목록)
+        ('*/30 6-22 * * *', datetime(2026, 10, 19, 22, 45),
+         [datetime(2026, 10, 20, 6, 0), datetime(2026, 10, 20, 6, 30)]),
+        ('0 9 1 * *', datetime(2026, 12, 15, 0, 0),
+         [datetime(2027, 1, 1, 9, 0), datetime(2027, 2, 1, 9, 0)]),
+        # 일/요일이 모두 제한되면 둘 중 하나만 맞아도 실행 (2026-11-01은 일요일)
+        ('0 9 1 * 1', datetime(2026, 10, 27, 0, 0),
+         [datetime(2026, 11, 1, 9, 0), datetime(2026, 11, 2, 9, 0)]),
+        # '*'로 시작하는 일 필드는 제한 없음으로 보고 두 조건을 모두 적용 (홀수 날짜의 월요일)
+        ('0 9 */2 * 1', datetime(2026, 10, 19, 9, 0),
+         [datetime(2026, 11, 9, 9, 0), datetime(2026, 11, 23, 9, 0)]),
+        # 요일 7도 일요일
+        ('0 0 * * 7', datetime(2026, 10, 19, 0, 0),
+         [datetime(2026, 10, 25, 0, 0), datetime(2026, 11, 1, 0, 0)]),
+    ]
+
+    for expression, after, expected in cases:
+        schedule = CronSchedule(expression)
+        runs = []
+        current = after
+        for _ in expected:
+            current = schedule.next_run(current)
+            runs.append(current)
+        assert runs == expected, f"'{expression}': {runs} != {expected}"
+        print(f"✓ '{expression}' → {', '.join(f'{run:%Y-%m-%d %H:%M}' for run in runs)}")
+
+    for expression in ['* * * *', '61 * * * *', '*/0 * * * *']:
+        try:
+            CronSchedule(expression)
+        except ValueError:
+            print(f"✓ 잘못된 표현식 거부: '{expression}'")
+        else:
+            raise AssertionError(f"잘못된 표현식이 허용됨: '{expression}'")
+
+
+def test_run_state():
+    """실행 상태 저장 테스트 (같은 파일을 쓰는 두 인스턴스의 기록 병합)"""
+    from src.pipeline.run_state import RunState
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run_state.json')
+        first = RunState(path)
+        second = RunState(path)
+
+        first.put('공원', 'hash-a', '오늘은 어제보다 따뜻해요')
+        second.put('정원', 'hash-b', '오늘은 쌀쌀해요')
+
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert set(saved) == {'공원', '정원'}, "다른 인스턴스의 기록을 덮어쓰면 안 됨"
+        print(f"✓ 두 인스턴스 기록 병합: {sorted(saved)}")
+
+        assert first.get_unchanged('정원', 'hash-b') == '오늘은 쌀쌀해요'
+        assert first.has('정원')
+        print("✓ 다른 인스턴스가 기록한 항목 다시 읽기")
+
+        assert first.get_unchanged('공원', 'hash-changed') is None
+        assert first.get_unchanged('없는 사이트', 'hash-a') is None
+        print("✓ 입력 해시가 다르거나 기록이 없으면 None")
+
+        leftovers = [name for name in os.listdir(tmp) if name.endswith('.tmp')]
+        assert not leftovers, f"임시 파일이 남아 있음: {leftovers}"
+        print("✓ 임시 파일 정리")
+
+
+class _RecordingDB:
+    """실행한 쿼리와 파라미터를 기록하는 가짜 DB 연결 (execute_query만 구현)"""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        self.queries.append((query, params or {}))
+        return self.rows
+
+
+def test_polling_change_source_lookback():
+    """감시 모드 기준 시점 재조회 범위 테스트 (객체별 기준 시점 - WATCH_LOOKBACK_HOURS)"""
+    from src.pipeline.watcher import PollingChangeSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, 'watch_state.json')
+
+        # 첫 실행: 기준 시점이 없으면 가장 최근 날짜만 조회하고 재조회 범위 없음
+        db = _RecordingDB()
+        source = PollingChangeSource(SimpleNamespace(db=db), state_path=state_path, lookback_hours=2)
+        source.poll()
+        query, params = db.queries[-1]
+        assert 'MAX(statistics_date)' in query and not params
+        print("✓ 첫 실행은 가장 최근 날짜만 조회")
+
+        # 자정 직후 기준 시점에서 2시간 앞당기면 전날 23시 이후부터 다시 조회
+        source.commit([
+            {'object_id': 'park', 'statistics_date': date(2026, 10, 19), 'hour': 1},
+            {'object_id': 'garden', 'statistics_date': date(2026, 10, 19), 'hour': 5},
+        ])
+        reloaded = PollingChangeSource(SimpleNamespace(db=db), state_path=state_path, lookback_hours=2)
+        assert reloaded.object_marks == {'park': (date(2026, 10, 19), 1), 'garden': (date(2026, 10, 19), 5)}
+        assert reloaded.high_water_mark == (date(2026, 10, 19), 5)
+        print(f"✓ 기준 시점 저장/로드: {reloaded.object_marks}")
+
+        reloaded.poll()
+        _, params = db.queries[-1]
+        marks = {params[f'mark_object_{i}']: (params[f'mark_{i}_date'], params[f'mark_{i}_hour']) for i in range(2)}
+        assert marks == {'garden': ('2026-10-19', 3), 'park': ('2026-10-18', 23)}, marks
+        assert (params['after_date'], params['after_hour']) == ('2026-10-19', 3)
+        print(f"✓ 객체별 재조회 시작 시점: {marks}")
+
+        # 이전 시점으로의 commit은 기준 시점을 되돌리지 않음
+        reloaded.commit([{'object_id': 'garden', 'statistics_date': date(2026, 10, 19), 'hour': 4}])
+        assert reloaded.object_marks['garden'] == (date(2026, 10, 19), 5)
+        print("✓ 재조회한 이전 시간은 기준 시점을 되돌리지 않음")
+
+
+TESTS = [
+    test_work_queue_lease,
+    test_work_queue_expiry,
+    test_work_queue_retry,
+    test_cron_schedule,
+    test_run_state,
+    test_polling_change_source_lookback,
+]
+
+
+if __name__ == "__main__":
+    import sys
+    import traceback
+
+    print("\n🗂️ 파이프라인 상태 관리 테스트")
+
+    selected = [test for test in TESTS if len(sys.argv) <= 1 or test.__name__ in sys.argv[1:]]
+    failed = []
+    for test in selected:
+        print("\n" + "=" * 70)
+        print(test.__doc__)
+        print("=" * 70)
+        try:
+            test()
+        except Exception as e:
+            failed.append(test.__name__)
+            print(f"✗ 실패: {e}")
+            traceback.print_exc()
+
+    print("\n" + "=" * 70)
+    print(f"결과: {len(selected) - len(failed)}/{len(selected)} 통과")
+    if failed:
+        print(f"실패: {', '.join(failed)}")
+    sys.exit(1 if failed else 0)